@@ -0,0 +1,218 @@
+"""
+청크 분할기 벤치마크: BlockChunker(native) vs RecursiveCharacterTextSplitter(langchain)
+
+PDF를 페이지 분석까지 마친 블록 리스트를 말뭉치로 두 청커의 분할 시간(페이지 범위 계산 포함)과
+청크 품질 지표를 비교한다.
+- 말뭉치: --pdf-dir의 PDF, 없으면 benchmarks.synthetic_pdf 합성 RFP PDF
+- 품질 지표: 청크 수, 평균/최대 길이, chunk_size 초과 청크(표가 없는 청크는 따로), 나뉜 표,
+  제목(레벨 1~2) 앞에서 끊기지 않은 청크
+- native 청커는 임의 블록 열(제목/본문/표, 긴 제목과 구분자 없는 긴 본문 포함)로도 검사한다:
+  표가 없는 청크가 chunk_size를 넘거나 청크 오프셋이 전체 텍스트와 맞지 않으면 exit code 1
+- langchain 모듈 import 시간은 새 프로세스에서 따로 잰다.
+- native가 --min-speedup 배 이상 빠르지 않으면 exit code 1
+
+사용법:
+    python -m benchmarks.bench_chunking
+    python -m benchmarks.bench_chunking --pdf-dir /home/shared_rag --chunk-size 500 --chunk-overlap 50
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from benchmarks.synthetic_pdf import make_rfp_pdf
+
+
+def load_blocks(pdf_paths):
+    """PDF별 페이지 분석 결과 블록 리스트 (Unstructured 제외)"""
+    import fitz, pdfplumber
+    from pdf_parser.page_parser import parse_pages
+
+    corpus = []
+    for pdf_path in pdf_paths:
+        doc_fitz, doc_plumber = fitz.open(pdf_path), pdfplumber.open(pdf_path)
+        try:
+            results = parse_pages(pdf_path.name, doc_fitz, doc_plumber, range(len(doc_fitz)))
+        finally:
+            doc_fitz.close()
+            doc_plumber.close()
+        corpus.append((pdf_path.name, [b for r in results for b in r.blocks]))
+    return corpus
+
+
+def chunk_quality(blocks, chunks, chunk_size, separator="\n\n"):
+    """청크 품질 지표 (청크 오프셋은 separator.join(블록 content) 기준)"""
+    starts, offset = [], 0
+    for b in blocks:
+        starts.append(offset)
+        offset += len(b["content"]) + len(separator)
+    split_tables = 0
+    for i, b in enumerate(blocks):
+        if b.get("type") != "table":
+            continue
+        end = starts[i] + len(b["content"])
+        if not any(c.char_start <= starts[i] and c.char_end >= end for c in chunks):
+            split_tables += 1
+    # 레벨 1~2 제목이 청크 중간에 있으면 앞 절의 내용과 섞인 것
+    title_starts = [starts[i] for i, b in enumerate(blocks)
+                    if b.get("type") == "title" and (b.get("level") or 3) <= 2]
+    mixed_sections = sum(1 for c in chunks
+                         if any(c.char_start < s < c.char_end and c.content[:s - c.char_start].strip()
+                                and not _only_titles(blocks, starts, c.char_start, s) for s in title_starts))
+    lengths = [len(c.content) for c in chunks]
+    # 표는 나누지 않으므로 chunk_size를 넘어도 되지만, 표가 없는 청크는 넘으면 안 된다
+    table_spans = [(starts[i], starts[i] + len(b["content"])) for i, b in enumerate(blocks) if b.get("type") == "table"]
+    oversized_non_table = sum(1 for c in chunks if len(c.content) > chunk_size
+                              and not any(c.char_start < e and s < c.char_end for s, e in table_spans))
+    return {
+        "chunks": len(chunks),
+        "mean_chars": round(sum(lengths) / len(lengths), 1) if lengths else 0,
+        "max_chars": max(lengths, default=0),
+        "oversized": sum(1 for n in lengths if n > chunk_size),
+        "oversized_non_table": oversized_non_table,
+        "split_tables": split_tables,
+        "mixed_sections": mixed_sections,
+    }
+
+
+def _only_titles(blocks, starts, start, end):
+    """[start, end) 구간이 제목 블록으로만 이루어졌는지 (연속 제목은 섞인 것으로 보지 않음)"""
+    return all(b.get("type") == "title" for s, b in zip(starts, blocks)
+               if start <= s < end or s <= start < s + len(b["content"]))
+
+
+def random_blocks(rng, words=("사업", "수행", "시스템", "데이터", "보안", "품질", "관리", "요구사항")):
+    """제목(chunk_size보다 긴 제목 포함)/본문(구분자가 드문 긴 본문 포함)/표를 섞은 임의 블록 열"""
+    def text(n):
+        parts = []
+        while sum(map(len, parts)) < n:
+            r = rng.random()
+            parts.append(rng.choice(words) + (". " if r < 0.1 else "\n" if r < 0.15 else " " if r < 0.9 else ""))
+        return "".join(parts)[:n]
+
+    blocks = []
+    for _ in range(rng.randint(1, 12)):
+        r = rng.random()
+        if r < 0.3:
+            prefix = rng.choice(["Ⅰ. ", "1.1 ", "가. ", ""])
+            blocks.append({"type": "title", "content": prefix + text(rng.randint(3, 120)), "page": 1})
+        elif r < 0.4:
+            blocks.append({"type": "table", "content": text(rng.randint(10, 1500)), "page": 1})
+        else:
+            blocks.append({"type": "text", "content": text(rng.choice([rng.randint(1, 300), rng.randint(300, 3000)])),
+                           "page": 1})
+    return blocks
+
+
+def check_native_limits(seeds):
+    """
+    임의 블록 열로 BlockChunker 검사, 반환값: {"oversized_non_table", "offset_mismatch"}
+    - 청크 끝에 남은 제목이 다음 블록과 합쳐져 chunk_size를 넘는 경우 등
+    """
+    from pdf_parser.utils.chunking import BlockChunker
+    result = {"cases": seeds, "oversized_non_table": 0, "offset_mismatch": 0}
+    for seed in range(seeds):
+        rng = random.Random(seed)
+        chunk_size = rng.choice([100, 300, 1000])
+        chunk_overlap = rng.choice([0, chunk_size // 10, chunk_size // 5])
+        blocks = random_blocks(rng)
+        full_text = "\n\n".join(b["content"] for b in blocks)
+        for c in BlockChunker(chunk_size, chunk_overlap).split(blocks):
+            if full_text[c.char_start:c.char_end] != c.content:
+                result["offset_mismatch"] += 1
+            if len(c.content) > chunk_size and not any(blocks[i]["type"] == "table" for i in c.block_ids):
+                result["oversized_non_table"] += 1
+    return result
+
+
+def run_chunker(converter, blocks):
+    chunker = converter._make_chunker()
+    chunks = [c for b in blocks for c in chunker.add(b)]
+    chunks.extend(chunker.finish())
+    return chunks
+
+
+def time_chunker(converter, corpus, repeat):
+    """말뭉치 전체 분할 시간 (repeat회 중 최솟값)과 문서별 청크"""
+    best, outputs = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        outputs = [run_chunker(converter, blocks) for _, blocks in corpus]
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outputs
+
+
+def langchain_import_sec():
+    """새 프로세스에서 langchain.text_splitter import 시간"""
+    code = ("import time; t = time.perf_counter(); import langchain.text_splitter; "
+            "print(time.perf_counter() - t)")
+    try:
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        return round(float(result.stdout.strip()), 4)
+    except (subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="청크 분할기 벤치마크 (native vs langchain)")
+    parser.add_argument('--pdf-dir', default=None, help="말뭉치 PDF 디렉토리 (기본값: 합성 RFP PDF)")
+    parser.add_argument('--pages', type=int, default=200, help="합성 PDF 페이지 수 (기본값: 200)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--chunk-overlap', type=int, default=150)
+    parser.add_argument('--repeat', type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument('--random-cases', type=int, default=2000, help="native 청커 임의 블록 검사 횟수 (기본값: 2000)")
+    parser.add_argument('--min-speedup', type=float, default=1.0,
+                        help="native가 langchain보다 이 배수 이상 빠르지 않으면 exit code 1 (기본값: 1.0)")
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.WARNING)
+    from pdf_parser.converter import PDFConverter
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.pdf_dir:
+            pdf_paths = sorted(Path(args.pdf_dir).glob("*.pdf"))
+        else:
+            pdf_paths = [Path(tmp_dir) / f"rfp_{args.pages}p_seed{args.seed}.pdf"]
+            make_rfp_pdf(pdf_paths[0], args.pages, args.seed)
+        print(f"⏱ 말뭉치 분석 중... ({len(pdf_paths)}개 PDF)", file=sys.stderr)
+        corpus = load_blocks(pdf_paths)
+
+    results = {"documents": len(corpus), "blocks": sum(len(blocks) for _, blocks in corpus),
+               "chars": sum(len(b["content"]) for _, blocks in corpus for b in blocks),
+               "chunk_size": args.chunk_size, "chunk_overlap": args.chunk_overlap,
+               "langchain_import_sec": langchain_import_sec()}
+    for name in ("langchain", "native"):
+        converter = PDFConverter(input_dir="", chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap,
+                                 chunker=name)
+        run_chunker(converter, corpus[0][1])  # 첫 호출(import, 캐시) 제외
+        elapsed, outputs = time_chunker(converter, corpus, max(1, args.repeat))
+        quality = [chunk_quality(blocks, chunks, args.chunk_size) for (_, blocks), chunks in zip(corpus, outputs)]
+        results[name] = {
+            "sec": round(elapsed, 4),
+            "chars_per_sec": round(results["chars"] / elapsed) if elapsed else None,
+            **{key: sum(q[key] for q in quality)
+               for key in ("chunks", "oversized", "oversized_non_table", "split_tables", "mixed_sections")},
+            "max_chars": max(q["max_chars"] for q in quality),
+        }
+
+    speedup = results["langchain"]["sec"] / results["native"]["sec"] if results["native"]["sec"] else float("inf")
+    results["speedup"] = round(speedup, 2)
+    results["native_random"] = check_native_limits(args.random_cases)
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    limits = results["native_random"]
+    if results["native"]["oversized_non_table"] or limits["oversized_non_table"] or limits["offset_mismatch"]:
+        print("❌ native 청커가 표가 아닌 청크를 chunk_size보다 크게 만들었거나 오프셋이 어긋났습니다")
+        sys.exit(1)
+    if speedup < args.min_speedup:
+        print(f"❌ native 청커가 langchain 대비 x{speedup:.2f} (기준 x{args.min_speedup})")
+        sys.exit(1)
+    print(f"✅ native 청커 x{speedup:.2f} 빠름")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+Markdown 헤더 변환기 검증 + 벤치마크: 현재 OptimizedMarkdownConverter vs 이전 구현(LegacyMarkdownConverter)
+
+- LegacyMarkdownConverter는 한 번의 순회/패턴 통합 이전의 구현을 그대로 옮긴 하위 클래스다.
+  (라인마다 목차 판별 2회, _is_valid_text에서 정규식 8개를 re.match로 매번 조회, 인스턴스마다 패턴 컴파일)
+- 합성 RFP Markdown(목차, 로마 숫자/계층형 숫자 헤더, 제외 패턴, 표, 연속 헤더, 무작위 라인)과
+  --md-dir의 실제 Markdown 파일에서 두 변환 결과가 바이트 단위로 같은지 확인한다. (다르면 exit code 1)
+- 연속 헤더 제거 활성/비활성 두 경우 모두 비교하고, 변환 시간과 변환기 생성 시간을 출력한다.
+
+사용법:
+    python -m benchmarks.bench_header_converter
+    python -m benchmarks.bench_header_converter --lines 20000 200000 --repeat 5 --md-dir ./data
+"""
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import contextlib
+import io
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass
+from md_processor.header_converter import OptimizedMarkdownConverter
+
+DEFAULT_LINES = [2000, 20000, 100000]
+
+
+@dataclass
+class LegacyLineInfo:
+    original: str
+    type: str
+    level: int
+    content: str
+    line_index: int
+    is_consecutive: bool = False
+    should_remove: bool = False
+
+
+class LegacyMarkdownConverter(OptimizedMarkdownConverter):
+    """이전 구현 (비교 기준)"""
+
+    def __init__(self):
+        super().__init__()
+        self.patterns = self._compile_patterns()
+
+    def _compile_patterns(self) -> Dict[str, Dict[str, re.Pattern]]:
+        return {
+            'roman': {
+                'unicode': re.compile(r'^(Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)\.?\s*(.+)'),
+                'ascii': re.compile(r'^([IVX]+)\.?\s*(.+)', re.IGNORECASE)
+            },
+            'numbered': {
+                'hierarchical': re.compile(r'^(\d+(?:\.\d+)*)\.\s*(.+)'),
+                'simple': re.compile(r'^(\d+)\s+(.+)')
+            },
+            'symbols': {
+                'square': re.compile(r'^□\s*(.+)'),
+                'note': re.compile(r'^※\s*(.+)'),
+                'circle': re.compile(r'^○\s*(.+)'),
+                'bullet': re.compile(r'^•\s*(.+)'),
+                'dash': re.compile(r'^-\s*(.+)')
+            },
+            'exclude': {
+                'parentheses': re.compile(r'^\d+\)\s*(.+)'),
+                'korean_paren': re.compile(r'^[가-힣]\)\s*(.+)'),
+                'alpha_paren': re.compile(r'^[a-zA-Z]\)\s*(.+)')
+            },
+            'cleanup': {
+                'markdown_header': re.compile(r'^#+\s*(.*)'),
+                'meaningless': re.compile(r'^[#\s]*$|^[#\s·•\-_=]*$|^[#\s]*\.\s*$')
+            },
+            'toc': {
+                'roman_toc': re.compile(r'^(Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)\.?\s*(.+?)[\s·]{2,}\s*\d+$'),
+                'numbered_toc': re.compile(r'^(\d+(?:\.\d+)*)\.\s*(.+?)[\s·]{2,}\s*\d+$'),
+                'general_toc': re.compile(r'^(.+?)[\s·]{3,}\s*\d+$'),
+                'dotted_line': re.compile(r'^[·\s]{3,}$')
+            }
+        }
+
+    def _is_toc_line(self, line: str) -> bool:
+        line = line.strip()
+        if not line or self.patterns['toc']['dotted_line'].match(line):
+            return True
+        if self.patterns['toc']['roman_toc'].match(line):
+            return True
+        if self.patterns['toc']['numbered_toc'].match(line):
+            return True
+        if self.patterns['toc']['general_toc'].match(line):
+            return True
+        return False
+
+    def _detect_toc_section(self, lines: List[str]) -> Tuple[int, int]:
+        toc_start = -1
+        toc_end = -1
+        consecutive_toc_count = 0
+        for i, line in enumerate(lines):
+            if self._is_toc_line(line):
+                if toc_start == -1:
+                    toc_start = i
+                consecutive_toc_count += 1
+                toc_end = i
+            else:
+                if consecutive_toc_count >= 3:
+                    break
+                else:
+                    toc_start = -1
+                    toc_end = -1
+                    consecutive_toc_count = 0
+        if consecutive_toc_count < 3:
+            return -1, -1
+        return toc_start, toc_end
+
+    def _is_valid_text(self, text: str) -> bool:
+        if not text or len(text.strip()) < self.min_header_length:
+            return False
+        clean_text = text.strip()
+        if len(clean_text) > self.max_header_length:
+            return False
+        meaningless_patterns = [
+            r'^[·•\-_=]{1,5}$',
+            r'^\d+\.?$',
+            r'^\[.*\].*···\s*\d+$',
+            r'^<.*>$',
+            r'^ㅇ\s',
+            r'.*\(\d{4}\.\d{1,2}\.\d{1,2}\.?기준\)',
+            r'.*···\s*\d+$',
+            r'.*[\s·]{3,}\s*\d+$'
+        ]
+        return not any(re.match(pattern, clean_text) for pattern in meaningless_patterns)
+
+    def _extract_roman_numeral(self, line: str, is_toc: Optional[bool] = None) -> Optional[Tuple[str, str]]:
+        if self._is_toc_line(line):
+            return None
+        match = self.patterns['roman']['unicode'].match(line)
+        if match:
+            return match.group(1), match.group(2).strip()
+        match = self.patterns['roman']['ascii'].match(line)
+        if match and self._is_valid_roman_numeral(match.group(1)):
+            return match.group(1), match.group(2).strip()
+        return None
+
+    def _is_valid_roman_numeral(self, text: str) -> bool:
+        valid_romans = {
+            'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
+            'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII', 'XIX', 'XX'
+        }
+        return text.upper() in valid_romans
+
+    def _classify_line_type(self, line: str, line_index: int, in_toc_section: bool = False,
+                            is_toc: Optional[bool] = None) -> LegacyLineInfo:
+        line = line.strip()
+        if not line:
+            return LegacyLineInfo('', 'empty', 0, '', line_index)
+        if in_toc_section:
+            return LegacyLineInfo(line, 'toc_content', 0, line, line_index)
+        for pattern in self.patterns['exclude'].values():
+            if pattern.match(line):
+                return LegacyLineInfo(line, 'excluded', 0, line, line_index)
+        roman_result = self._extract_roman_numeral(line)
+        if roman_result:
+            roman_num, header_text = roman_result
+            if self._is_valid_text(header_text):
+                self.has_roman_numerals = True
+                return LegacyLineInfo(line, 'roman', 1, line, line_index)
+        match = self.patterns['numbered']['hierarchical'].match(line)
+        if match:
+            number_part, header_text = match.groups()
+            if self._is_valid_text(header_text):
+                if self.has_roman_numerals:
+                    level = 2
+                else:
+                    level = 1 if number_part.count('.') == 0 else 2
+                return LegacyLineInfo(line, 'numbered', level, line, line_index)
+        match = self.patterns['numbered']['simple'].match(line)
+        if match:
+            number_part, header_text = match.groups()
+            if self._is_valid_text(header_text):
+                level = 2 if self.has_roman_numerals else 1
+                return LegacyLineInfo(line, 'numbered_simple', level, line, line_index)
+        if not self.has_roman_numerals and self._looks_like_title(line):
+            return LegacyLineInfo(line, 'title', 1, line, line_index)
+        return LegacyLineInfo(line, 'text', 0, line, line_index)
+
+    def _looks_like_title(self, line: str) -> bool:
+        if len(line) > 50:
+            return False
+        title_keywords = ['목적', '개요', '요약', '결론', '배경']
+        return any(keyword in line for keyword in title_keywords)
+
+    def _mark_consecutive_headers(self, lines: List[LegacyLineInfo]) -> List[LegacyLineInfo]:
+        if not self.enable_consecutive_header_removal:
+            return lines
+        result = []
+        consecutive_count = 0
+        for i, line_info in enumerate(lines):
+            is_header = line_info.level > 0
+            next_is_header = (i + 1 < len(lines) and lines[i + 1].level > 0)
+            if is_header:
+                consecutive_count += 1
+                should_remove = (
+                    consecutive_count >= 2 or
+                    line_info.content.strip().endswith(':') or
+                    next_is_header
+                )
+                if should_remove:
+                    clean_content = re.sub(r'^#+\s*', '', line_info.content).strip()
+                    line_info = LegacyLineInfo(
+                        original=clean_content,
+                        type='converted_text',
+                        level=0,
+                        content=clean_content,
+                        line_index=line_info.line_index,
+                        should_remove=True
+                    )
+                    consecutive_count = 0
+            else:
+                consecutive_count = 0
+            result.append(line_info)
+        return result
+
+    def convert_document(self, text: str) -> str:
+        cleaned_text = self._clean_existing_headers(text)
+        lines = cleaned_text.split('\n')
+        toc_start, toc_end = self._detect_toc_section(lines)
+        if toc_start != -1:
+            print(f"목차 섹션 감지됨: {toc_start+1}줄 ~ {toc_end+1}줄 (총 {toc_end-toc_start+1}줄)")
+        self.has_roman_numerals = False
+        analyzed_lines = []
+        for i, line in enumerate(lines):
+            in_toc = toc_start <= i <= toc_end if toc_start != -1 else False
+            line_info = self._classify_line_type(line, i, in_toc)
+            analyzed_lines.append(line_info)
+        processed_lines = self._mark_consecutive_headers(analyzed_lines)
+        return self._lines_to_markdown(processed_lines)
+
+    def _lines_to_markdown(self, lines: List[LegacyLineInfo]) -> str:
+        converted_lines = []
+        removed_count = 0
+        toc_lines_removed = 0
+        for line_info in lines:
+            if line_info.type == 'toc_content':
+                converted_lines.append(line_info.original)
+                toc_lines_removed += 1
+            elif line_info.level > 0:
+                header = '#' * line_info.level
+                converted_lines.append(f"{header} {line_info.content}")
+            elif line_info.should_remove:
+                converted_lines.append(line_info.original)
+                removed_count += 1
+            else:
+                converted_lines.append(line_info.original)
+        final_lines = self._clean_empty_lines(converted_lines)
+        if toc_lines_removed > 0:
+            print(f"목차 처리: {toc_lines_removed}개 라인을 일반 텍스트로 유지")
+        if removed_count > 0:
+            print(f"연속 헤더 제거: {removed_count}개 헤더를 본문으로 변환")
+        return '\n'.join(final_lines)
+
+
+# ---------------------------------------------------------------------------
+# 합성 Markdown
+# ---------------------------------------------------------------------------
+_ROMANS = "ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ"
+_WORDS = ["사업", "개요", "추진", "배경", "목적", "요구사항", "보안", "데이터", "시스템", "구축", "운영", "결론",
+          "요약", "제안", "평가", "기준", "일정", "예산", "인력", "관리", "Intro", "Xenon", "vision", "ıdea"]
+_TOKENS = ["·", "··", "···", " ", "  ", "\t", "#", "##", ":", ".", "-", "•", "□", "○", "※", "ㅇ", "<", ">",
+           "(", ")", "[", "]", "1", "12", "3.4", "IV", "ix", "Ⅱ", "가", "a", "|", "2024.1.1기준", "　"]
+
+
+def _sentence(rng, words=None):
+    return " ".join(rng.choice(_WORDS) for _ in range(words or rng.randint(2, 8)))
+
+
+def make_markdown(lines, seed=0, toc=True, romans=True):
+    """결정적 합성 RFP Markdown (MinerU 출력과 비슷한 라인 구성 + 무작위 토큰 조합 라인)"""
+    rng = random.Random(seed)
+    out = []
+    if rng.random() < 0.5:
+        out += ["", "", ""]
+    if toc:
+        out += ["# 목 차", ""]
+        for i in range(rng.randint(3, 15)):
+            dots = rng.choice(["·" * rng.randint(2, 30), " " * rng.randint(2, 6), " ··· "])
+            if romans and rng.random() < 0.4:
+                out.append(f"{_ROMANS[i % 10]}. {_sentence(rng, 2)}{dots}{rng.randint(1, 99)}")
+            else:
+                out.append(f"{i + 1}.{rng.randint(1, 5)}. {_sentence(rng, 3)}{dots}{rng.randint(1, 99)}")
+            if rng.random() < 0.1:
+                out.append("·" * rng.randint(3, 20))
+    section = 0
+    while len(out) < lines:
+        kind = rng.random()
+        if kind < 0.05 and romans:
+            section += 1
+            out.append(f"{rng.choice(['# ', '', '## '])}{_ROMANS[section % 10]}{rng.choice(['.', '', '. '])} {_sentence(rng, 2)}")
+        elif kind < 0.15:
+            depth = ".".join(str(rng.randint(1, 9)) for _ in range(rng.randint(1, 3)))
+            tail = rng.choice(["", ":", " (2023.10.1기준)", " ··· 12", "   7"])
+            out.append(f"{rng.choice(['# ', '', '### '])}{depth}. {_sentence(rng, rng.randint(1, 12))}{tail}")
+        elif kind < 0.2:
+            out.append(f"{rng.randint(1, 20)} {_sentence(rng, rng.randint(1, 4))}")
+        elif kind < 0.25:
+            out.append(f"{rng.choice(['1)', '가)', 'a)', 'B)', '12)'])} {_sentence(rng)}")
+        elif kind < 0.3:
+            out.append(f"{rng.choice(['□', '○', '•', '-', '※', 'ㅇ'])} {_sentence(rng)}")
+        elif kind < 0.35:
+            out.append(f"| {_sentence(rng, 2)} | {rng.randint(1, 999)} | {_sentence(rng, 3)} |")
+        elif kind < 0.4:
+            out.append(rng.choice(["", "", "#", "   ", "---", "<표 1>", "1.", "·····"]))
+        elif kind < 0.45:
+            out.append(f"{rng.choice(['I', 'II', 'iv', 'X', 'XX', 'ı'])}{rng.choice(['. ', ' ', '.'])}{_sentence(rng, 2)}")
+        elif kind < 0.55:
+            # 무작위 토큰 조합 (경계 조건)
+            out.append("".join(rng.choice(_TOKENS + _WORDS) for _ in range(rng.randint(1, 8))))
+        elif kind < 0.6:
+            out.append(_sentence(rng, 60))
+        else:
+            out.append(_sentence(rng) + rng.choice([".", " 한다.", "", ":"]))
+    return "\n".join(out[:lines])
+
+
+def convert(converter_class, text, remove_consecutive):
+    converter = converter_class()
+    converter.enable_consecutive_header_removal = remove_consecutive
+    with contextlib.redirect_stdout(io.StringIO()) as log:
+        t0 = time.perf_counter()
+        output = converter.convert_document(text)
+        elapsed = time.perf_counter() - t0
+    return output, elapsed, log.getvalue()
+
+
+def compare(text, name, repeat, failures):
+    """두 변환기 결과 비교 + 시간 측정 (연속 헤더 제거 활성화 기준)"""
+    for remove_consecutive in (True, False):
+        legacy, _, legacy_log = convert(LegacyMarkdownConverter, text, remove_consecutive)
+        current, _, current_log = convert(OptimizedMarkdownConverter, text, remove_consecutive)
+        if legacy.encode("utf-8") != current.encode("utf-8") or legacy_log != current_log:
+            a, b = legacy.split("\n"), current.split("\n")
+            index = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+            detail = f"{index + 1}번째 줄: {a[index]!r} != {b[index]!r}" if index < min(len(a), len(b)) else "로그/길이 다름"
+            failures.append(f"{name} (연속 헤더 제거={remove_consecutive}): {detail}")
+    legacy_sec = min(convert(LegacyMarkdownConverter, text, True)[1] for _ in range(repeat))
+    current_sec = min(convert(OptimizedMarkdownConverter, text, True)[1] for _ in range(repeat))
+    return {"name": name, "lines": text.count("\n") + 1, "bytes": len(text.encode("utf-8")),
+            "legacy_sec": round(legacy_sec, 4), "current_sec": round(current_sec, 4),
+            "speedup": round(legacy_sec / current_sec, 2) if current_sec else None}
+
+
+def construction_us(converter_class, count=2000):
+    t0 = time.perf_counter()
+    for _ in range(count):
+        converter_class()
+    return round((time.perf_counter() - t0) / count * 1e6, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown 헤더 변환기 검증 + 벤치마크 (현재 vs 이전 구현)")
+    parser.add_argument('--lines', type=int, nargs='+', default=DEFAULT_LINES, help="합성 Markdown 라인 수 목록")
+    parser.add_argument('--seeds', type=int, default=30, help="정확도 비교용 작은 합성 문서 수 (기본값: 30)")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument('--md-dir', default=None, help="추가로 비교할 실제 Markdown 디렉토리 (하위 폴더 포함)")
+    args = parser.parse_args()
+    repeat = max(1, args.repeat)
+
+    failures = []
+    # 다양한 구성의 작은 문서로 정확도 확인
+    for seed in range(args.seeds):
+        text = make_markdown(300, seed, toc=seed % 3 != 0, romans=seed % 4 != 0)
+        for remove_consecutive in (True, False):
+            legacy = convert(LegacyMarkdownConverter, text, remove_consecutive)
+            current = convert(OptimizedMarkdownConverter, text, remove_consecutive)
+            if legacy[0] != current[0] or legacy[2] != current[2]:
+                failures.append(f"seed {seed} (연속 헤더 제거={remove_consecutive}) 결과 다름")
+
+    documents = [compare(make_markdown(lines, seed=lines), f"synthetic_{lines}", repeat, failures)
+                 for lines in args.lines]
+    if args.md_dir:
+        for md_path in sorted(Path(args.md_dir).rglob("*.md")):
+            text = md_path.read_text(encoding="utf-8", errors="ignore")
+            documents.append(compare(text, str(md_path), 1, failures))
+
+    report = {
+        "construction_us": {"legacy": construction_us(LegacyMarkdownConverter),
+                            "current": construction_us(OptimizedMarkdownConverter)},
+        "documents": documents,
+        "failures": failures,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if failures:
+        print("❌ 변환 결과가 이전 구현과 다릅니다")
+        sys.exit(1)
+    print("✅ 변환 결과가 이전 구현과 바이트 단위로 같습니다")
+
+if __name__ == "__main__":
+    main()
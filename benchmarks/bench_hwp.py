@@ -0,0 +1,144 @@
+"""
+HWP 본문 추출 검증 + 벤치마크: hwp_parser(olefile 스트리밍) vs langchain_teddynote HWPLoader
+
+1) 정확도: benchmarks.synthetic_hwp로 만든 HWP(압축/비압축, 여러 섹션, 긴 문단, 표, 컨트롤 문자)에서
+   hwp_parser.iter_paragraphs 결과가 기대 문단과 정확히 같은지 확인한다. (다르면 exit code 1)
+2) 성능: 문서마다 새 프로세스(spawn)에서 추출 시간과 tracemalloc 최대 할당량을 잰다.
+   - native: 문단을 하나씩 받아 글자 수만 세는 스트리밍 사용
+   - hwploader: HWPLoader(path).load() (langchain_teddynote 미설치 시 생략)
+   - HWPLoader는 확장 크기(4095바이트 이상) 레코드를 읽지 못하므로 비교용 문서에는 긴 문단을 넣지 않는다.
+   - 두 결과의 한글 글자 수가 같은지도 함께 출력한다. (HWPLoader는 컨트롤 부가 데이터를 남기고 한자를 지움)
+- --hwp-dir을 주면 합성 문서 대신 실제 HWP 파일로 성능/한글 글자 수만 비교한다.
+
+사용법:
+    python -m benchmarks.bench_hwp
+    python -m benchmarks.bench_hwp --sizes 1000 20000 --repeat 5
+    python -m benchmarks.bench_hwp --hwp-dir /home/shared_rag
+"""
+import re
+import sys
+import json
+import time
+import argparse
+import tempfile
+import importlib.util
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.synthetic_hwp import make_rfp_hwp
+
+DEFAULT_SIZES = [500, 5000, 20000]
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def check_correctness(tmp_dir, seed):
+    """합성 문서 구성별로 iter_paragraphs 결과와 기대 문단 비교, 반환값: 실패한 구성 이름 리스트"""
+    from hwp_parser import iter_paragraphs
+
+    failures = []
+    cases = {
+        "compressed": {},
+        "uncompressed": {"compressed": False},
+        "multi_section": {"section_paragraphs": 50},
+        "no_long_paragraphs": {"long_paragraphs": False},
+    }
+    for name, options in cases.items():
+        path = Path(tmp_dir) / f"check_{name}.hwp"
+        expected = make_rfp_hwp(path, 300, seed, **options)
+        got = list(iter_paragraphs(path))
+        if got != expected:
+            index = next((i for i, (a, b) in enumerate(zip(got, expected)) if a != b), min(len(got), len(expected)))
+            print(f"❌ {name}: {index}번째 문단부터 다름 (추출 {len(got)}개 / 기대 {len(expected)}개)")
+            failures.append(name)
+    return failures
+
+
+def _extract(method, path):
+    """
+    프로세스 풀 워커: (추출 시간, 글자 수, 한글 글자 수) - method: native / hwploader
+    """
+    if method == "native":
+        from hwp_parser import iter_paragraphs
+        t0 = time.perf_counter()
+        chars = sum(len(paragraph) for paragraph in iter_paragraphs(path))
+        elapsed = time.perf_counter() - t0
+        # 한글 글자 수는 측정 시간에서 제외하고 한 번 더 읽어서 센다
+        hangul = sum(len(_HANGUL.findall(paragraph)) for paragraph in iter_paragraphs(path))
+        return elapsed, chars, hangul
+    from langchain_teddynote.document_loaders import HWPLoader
+    t0 = time.perf_counter()
+    text = HWPLoader(str(path)).load()[0].page_content
+    elapsed = time.perf_counter() - t0
+    return elapsed, len(text), len(_HANGUL.findall(text))
+
+
+def _peak_alloc(method, path):
+    """프로세스 풀 워커: 추출 중 tracemalloc 최대 할당량(MB)"""
+    import tracemalloc
+    if method == "hwploader":
+        from langchain_teddynote.document_loaders import HWPLoader  # import 자체의 할당은 제외
+    tracemalloc.start()
+    _extract(method, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return round(peak / (1024 * 1024), 2)
+
+
+def bench_file(path, methods, repeat):
+    result = {"name": Path(path).name, "bytes": Path(path).stat().st_size}
+    # spawn: 이전 측정의 메모리/import 상태를 물려받지 않는다
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        for method in methods:
+            try:
+                runs = [executor.submit(_extract, method, str(path)).result() for _ in range(repeat)]
+                peak = executor.submit(_peak_alloc, method, str(path)).result()
+            except Exception as e:
+                result[method] = {"error": f"{type(e).__name__}: {e}"}
+                continue
+            elapsed, chars, hangul = min(runs)
+            result[method] = {"sec": round(elapsed, 4), "chars": chars, "hangul_chars": hangul, "peak_alloc_mb": peak}
+    native, loader = result.get("native", {}), result.get("hwploader", {})
+    if "sec" in native and "sec" in loader:
+        result["speedup"] = round(loader["sec"] / native["sec"], 2) if native["sec"] else None
+        result["hangul_chars_equal"] = native["hangul_chars"] == loader["hangul_chars"]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HWP 본문 추출 검증 + 벤치마크 (hwp_parser vs HWPLoader)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="합성 HWP 문단 수 목록 (기본값: 500 5000 20000)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help="반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument('--hwp-dir', default=None, help="합성 문서 대신 사용할 HWP 디렉토리")
+    args = parser.parse_args()
+
+    methods = ["native"]
+    if importlib.util.find_spec("langchain_teddynote") is not None:
+        methods.append("hwploader")
+    else:
+        print("⚠️ langchain_teddynote 미설치: HWPLoader 비교 생략", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        failures = [] if args.hwp_dir else check_correctness(tmp_dir, args.seed)
+        if args.hwp_dir:
+            paths = sorted(Path(args.hwp_dir).glob("*.hwp"))
+        else:
+            paths = []
+            for size in args.sizes:
+                path = Path(tmp_dir) / f"rfp_{size}p_seed{args.seed}.hwp"
+                make_rfp_hwp(path, size, args.seed, section_paragraphs=None, long_paragraphs=False)
+                paths.append(path)
+        documents = []
+        for path in paths:
+            print(f"⏱ {path.name} 측정 중...", file=sys.stderr)
+            documents.append(bench_file(path, methods, max(1, args.repeat)))
+
+    print(json.dumps({"correctness_failures": failures, "documents": documents}, ensure_ascii=False, indent=2))
+    if failures:
+        sys.exit(1)
+    if not args.hwp_dir:
+        print("✅ 합성 HWP 문단 추출 결과가 기대값과 같습니다")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Markdown 디렉토리 일괄 정제 벤치마크 + 검증
+(md_processor.pipeline.process_directory / OptimizedMarkdownConverter.process_directory_recursive)
+
+1) 정확도 (다르면 exit code 1)
+   - 파일별 process_md_file 결과와 process_directory(workers=1, N) 결과가 바이트 단위로 같은지
+   - 다시 실행하면 모두 건너뛰는지, mtime만 바뀐 파일은 건너뛰고 내용이 바뀐 파일/지워진 출력만 다시 정제하는지
+   - 인플레이스(입력=출력) 처리에서 이미 정제된 파일을 다시 정제하지 않는지
+   - 실패한 파일은 요약에 모이고 다음 실행에서 다시 시도되는지
+   - process_directory_recursive의 _cleaned_2.md도 workers와 무관하게 같고 재실행 시 건너뛰는지
+2) 성능: 파일별 출력(기존 방식) / 진행 상황 집계 출력 / 병렬 / 재실행 시간과 출력 라인 수
+
+사용법:
+    python -m benchmarks.bench_md_directory
+    python -m benchmarks.bench_md_directory --files 2000 --lines 200 --workers 8
+"""
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+from benchmarks.bench_header_converter import make_markdown
+from md_processor.pipeline import process_md_file, process_directory
+from md_processor.header_converter import OptimizedMarkdownConverter
+
+
+def make_tree(root, files, lines):
+    """하위 디렉토리 여러 개에 합성 Markdown 생성 (일부는 NULL Byte 포함), 반환값: 입력 파일 목록"""
+    paths = []
+    for i in range(files):
+        path = Path(root) / f"group_{i % 7}" / f"doc_{i:05d}" / "auto" / f"doc_{i:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = make_markdown(lines, seed=i)
+        if i % 5 == 0:
+            text = text.replace("\n\n", "\n\x00\n", 3)
+        path.write_text(text + "\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def run_quiet(func, *args, **kwargs):
+    """표준 출력을 버퍼에 모아 (반환값, 걸린 시간, 출력 라인 수)"""
+    buffer = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        result = func(*args, **kwargs)
+    return result, round(time.perf_counter() - started, 3), buffer.getvalue().count("\n")
+
+
+def per_file(input_dir, output_dir):
+    """기존 방식: 파일마다 process_md_file (단계별 출력 포함)"""
+    for md_file in sorted(Path(input_dir).rglob("*.md")):
+        output_path = Path(output_dir) / md_file.relative_to(input_dir)
+        process_md_file(str(md_file), str(output_path))
+
+
+def read_tree(root, pattern="*.md"):
+    return {path.relative_to(root).as_posix(): path.read_bytes()
+            for path in sorted(Path(root).rglob(pattern)) if path.is_file()}
+
+
+def expect(failures, name, summary, **expected):
+    actual = {key: summary[key] for key in expected} if summary else None
+    if actual != expected:
+        failures.append(f"{name}: {actual} (기대값 {expected})")
+
+
+def check_pipeline(tmp, inputs, args, failures, report):
+    input_dir = tmp / "input"
+    _, report["per_file_sec"], report["per_file_output_lines"] = run_quiet(per_file, input_dir, tmp / "expected")
+    expected = read_tree(tmp / "expected")
+
+    for workers in sorted({1, args.workers}):
+        output_dir = tmp / f"out_{workers}"
+        summary, elapsed, printed = run_quiet(process_directory, str(input_dir), str(output_dir), workers=workers)
+        report[f"workers_{workers}"] = {"sec": elapsed, "output_lines": printed}
+        expect(failures, f"workers={workers}", summary, processed=len(inputs), skipped=0, failed=0)
+        if read_tree(output_dir) != expected:
+            failures.append(f"workers={workers}: 파일별 처리 결과와 다름")
+
+    output_dir = tmp / f"out_{args.workers}"
+    summary, report["rerun_sec"], _ = run_quiet(process_directory, str(input_dir), str(output_dir),
+                                                workers=args.workers)
+    expect(failures, "재실행", summary, processed=0, skipped=len(inputs))
+
+    # mtime만 바뀐 파일은 해시가 같으므로 건너뜀, 내용이 바뀐 파일과 출력이 지워진 파일만 다시 정제
+    os.utime(inputs[0])
+    inputs[1].write_text(make_markdown(args.lines, seed=10 ** 6) + "\n", encoding="utf-8")
+    (output_dir / inputs[2].relative_to(input_dir)).unlink()
+    summary, _, _ = run_quiet(process_directory, str(input_dir), str(output_dir), workers=args.workers)
+    expect(failures, "변경 후 재실행", summary, processed=2, skipped=len(inputs) - 2)
+    summary, _, _ = run_quiet(process_directory, str(input_dir), str(output_dir), workers=args.workers, incremental=False)
+    expect(failures, "incremental=False", summary, processed=len(inputs), skipped=0)
+
+    # 실패한 파일은 매니페스트에 기록하지 않으므로 다음 실행에서 다시 시도
+    broken = input_dir / "broken" / "broken.md"
+    broken.mkdir(parents=True)
+    summary, _, _ = run_quiet(process_directory, str(input_dir), str(output_dir), workers=args.workers)
+    expect(failures, "실패 파일", summary, processed=0, failed=1)
+    summary, _, _ = run_quiet(process_directory, str(input_dir), str(output_dir), workers=args.workers)
+    expect(failures, "실패 파일 재시도", summary, processed=0, failed=1)
+    broken.rmdir()
+
+
+def check_in_place(tmp, inputs, args, failures):
+    """pdf_to_md_pipeline --no-pipeline처럼 입력 디렉토리에 덮어쓰기"""
+    in_place = tmp / "in_place"
+    shutil.copytree(tmp / "input", in_place)
+    summary, _, _ = run_quiet(process_directory, str(in_place), str(in_place), workers=args.workers)
+    expect(failures, "인플레이스", summary, processed=len(inputs), skipped=0)
+    if read_tree(in_place) != read_tree(tmp / f"out_{args.workers}"):
+        failures.append("인플레이스: 결과가 다름")
+    cleaned = read_tree(in_place)
+    summary, _, _ = run_quiet(process_directory, str(in_place), str(in_place), workers=args.workers)
+    expect(failures, "인플레이스 재실행", summary, processed=0, skipped=len(inputs))
+    if read_tree(in_place) != cleaned:
+        failures.append("인플레이스 재실행: 정제된 파일이 다시 바뀜")
+    # MinerU가 같은 경로에 원본을 다시 쓴 경우
+    shutil.copyfile(inputs[3], in_place / inputs[3].relative_to(tmp / "input"))
+    summary, _, _ = run_quiet(process_directory, str(in_place), str(in_place), workers=args.workers)
+    expect(failures, "인플레이스 원본 갱신", summary, processed=1, skipped=len(inputs) - 1)
+
+
+def check_recursive(tmp, inputs, args, failures, report):
+    trees = {}
+    for workers in sorted({1, args.workers}):
+        root = tmp / f"recursive_{workers}"
+        shutil.copytree(tmp / "input", root)
+        converter = OptimizedMarkdownConverter()
+        summary, elapsed, _ = run_quiet(converter.process_directory_recursive, str(root), workers=workers)
+        report[f"recursive_workers_{workers}"] = {"sec": elapsed}
+        expect(failures, f"recursive workers={workers}", summary, processed=len(inputs), failed=0)
+        trees[workers] = read_tree(root, "*_cleaned_2.md")
+        summary, _, _ = run_quiet(converter.process_directory_recursive, str(root), workers=workers)
+        expect(failures, f"recursive workers={workers} 재실행", summary, processed=0, skipped=len(inputs))
+    if len(trees[1]) != len(inputs) or trees[1] != trees[args.workers]:
+        failures.append("recursive: workers에 따라 결과가 다름")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown 디렉토리 일괄 정제 벤치마크 + 검증")
+    parser.add_argument('--files', type=int, default=600, help="합성 Markdown 파일 수 (기본값: 600)")
+    parser.add_argument('--lines', type=int, default=300, help="파일당 라인 수 (기본값: 300)")
+    parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1), help="병렬 프로세스 수")
+    args = parser.parse_args()
+
+    failures = []
+    report = {"files": args.files, "lines": args.lines, "workers": args.workers}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        inputs = make_tree(tmp / "input", args.files, args.lines)
+        check_pipeline(tmp, inputs, args, failures, report)
+        check_in_place(tmp, inputs, args, failures)
+        check_recursive(tmp, inputs, args, failures, report)
+
+    report["failures"] = failures
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if failures:
+        print("❌ 디렉토리 일괄 정제 검증 실패")
+        sys.exit(1)
+    print("✅ 병렬/증분 정제 결과가 파일별 처리와 같습니다")
+
+if __name__ == "__main__":
+    main()
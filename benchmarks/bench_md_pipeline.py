@@ -0,0 +1,191 @@
+"""
+PDF → Markdown 파이프라인 벤치마크: 단계별 배리어(--no-pipeline) vs 문서 단위 파이프라인
+(benchmarks.fake_mineru 사용, 실제 mineru/GPU 불필요)
+
+- 첫 문서 정제 완료까지 걸린 시간과 전체 시간을 비교한다.
+- 정확도 (다르면 exit code 1)
+  - 두 방식의 정제 결과(<이름>/auto/<이름>.md)가 같은지
+  - 파이프라인 방식의 _original_mineru 백업 저장소에서 복원한 파일이 정제 전 MinerU 출력 그대로인지
+  - 같은 출력 디렉토리로 다시 실행하면 백업 객체를 새로 쓰지 않는지, verify가 손상된 객체를 찾는지
+  - 배압: --queue-size 1에 정제를 --clean-delay초씩 늦추면 mineru 실행 시작이 정제 속도에 맞춰 늦춰지는지
+    (k번째 실행은 앞선 문서 중 동시 실행 수 + 큐 크기를 뺀 만큼의 정제가 끝나야 시작할 수 있다)
+
+사용법:
+    python -m benchmarks.bench_md_pipeline
+    python -m benchmarks.bench_md_pipeline --pdfs 24 --md-kb 512 --batch-size 4 --max-jobs 2 --queue-size 2
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+import md_processor.pipeline
+import pdf_to_md_pipeline
+from layout_parser.mineru_scheduler import MINERU_CMD_ENV
+from benchmarks.fake_mineru import fake_markdown
+from md_processor.backup_store import BackupStore
+
+
+@contextlib.contextmanager
+def track_cleaning(started, done_times, delay=0):
+    """
+    문서 정제 완료 시각 기록 (두 방식 모두 md_processor.pipeline._clean_md_file을 거친다)
+    - delay초만큼 정제를 늦춰 느린 소비자를 흉내 낼 수 있다 (clean_workers=1이면 같은 프로세스에서 실행)
+    """
+    original = md_processor.pipeline._clean_md_file
+
+    def timed(*args, **kwargs):
+        time.sleep(delay)
+        output_path = original(*args, **kwargs)
+        done_times.append(time.perf_counter() - started)
+        return output_path
+
+    md_processor.pipeline._clean_md_file = timed
+    try:
+        yield
+    finally:
+        md_processor.pipeline._clean_md_file = original
+
+
+def run_mode(pdf_dir, output_dir, no_pipeline, args, clean_delay=0):
+    options = argparse.Namespace(
+        input=str(pdf_dir), output=str(output_dir), vram_size="16", lang="korean",
+        batch_size=args.batch_size, max_jobs=args.max_jobs, job_vram=None, timeout_per_pdf=0, retries=0,
+        queue_size=args.queue_size, clean_workers=1, no_pipeline=no_pipeline)
+    os.makedirs(output_dir, exist_ok=True)
+    done_times = []
+    started = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), \
+            track_cleaning(started, done_times, clean_delay):
+        if no_pipeline:
+            pdf_to_md_pipeline.run_barrier(options)
+        else:
+            pdf_to_md_pipeline.run_pipelined(options)
+    return {"first_doc_sec": round(min(done_times), 2) if done_times else None,
+            "total_sec": round(time.perf_counter() - started, 2)}
+
+
+def check_backup_store(output_dir, restore_dir, pdf_dir, args):
+    """백업 저장소 복원/재실행/검사 확인, 반환값: 실패 메시지 리스트"""
+    failures = []
+    store = BackupStore(output_dir)
+    store.restore(target_dir=restore_dir)
+    restored = sorted(Path(restore_dir).glob("*/auto/*.md"))
+    # fake_mineru 출력은 VRAM 값이 들어가므로 프로세스당 VRAM(기본 8GB)으로 다시 만들어 비교
+    os.environ["MINERU_VIRTUAL_VRAM_SIZE"] = "8"
+    if len(restored) != args.pdfs or any(path.read_text(encoding="utf-8") != fake_markdown(path.stem, args.md_kb)
+                                         for path in restored):
+        failures.append("백업 저장소에서 복원한 파일이 MinerU 원본과 다름")
+
+    # 같은 출력 디렉토리로 다시 실행: MinerU 출력 내용이 같으므로 객체를 새로 쓰지 않아야 함
+    objects = {path: path.stat().st_mtime_ns for path in store.objects_dir.rglob("*") if path.is_file()}
+    run_mode(pdf_dir, output_dir, False, args)
+    if {path: path.stat().st_mtime_ns for path in store.objects_dir.rglob("*") if path.is_file()} != objects:
+        failures.append("재실행 시 백업 객체를 다시 씀")
+
+    # 객체 하나를 손상시키면 verify가 찾아야 함
+    damaged = next(iter(objects))
+    os.chmod(damaged, 0o644)
+    damaged.write_text("손상", encoding="utf-8")
+    result = BackupStore(output_dir).verify()
+    if len(result["corrupt"]) != 1 or len(result["ok"]) != args.pdfs - 1:
+        failures.append(f"verify 결과 이상: {result}")
+    return failures
+
+
+def check_backpressure(pdf_dir, output_dir, args):
+    """
+    정제가 느리고 큐가 작을 때 mineru 실행이 미뤄지는지 확인, 반환값: (실행 시작 시각 리스트, 실패 메시지 리스트)
+    - PDF마다 mineru를 한 번씩 실행하고(batch_size=1) fake_mineru가 남긴 시작 시각을 본다.
+      모델 로드 시간은 0으로 두어 mineru가 정제보다 빠르게 (배압이 없으면 정제를 기다리지 않고) 끝나게 한다.
+    - k번째 실행을 넘길 때 끝난 문서는 모두 큐에 들어갔으므로
+      정제가 끝난 문서 >= k - max_jobs - queue_size, 즉 시작 시각 >= (k - max_jobs - queue_size) * clean_delay
+    """
+    options = argparse.Namespace(**{**vars(args), "batch_size": 1, "queue_size": 1})
+    start_log = Path(output_dir).parent / "mineru_starts.log"
+    os.environ.update(FAKE_MINERU_START_LOG=str(start_log), FAKE_MINERU_STARTUP="0")
+    try:
+        run_mode(pdf_dir, output_dir, False, options, clean_delay=args.clean_delay)
+    finally:
+        del os.environ["FAKE_MINERU_START_LOG"]
+        os.environ["FAKE_MINERU_STARTUP"] = str(args.startup)
+    starts = sorted(float(line) for line in start_log.read_text(encoding="utf-8").split())
+    offsets = [round(t - starts[0], 2) for t in starts]
+    failures = []
+    if len(starts) != args.pdfs:
+        failures.append(f"배압: mineru 실행 {len(starts)}회 (기대값 {args.pdfs})")
+    for k, offset in enumerate(offsets):
+        # 실행 시간 오차를 고려해 정제 시간의 90%만 요구
+        expected = (k - options.max_jobs - options.queue_size) * args.clean_delay * 0.9
+        if offset < expected:
+            failures.append(f"배압: {k}번째 mineru 실행이 {offset}s에 시작 (정제 속도상 {expected:.2f}s 이후여야 함)")
+            break
+    return offsets, failures
+
+
+def cleaned_outputs(output_dir):
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(Path(output_dir).glob("*/auto/*.md"))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF → Markdown 파이프라인 벤치마크 (배리어 vs 문서 단위 파이프라인)")
+    parser.add_argument('--pdfs', type=int, default=16, help="PDF 수 (기본값: 16)")
+    parser.add_argument('--startup', type=float, default=1.0, help="가짜 모델 로드 시간(초)")
+    parser.add_argument('--per-pdf', type=float, default=0.3, help="가짜 PDF 한 개 변환 시간(초)")
+    parser.add_argument('--md-kb', type=int, default=256, help="가짜 Markdown 크기(KB), 정제 부하")
+    parser.add_argument('--batch-size', type=int, default=4)
+    parser.add_argument('--max-jobs', type=int, default=2)
+    parser.add_argument('--queue-size', type=int, default=pdf_to_md_pipeline.DEFAULT_QUEUE_SIZE)
+    parser.add_argument('--clean-delay', type=float, default=0.3,
+                        help="배압 검증에서 문서 하나 정제에 더하는 시간(초), 0이면 검증 생략 (기본값: 0.3)")
+    args = parser.parse_args()
+
+    os.environ[MINERU_CMD_ENV] = f"{sys.executable} -m benchmarks.fake_mineru"
+    os.environ["FAKE_MINERU_STARTUP"] = str(args.startup)
+    os.environ["FAKE_MINERU_PER_PDF"] = str(args.per_pdf)
+    os.environ["FAKE_MINERU_MD_KB"] = str(args.md_kb)
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        pdf_dir = tmp / "pdfs"
+        pdf_dir.mkdir()
+        for i in range(args.pdfs):
+            (pdf_dir / f"rfp_{i:03d}.pdf").write_bytes(b"%PDF-1.4\n%%EOF\n")
+
+        barrier = run_mode(pdf_dir, tmp / "barrier", True, args)
+        pipelined = run_mode(pdf_dir, tmp / "pipelined", False, args)
+
+        barrier_outputs, pipelined_outputs = cleaned_outputs(tmp / "barrier"), cleaned_outputs(tmp / "pipelined")
+        if len(pipelined_outputs) != args.pdfs or barrier_outputs != pipelined_outputs:
+            failures.append("정제 결과가 배리어 방식과 다름")
+        failures += check_backup_store(tmp / "pipelined", tmp / "restored", pdf_dir, args)
+        mineru_starts = None
+        if args.clean_delay > 0:
+            mineru_starts, backpressure_failures = check_backpressure(pdf_dir, tmp / "backpressure" / "out", args)
+            failures += backpressure_failures
+
+    report = {
+        "pdfs": args.pdfs,
+        "md_kb": args.md_kb,
+        "batch_size": args.batch_size,
+        "max_jobs": args.max_jobs,
+        "queue_size": args.queue_size,
+        "barrier": barrier,
+        "pipelined": pipelined,
+        "backpressure_mineru_starts": mineru_starts,
+        "first_doc_speedup": (round(barrier["first_doc_sec"] / pipelined["first_doc_sec"], 2)
+                              if barrier["first_doc_sec"] and pipelined["first_doc_sec"] else None),
+        "failures": failures,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if failures:
+        print("❌ 파이프라인 검증 실패")
+        sys.exit(1)
+    print("✅ 문서 단위 파이프라인 결과가 배리어 방식과 같습니다")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Markdown 정제 스트리밍 모드 검증 + 메모리 벤치마크 (md_processor.pipeline.process_md_file stream=False vs True)
+
+1) 정확도: 경계 조건 파일(빈 파일, 줄바꿈으로 끝남/안 끝남, CRLF, NULL Byte, 잘못된 UTF-8, 목차로 끝나는 문서)과
+   합성 문서에서 두 모드의 출력이 바이트 단위로 같은지, 인플레이스(입력=출력) 변환도 같은지 확인한다.
+   (다르면 exit code 1)
+2) 메모리: 문서마다 새 프로세스(spawn)에서 tracemalloc 최대 할당량과 변환 시간을 잰다.
+   스트리밍 모드의 최대 할당량은 파일 크기와 무관하게 거의 일정해야 한다.
+
+사용법:
+    python -m benchmarks.bench_md_stream
+    python -m benchmarks.bench_md_stream --lines 10000 100000 400000
+"""
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.bench_header_converter import make_markdown
+
+DEFAULT_LINES = [10000, 100000, 300000]
+
+
+def edge_cases():
+    """이름 -> 파일 내용(bytes)"""
+    doc = make_markdown(400, seed=7)
+    return {
+        "empty": b"",
+        "newline_only": b"\n",
+        "trailing_newline": (doc + "\n").encode("utf-8"),
+        "no_trailing_newline": doc.encode("utf-8"),
+        "blank_lines_at_end": (doc + "\n\n\n").encode("utf-8"),
+        "crlf": doc.replace("\n", "\r\n").encode("utf-8"),
+        "null_bytes": doc.replace("사업", "사\x00업").replace("\n\n", "\n\x00\n").encode("utf-8"),
+        "invalid_utf8": doc.encode("utf-8")[:5000] + b"\xff\xfe\x80" + doc.encode("utf-8")[5000:],
+        "toc_at_end": ("본문\n1. 개요 ····· 3\n2. 배경 ····· 5\n\n").encode("utf-8"),
+        "toc_only_blank": b"\n\n\n\n",
+    }
+
+
+def _process(path, output_path, stream):
+    from md_processor.pipeline import process_md_file
+    with contextlib.redirect_stdout(io.StringIO()):
+        return process_md_file(str(path), str(output_path), stream=stream)
+
+
+def _measure(path, output_path, stream):
+    """프로세스 풀 워커: (변환 시간, tracemalloc 최대 할당량 MB)"""
+    import tracemalloc
+    import md_processor.pipeline  # import 자체의 할당은 제외
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    ok = _process(path, output_path, stream)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if not ok:
+        raise RuntimeError(f"변환 실패: {path}")
+    return elapsed, round(peak / (1024 * 1024), 2)
+
+
+def check_equal(path, tmp_dir, failures, name):
+    full, streamed = tmp_dir / f"{name}.full.md", tmp_dir / f"{name}.stream.md"
+    if not (_process(path, full, False) and _process(path, streamed, True)):
+        failures.append(f"{name}: 변환 실패")
+        return
+    if full.read_bytes() != streamed.read_bytes():
+        failures.append(f"{name}: 스트리밍 결과가 다름")
+    # 인플레이스 변환 (pdf_to_md_pipeline처럼 입력 파일에 덮어쓰기)
+    in_place = tmp_dir / f"{name}.inplace.md"
+    shutil.copyfile(path, in_place)
+    _process(in_place, in_place, True)
+    if in_place.read_bytes() != full.read_bytes():
+        failures.append(f"{name}: 인플레이스 스트리밍 결과가 다름")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown 정제 스트리밍 모드 검증 + 메모리 벤치마크")
+    parser.add_argument('--lines', type=int, nargs='+', default=DEFAULT_LINES, help="합성 Markdown 라인 수 목록")
+    args = parser.parse_args()
+
+    failures = []
+    documents = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for name, content in edge_cases().items():
+            path = tmp_dir / f"{name}.md"
+            path.write_bytes(content)
+            check_equal(path, tmp_dir, failures, name)
+
+        # spawn: 이전 측정의 메모리 상태를 물려받지 않는다
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            for lines in args.lines:
+                path = tmp_dir / f"synthetic_{lines}.md"
+                path.write_text(make_markdown(lines, seed=lines) + "\n", encoding="utf-8")
+                check_equal(path, tmp_dir, failures, path.stem)
+                result = {"name": path.name, "lines": lines, "mb": round(path.stat().st_size / (1024 * 1024), 2)}
+                for mode, stream in (("full", False), ("stream", True)):
+                    elapsed, peak = executor.submit(_measure, str(path), str(tmp_dir / "out.md"), stream).result()
+                    result[mode] = {"sec": round(elapsed, 3), "peak_alloc_mb": peak}
+                documents.append(result)
+                print(f"⏱ {path.name} 측정 완료", file=sys.stderr)
+
+    print(json.dumps({"documents": documents, "failures": failures}, ensure_ascii=False, indent=2))
+    if failures:
+        print("❌ 스트리밍 결과가 기존 모드와 다릅니다")
+        sys.exit(1)
+    print("✅ 스트리밍 결과가 기존 모드와 바이트 단위로 같습니다")
+
+if __name__ == "__main__":
+    main()
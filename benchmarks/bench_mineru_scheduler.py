@@ -0,0 +1,107 @@
+"""
+mineru 스케줄러 검증 + 벤치마크 (benchmarks.fake_mineru 사용, 실제 mineru/GPU 불필요)
+
+1) 성능: 같은 PDF 목록을 기존 방식(PDF마다 순차 실행, batch_size=1 / max_jobs=1)과
+   스케줄러(묶음 + 동시 실행)로 변환해 전체 시간을 비교한다.
+2) 정확도 (다르면 exit code 1)
+   - 모든 PDF의 Markdown이 만들어지고 on_complete가 PDF마다 한 번씩 호출되는지
+   - 비정상 종료하는 PDF가 섞인 묶음: 재시도 시 묶음을 나눠 나머지 PDF는 성공하고 문제 PDF만 실패하는지
+   - 멈추는 PDF: 제한 시간 후 종료되어 timeouts에 기록되는지
+
+사용법:
+    python -m benchmarks.bench_mineru_scheduler
+    python -m benchmarks.bench_mineru_scheduler --pdfs 32 --startup 2.0 --per-pdf 0.3 --batch-size 8 --max-jobs 2
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+from layout_parser.mineru_scheduler import schedule_mineru, MINERU_CMD_ENV
+
+
+def make_pdfs(directory, count, extra_names=()):
+    """빈 PDF 자리표시 파일 생성 (fake_mineru는 내용을 읽지 않음)"""
+    directory.mkdir(parents=True, exist_ok=True)
+    names = [f"rfp_{i:03d}.pdf" for i in range(count)] + list(extra_names)
+    paths = []
+    for name in names:
+        path = directory / name
+        path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+        paths.append(str(path))
+    return sorted(paths)
+
+
+def run(pdf_files, output_dir, **options):
+    completed = []
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = schedule_mineru(pdf_files, output_dir,
+                                  on_complete=lambda pdf_file, md_path: completed.append(pdf_file), **options)
+    results["sec"] = round(time.perf_counter() - t0, 2)
+    results["completed_callbacks"] = completed
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mineru 스케줄러 검증 + 벤치마크 (fake mineru)")
+    parser.add_argument('--pdfs', type=int, default=16, help="PDF 수 (기본값: 16)")
+    parser.add_argument('--startup', type=float, default=1.0, help="가짜 모델 로드 시간(초)")
+    parser.add_argument('--per-pdf', type=float, default=0.2, help="가짜 PDF 한 개 변환 시간(초)")
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--max-jobs', type=int, default=2)
+    args = parser.parse_args()
+
+    os.environ[MINERU_CMD_ENV] = f"{sys.executable} -m benchmarks.fake_mineru"
+    os.environ["FAKE_MINERU_STARTUP"] = str(args.startup)
+    os.environ["FAKE_MINERU_PER_PDF"] = str(args.per_pdf)
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        pdf_files = make_pdfs(tmp / "pdfs", args.pdfs)
+
+        sequential = run(pdf_files, tmp / "sequential", batch_size=1, max_jobs=1)
+        scheduled = run(pdf_files, tmp / "scheduled", batch_size=args.batch_size, max_jobs=args.max_jobs)
+        for name, result in (("sequential", sequential), ("scheduled", scheduled)):
+            if sorted(result["success"]) != pdf_files or sorted(result["completed_callbacks"]) != pdf_files:
+                failures.append(f"{name}: 성공 {len(result['success'])}/{len(pdf_files)}")
+
+        # 비정상 종료 PDF가 섞인 묶음: 재시도에서 나뉘어 나머지는 성공해야 함
+        crash_files = make_pdfs(tmp / "crash_pdfs", 6, extra_names=["rfp_002_crash.pdf"])
+        crash = run(crash_files, tmp / "crash", batch_size=len(crash_files), max_jobs=2, retries=3)
+        expected_failed = [p for p in crash_files if "crash" in Path(p).name]
+        if crash["failed"] != expected_failed or sorted(crash["success"]) != sorted(set(crash_files) - set(expected_failed)):
+            failures.append(f"crash: 실패 {crash['failed']}")
+
+        # 멈추는 PDF: 제한 시간 후 종료
+        hang_files = make_pdfs(tmp / "hang_pdfs", 2, extra_names=["rfp_hang.pdf"])
+        hang = run(hang_files, tmp / "hang", batch_size=1, max_jobs=3, retries=0,
+                   startup_timeout=args.startup + 1, timeout_per_pdf=args.per_pdf + 1)
+        if hang["timeouts"] != [p for p in hang_files if "hang" in Path(p).name] or len(hang["success"]) != 2:
+            failures.append(f"hang: timeouts {hang['timeouts']}")
+
+    report = {
+        "pdfs": args.pdfs,
+        "fake_startup_sec": args.startup,
+        "fake_per_pdf_sec": args.per_pdf,
+        "sequential_sec": sequential["sec"],
+        "scheduled_sec": scheduled["sec"],
+        "batch_size": args.batch_size,
+        "max_jobs": args.max_jobs,
+        "speedup": round(sequential["sec"] / scheduled["sec"], 2) if scheduled["sec"] else None,
+        "crash_case_sec": crash["sec"],
+        "hang_case_sec": hang["sec"],
+        "failures": failures,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if failures:
+        print("❌ 스케줄러 검증 실패")
+        sys.exit(1)
+    print("✅ 스케줄러 검증 통과 (묶음 실행, 재시도 분할, 제한 시간)")
+
+if __name__ == "__main__":
+    main()
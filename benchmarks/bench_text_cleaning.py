@@ -0,0 +1,152 @@
+"""
+텍스트 정규화 엔진 마이크로 벤치마크
+
+기존(re.sub 다단계) clean_text / get_title_level / process.py clean_text 구현과
+pdf_parser.utils.text_cleaning의 공용 엔진을 같은 말뭉치로 비교한다.
+- 출력이 바이트 단위로 동일한지 먼저 확인하고 (다르면 exit code 1)
+- 블록당 처리 시간과 속도 향상 배수를 출력한다.
+
+사용법:
+    python -m benchmarks.bench_text_cleaning
+    python -m benchmarks.bench_text_cleaning --blocks 50000 --corpus outputs/a_chunked.json
+"""
+import re
+import sys
+import json
+import time
+import random
+import argparse
+from pdf_parser.utils.chunk_io import iter_chunks
+from pdf_parser.utils.text_cleaning import normalize_text, clean_text, get_title_level, clean_blocks
+
+
+# ---------------------------------------------------------------------------
+# 기존 구현 (비교 기준)
+# ---------------------------------------------------------------------------
+def legacy_clean_text(text):
+    if not text:
+        return ""
+    text = text.strip()
+    text = re.sub(r'-\s*\d+\s*-', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s가-힣.,!?;:()\[\]{}"\'-]', '', text)
+    text = re.sub(r'\.{2,}', '.', text)
+    text = text.replace("<br>", "\n")
+    return text.strip()
+
+def legacy_get_title_level(text):
+    text = text.strip()
+    if len(text) > 100:
+        return 0
+    if re.match(r"^(Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)[.\\s]?", text):
+        return 1
+    if re.match(r"^제\\s?\\d+\\s?장", text):
+        return 1
+    if re.match(r"^\\d+(\\.\\d+)*[.\\s]", text):
+        return 2
+    if re.match(r"^[가-힣]\\.", text) and len(text) < 25:
+        return 3
+    return 0
+
+def legacy_process_clean_text(text):
+    if not text:
+        return ""
+    text = text.strip()
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s가-힣.,!?;;:()\[\]{}"\'-]', '', text)
+    text = re.sub(r'\.{2,}', '.', text)
+    text = re.sub(r'\n\s*\n', '\n', text)
+    return text.strip()
+
+
+# ---------------------------------------------------------------------------
+# 말뭉치
+# ---------------------------------------------------------------------------
+_PIECES = [
+    "본 사업은", "국가 연구개발", "제안요청서", "세부 요구사항", "Ⅰ. 사업 개요", "Ⅱ.", "제 3 장", "제\\3\\장",
+    "1.2 추진 배경", "\\1\\.2 ", "가. 목적", "나\\.", "□ 추진 목표", "○ 세부 내용", "• 항목", "※ 참고",
+    "- 12 -", "-3-", "- 4-", "…", "....", "..", ".", "<br>", "(2024.1.1.기준)", "[별첨 1]", "“인용”",
+    "|---|---|", "| 항목 | 금액 |", "100,000,000원", "API", "RFP", "e-mail", "@", "#", "%", "&", "~",
+    " ", "  ", "\t", "\n", "\n\n", "　", "\xa0", "\r\n", "_", "ⅰ", "①", "​",
+]
+
+def synthetic_blocks(count, seed=0):
+    rng = random.Random(seed)
+    blocks = []
+    for _ in range(count):
+        size = rng.choice([1, 2, 3, 5, 10, 40, 150])
+        blocks.append("".join(rng.choice(_PIECES) for _ in range(size)))
+    return blocks
+
+def corpus_blocks(paths):
+    blocks = []
+    for path in paths:
+        for chunk in iter_chunks(path):
+            blocks.append(chunk.get("content") or chunk.get("text") or "")
+    return blocks
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+def _timeit(func, blocks, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(blocks)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def check_identical(blocks):
+    mismatches = []
+    for text in blocks:
+        if clean_text(text) != legacy_clean_text(text):
+            mismatches.append(("clean_text", text))
+        if normalize_text(text, remove_page_numbers=False) != legacy_process_clean_text(text):
+            mismatches.append(("process.clean_text", text))
+        for candidate in (text, legacy_clean_text(text)):
+            if get_title_level(candidate) != legacy_get_title_level(candidate):
+                mismatches.append(("get_title_level", candidate))
+    return mismatches
+
+def run(blocks, repeat=3):
+    def legacy(items):
+        return [(c, legacy_get_title_level(c)) for c in (legacy_clean_text(t) for t in items)]
+
+    def engine(items):
+        return [(c, get_title_level(c)) for c in (clean_text(t) for t in items)]
+
+    results = {
+        "blocks": len(blocks),
+        "chars": sum(len(b) for b in blocks),
+        "legacy_sec": _timeit(legacy, blocks, repeat),
+        "engine_sec": _timeit(engine, blocks, repeat),
+        "batch_sec": _timeit(clean_blocks, blocks, repeat),
+    }
+    results["speedup"] = results["legacy_sec"] / results["engine_sec"] if results["engine_sec"] else None
+    results["batch_speedup"] = results["legacy_sec"] / results["batch_sec"] if results["batch_sec"] else None
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 정규화 엔진 마이크로 벤치마크")
+    parser.add_argument('--blocks', type=int, default=20000, help="합성 블록 수 (기본값: 20000)")
+    parser.add_argument('--corpus', nargs='*', default=[], help="실제 청크 파일(.json/.jsonl[.gz|.zst]) 추가")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    blocks = synthetic_blocks(args.blocks, args.seed) + corpus_blocks(args.corpus)
+
+    mismatches = check_identical(blocks)
+    if mismatches:
+        print(f"❌ 출력 불일치 {len(mismatches)}건")
+        for name, text in mismatches[:10]:
+            print(f"  - {name}: {text!r}")
+        sys.exit(1)
+    print(f"✅ 출력 동일: {len(blocks)}개 블록")
+
+    results = run(blocks, args.repeat)
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+페이지 triage 검증: 표 추출기가 표를 찾는 페이지를 triage가 표 후보에서 빼지 않는지 확인
+
+여러 방식으로 그린 테두리 표(선분, 사변형, 사각형 셀, 사각형 + 구분선, 둥근 모서리)와
+표가 없는 페이지(본문만, 밑줄 하나)를 만들어
+- pdfplumber extract_tables 또는 fitz find_tables가 표를 찾으면 triage가 table_candidate여야 하고
+- 표가 없는 페이지는 text로 분류돼 표 추출을 생략해야 한다.
+(어긋나면 exit code 1)
+
+사용법:
+    python -m benchmarks.bench_triage
+"""
+import sys
+import json
+import tempfile
+from pathlib import Path
+import fitz
+import pdfplumber
+from pdf_parser.utils.triage import triage_page, TABLE_CANDIDATE, TEXT_ONLY
+
+X0, Y0, CELL_W, CELL_H = 100, 100, 100, 50
+
+
+def _cells():
+    return [fitz.Rect(X0 + c * CELL_W, Y0 + r * CELL_H, X0 + (c + 1) * CELL_W, Y0 + (r + 1) * CELL_H)
+            for r in range(2) for c in range(2)]
+
+
+def _grid_lines(shape):
+    for r in range(3):
+        shape.draw_line((X0, Y0 + r * CELL_H), (X0 + 2 * CELL_W, Y0 + r * CELL_H))
+    for c in range(3):
+        shape.draw_line((X0 + c * CELL_W, Y0), (X0 + c * CELL_W, Y0 + 2 * CELL_H))
+
+
+def _quads(shape):
+    for cell in _cells():
+        shape.draw_quad(cell.quad)
+
+
+def _rect_cells(shape):
+    for cell in _cells():
+        shape.draw_rect(cell)
+
+
+def _side_by_side_rects(shape):
+    shape.draw_rect(fitz.Rect(X0, Y0, X0 + CELL_W, Y0 + 2 * CELL_H))
+    shape.draw_rect(fitz.Rect(X0 + CELL_W, Y0, X0 + 2 * CELL_W, Y0 + 2 * CELL_H))
+    shape.draw_line((X0, Y0 + CELL_H), (X0 + 2 * CELL_W, Y0 + CELL_H))
+
+
+def _rect_with_dividers(shape):
+    shape.draw_rect(fitz.Rect(X0, Y0, X0 + 2 * CELL_W, Y0 + 2 * CELL_H))
+    shape.draw_line((X0 + CELL_W, Y0), (X0 + CELL_W, Y0 + 2 * CELL_H))
+    shape.draw_line((X0, Y0 + CELL_H), (X0 + 2 * CELL_W, Y0 + CELL_H))
+
+
+def _rounded(shape):
+    shape.draw_rect(fitz.Rect(X0, Y0, X0 + 2 * CELL_W, Y0 + 2 * CELL_H), radius=0.1)
+    shape.draw_line((X0 + CELL_W, Y0), (X0 + CELL_W, Y0 + 2 * CELL_H))
+    shape.draw_line((X0, Y0 + CELL_H), (X0 + 2 * CELL_W, Y0 + CELL_H))
+
+
+def _underline(shape):
+    shape.draw_line((72, 75), (300, 75))
+
+
+# 이름 -> (그리기 함수, 표 셀 텍스트를 넣을지)
+CASES = {
+    "grid_lines": (_grid_lines, True),
+    "quads": (_quads, True),
+    "rect_cells": (_rect_cells, True),
+    "side_by_side_rects": (_side_by_side_rects, True),
+    "rect_with_dividers": (_rect_with_dividers, True),
+    "rounded_corners": (_rounded, True),
+    "text_only": (None, False),
+    "underline": (_underline, False),
+}
+
+
+def make_page(path, draw, with_cells):
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 70), "Section 1. Overview of the proposal request and requirements")
+    if draw:
+        shape = page.new_shape()
+        draw(shape)
+        shape.finish(color=(0, 0, 0), width=1, closePath=False)
+        shape.commit()
+    if with_cells:
+        for i, cell in enumerate(_cells()):
+            page.insert_text((cell.x0 + 10, cell.y0 + 25), f"cell {i}")
+    doc.save(path)
+
+
+def main():
+    failures = []
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, (draw, with_cells) in CASES.items():
+            path = Path(tmp_dir) / f"{name}.pdf"
+            make_page(path, draw, with_cells)
+            with fitz.open(path) as doc:
+                category, signals = triage_page(doc[0])
+                fitz_tables = len(doc[0].find_tables().tables)
+            with pdfplumber.open(path) as pdf:
+                plumber_tables = len(pdf.pages[0].extract_tables())
+            results[name] = {"category": category, **signals,
+                             "fitz_tables": fitz_tables, "plumber_tables": plumber_tables}
+            if (fitz_tables or plumber_tables) and category != TABLE_CANDIDATE:
+                failures.append(f"{name}: 표 추출기가 표를 찾았지만 triage는 {category}")
+            if not with_cells and category != TEXT_ONLY:
+                failures.append(f"{name}: 표가 없는 페이지인데 triage는 {category}")
+
+    print(json.dumps({"cases": results, "failures": failures}, ensure_ascii=False, indent=2))
+    if failures:
+        print("❌ triage가 표 페이지를 놓쳤습니다")
+        sys.exit(1)
+    print("✅ 표 추출기가 표를 찾는 페이지는 모두 table_candidate로 분류됩니다")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+mineru 대체 실행 파일 (스케줄러 검증/벤치마크용)
+
+실제 mineru와 같은 인자(-p 파일 또는 디렉토리, -o 출력 디렉토리)를 받아
+<출력>/<이름>/auto/<이름>.md를 만든다. 모델 로드와 변환 시간은 sleep으로 흉내 낸다.
+- FAKE_MINERU_STARTUP: 실행마다 드는 모델 로드 시간(초, 기본값 1.0)
+- FAKE_MINERU_PER_PDF: PDF 한 개 변환 시간(초, 기본값 0.2)
+- FAKE_MINERU_MD_KB: 만들 Markdown 크기(KB, 기본값 0 = 제목 한 줄), 정제 단계 부하용
+- FAKE_MINERU_START_LOG: 지정하면 실행을 시작할 때마다 그 파일에 시작 시각(time.time())을 한 줄씩 추가 (배압 검증용)
+- 파일 이름에 "crash"가 들어간 PDF를 만나면 그 자리에서 종료 코드 1로 끝남 (묶음의 나머지 PDF도 미처리)
+- 파일 이름에 "hang"이 들어간 PDF를 만나면 멈춤 (제한 시간 검증용)
+
+사용법:
+    MINERU_CMD="python -m benchmarks.fake_mineru" python pdf_to_md_pipeline.py -i ./pdfs -o ./data
+"""
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+
+def fake_markdown(title, size_kb):
+    """MinerU 출력처럼 번호 제목과 본문이 섞인 Markdown"""
+    lines = [f"# {title}", "", f"VRAM {os.environ.get('MINERU_VIRTUAL_VRAM_SIZE')}GB", ""]
+    section = 0
+    while sum(len(line) + 1 for line in lines) < size_kb * 1024:
+        section += 1
+        lines += [f"# {section}. 사업 개요", "", f"# {section}.1 추진 배경", "",
+                  "발주기관은 데이터 표준화를 보장하여야 한다. 제안사는 사용자 교육을 제안하여야 한다.", "",
+                  f"# 가. 세부 요구사항 {section}", "", "| 항목 | 내용 |", "| --- | --- |", "| 기간 | 12개월 |", ""]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mineru 대체 실행 파일")
+    parser.add_argument('-p', '--path', required=True)
+    parser.add_argument('-o', '--output', required=True)
+    parser.add_argument('--lang', default="korean")
+    parser.add_argument('--output-format', default="markdown")
+    args, _ = parser.parse_known_args()
+
+    source = Path(args.path)
+    pdf_files = sorted(source.glob("*.pdf")) if source.is_dir() else [source]
+    if os.environ.get("FAKE_MINERU_START_LOG"):
+        with open(os.environ["FAKE_MINERU_START_LOG"], "a", encoding="utf-8") as f:
+            f.write(f"{time.time()}\n")
+    time.sleep(float(os.environ.get("FAKE_MINERU_STARTUP", 1.0)))
+    for pdf_file in pdf_files:
+        if "crash" in pdf_file.name:
+            print(f"fake mineru: {pdf_file.name} 처리 중 비정상 종료", file=sys.stderr)
+            sys.exit(1)
+        if "hang" in pdf_file.name:
+            while True:
+                time.sleep(60)
+        time.sleep(float(os.environ.get("FAKE_MINERU_PER_PDF", 0.2)))
+        auto_dir = Path(args.output) / pdf_file.stem / "auto"
+        auto_dir.mkdir(parents=True, exist_ok=True)
+        (auto_dir / f"{pdf_file.stem}.md").write_text(
+            fake_markdown(pdf_file.stem, int(os.environ.get("FAKE_MINERU_MD_KB", 0))), encoding="utf-8")
+        print(f"done: {pdf_file.name}")
+
+if __name__ == "__main__":
+    main()
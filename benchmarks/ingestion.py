@@ -0,0 +1,368 @@
+"""
+pdf_parser 수집(ingestion) 단계별 벤치마크
+
+benchmarks.synthetic_pdf로 만든 결정적 합성 RFP PDF(기본 10 / 100 / 500페이지)에 대해
+파이프라인 단계별 wall/CPU 시간, pages/sec, 최대 RSS를 측정해 JSON으로 출력한다.
+- 단계: triage, parse_with_fitz, parse_with_pdfplumber, merge_parsers, cleaning,
+        parse_with_unstructured(설치된 경우), chunking, page_mapping, writing, end_to_end(PDFConverter)
+  (--chunker native는 블록을 나누면서 페이지 범위를 함께 계산하므로 page_mapping 시간이 chunking에 포함되고,
+   --chunker langchain은 이전처럼 전체 텍스트 분할과 페이지 범위 계산을 따로 잰다)
+- 문서마다 새 프로세스(spawn)에서 측정하므로 최대 RSS가 이전 문서의 영향을 받지 않는다.
+- 결과에 git 커밋, 라이브러리 버전, 입력 PDF 해시를 함께 기록해 커밋 간 비교가 가능하다.
+
+사용법:
+    python -m benchmarks.ingestion --output bench_results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.ingestion --sizes 10 100 --compare bench_results/baseline.json --max-regression 1.2
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import platform
+import tempfile
+import subprocess
+import multiprocessing
+import importlib.util
+from bisect import bisect_right
+from contextlib import contextmanager
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.synthetic_pdf import make_rfp_pdf
+
+# 결과 JSON 형식이 바뀌면 올린다 (--compare는 같은 schema끼리만 비교)
+# 2: --chunker 추가, native 청커는 chunking에 페이지 범위 계산 포함
+SCHEMA_VERSION = 2
+DEFAULT_SIZES = [10, 100, 500]
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+@contextmanager
+def _stage(stages, name, pages):
+    wall, cpu = time.perf_counter(), time.process_time()
+    yield
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    stages[name] = {
+        "wall_sec": round(wall, 4),
+        "cpu_sec": round(cpu, 4),
+        "pages_per_sec": round(pages / wall, 1) if wall > 0 else None,
+    }
+
+
+def _best_of(runs):
+    """반복 측정 결과 중 단계별 wall 시간이 가장 짧은 값 사용"""
+    best = {}
+    for stages in runs:
+        for name, value in stages.items():
+            if "wall_sec" not in value or name not in best or value["wall_sec"] < best[name]["wall_sec"]:
+                best[name] = value
+    return best
+
+
+def _measure_stages(pdf_path, options):
+    """
+    PDF 한 개에 대해 파이프라인 단계를 순서대로 실행하며 단계별 시간 측정
+    - 반환값: (stages, 부가 정보 dict)
+    """
+    import fitz, pdfplumber
+    from pdf_parser.parsers.fitz_parser import parse_with_fitz
+    from pdf_parser.parsers.plumber_parser import parse_with_pdfplumber
+    from pdf_parser.utils.merging import merge_parsers
+    from pdf_parser.utils.triage import triage_page
+    from pdf_parser.utils.text_cleaning import clean_blocks
+    from pdf_parser.utils.chunk_io import ChunkWriter, chunk_output_path
+    from pdf_parser.utils.chunking import Chunk
+    from pdf_parser.utils.page_mapping import build_page_offsets, page_range_for_span
+    from pdf_parser.converter import PDFConverter
+
+    stages = {}
+    doc_fitz = fitz.open(pdf_path)
+    doc_plumber = pdfplumber.open(pdf_path)
+    pages = len(doc_fitz)
+    try:
+        with _stage(stages, "triage", pages):
+            categories = [triage_page(doc_fitz[i])[0] for i in range(pages)]
+
+        with _stage(stages, "parse_with_fitz", pages):
+            fitz_results = [parse_with_fitz(doc_fitz[i]) for i in range(pages)]
+
+        with _stage(stages, "parse_with_pdfplumber", pages):
+            plumber_results = [parse_with_pdfplumber(doc_plumber.pages[i]) for i in range(pages)]
+    finally:
+        doc_fitz.close()
+        doc_plumber.close()
+
+    with _stage(stages, "merge_parsers", pages):
+        merged = [merge_parsers(f, p) for f, p in zip(fitz_results, plumber_results)]
+
+    with _stage(stages, "cleaning", pages):
+        texts = [(i + 1, text) for i, (text, _) in enumerate(merged) if text]
+        blocks = []
+        for (page, _), (clean, level) in zip(texts, clean_blocks([t for _, t in texts])):
+            block = {"type": "title" if level > 0 else "text", "content": clean, "page": page}
+            if level > 0:
+                block["level"] = level
+            blocks.append(block)
+        for i, (_, table) in enumerate(merged):
+            if table:
+                blocks.append({"type": "table", "content": table.strip(), "page": i + 1})
+        blocks.sort(key=lambda b: b["page"])
+
+    if options["unstructured"]:
+        if importlib.util.find_spec("unstructured") is None:
+            stages["parse_with_unstructured"] = {"skipped": "unstructured 미설치"}
+        else:
+            from pdf_parser.parsers.unstructured_parser import parse_with_unstructured
+            with _stage(stages, "parse_with_unstructured", pages):
+                parse_with_unstructured(Path(pdf_path), strategy=options["unstructured_strategy"])
+    else:
+        stages["parse_with_unstructured"] = {"skipped": "--no-unstructured"}
+
+    converter = PDFConverter(input_dir="", chunk_size=options["chunk_size"], chunk_overlap=options["chunk_overlap"],
+                             chunker=options["chunker"])
+    if options["chunker"] == "langchain":
+        splitter = converter._make_chunker().splitter
+        with _stage(stages, "chunking", pages):
+            full_text = "\n\n".join(b["content"] for b in blocks)
+            docs = splitter.create_documents([full_text])
+
+        with _stage(stages, "page_mapping", pages):
+            page_offsets = build_page_offsets(blocks)
+            chunks = []
+            for doc in docs:
+                start = doc.metadata["start_index"]
+                end = start + len(doc.page_content)
+                first = max(bisect_right(page_offsets[0], start) - 1, 0)
+                last = max(bisect_right(page_offsets[0], max(start, end - 1)) - 1, first)
+                chunks.append(Chunk(doc.page_content, start, end, list(range(first, last + 1)),
+                                    *page_range_for_span(page_offsets, start, end)))
+    else:
+        with _stage(stages, "chunking", pages):
+            chunker = converter._make_chunker()
+            chunks = [c for b in blocks for c in chunker.add(b)]
+            chunks.extend(chunker.finish())
+        stages["page_mapping"] = {"skipped": "native 청커는 chunking에 포함"}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = chunk_output_path(tmp_dir, Path(pdf_path).stem, options["format"], options["compression"])
+        with _stage(stages, "writing", pages):
+            with ChunkWriter(output_path, options["format"], options["compression"]) as writer:
+                for i, chunk in enumerate(chunks):
+                    writer.write(converter._chunk_record("bench", Path(pdf_path), i, chunk))
+        bytes_written = writer.bytes_written
+
+    info = {
+        "blocks": len(blocks),
+        "chunks": len(chunks),
+        "bytes_written": bytes_written,
+        "page_categories": {c: categories.count(c) for c in sorted(set(categories))},
+    }
+    return stages, info
+
+
+def _measure_end_to_end(pdf_path, options):
+    """PDFConverter.convert_single_pdf 전체 시간 (unstructured_mode=off, 진행바/로그 출력 제외)"""
+    import io
+    from contextlib import redirect_stdout, redirect_stderr
+    from pdf_parser.converter import PDFConverter
+
+    pages = options["pages"]
+    stages = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        converter = PDFConverter(input_dir="", output_dir=tmp_dir, output_format=options["format"],
+                                 compression=options["compression"], chunk_size=options["chunk_size"],
+                                 chunk_overlap=options["chunk_overlap"], chunker=options["chunker"],
+                                 unstructured_mode="off")
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            with _stage(stages, "end_to_end", pages):
+                converter.convert_single_pdf(Path(pdf_path))
+    return stages["end_to_end"]
+
+
+def _bench_document(pdf_path, options):
+    """
+    프로세스 풀 워커: 문서 한 개를 repeat회 측정
+    """
+    import logging
+    # 파서 경고가 parse_failures.log 등으로 새지 않도록 벤치마크 중에는 로그를 끈다
+    logging.disable(logging.WARNING)
+
+    runs, end_to_end = [], []
+    info = {}
+    for _ in range(options["repeat"]):
+        stages, info = _measure_stages(pdf_path, options)
+        runs.append(stages)
+        end_to_end.append(_measure_end_to_end(pdf_path, options))
+
+    stages = _best_of(runs)
+    stages["end_to_end"] = min(end_to_end, key=lambda s: s["wall_sec"])
+    return {"stages": stages, **info, "peak_rss_mb": _peak_rss_mb()}
+
+
+def _file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _git_commit():
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+    try:
+        sha = git("rev-parse", "HEAD")
+        dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+    except OSError:
+        return {"sha": None, "dirty": None}
+    return {"sha": sha or None, "dirty": dirty}
+
+
+def _version(module_name, attr="__version__"):
+    if importlib.util.find_spec(module_name) is None:
+        return None
+    try:
+        module = __import__(module_name)
+        return getattr(module, attr, "unknown")
+    except Exception:
+        return "unknown"
+
+
+def environment_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pymupdf": _version("pymupdf", "VersionBind"),
+        "pdfplumber": _version("pdfplumber"),
+        "langchain": _version("langchain"),
+        "unstructured": _version("unstructured"),
+    }
+
+
+def run_benchmark(sizes, pdf_dir, options):
+    documents = []
+    for pages in sizes:
+        pdf_path = Path(pdf_dir) / f"rfp_{pages}p_seed{options['seed']}.pdf"
+        page_kinds = make_rfp_pdf(pdf_path, pages, options["seed"]) if not pdf_path.exists() else None
+        print(f"⏱ {pdf_path.name} 측정 중...", file=sys.stderr)
+
+        # spawn: 부모 프로세스 메모리를 물려받지 않아 문서별 최대 RSS를 따로 잴 수 있다
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            result = executor.submit(_bench_document, str(pdf_path), {**options, "pages": pages}).result()
+
+        measured = [s["wall_sec"] for name, s in result["stages"].items() if name != "end_to_end" and "wall_sec" in s]
+        total = sum(measured)
+        documents.append({
+            "name": pdf_path.name,
+            "pages": pages,
+            "pdf_sha256": _file_sha256(pdf_path),
+            **({"page_kinds": page_kinds} if page_kinds else {}),
+            "total_stage_sec": round(total, 4),
+            "pages_per_sec": result["stages"]["end_to_end"]["pages_per_sec"],
+            **result,
+        })
+    return documents
+
+
+def compare(current, baseline, max_regression=None):
+    """
+    이전 결과 JSON과 단계별 wall 시간 비교 출력
+    - 반환값: max_regression 배수를 넘게 느려진 (문서, 단계) 목록
+    """
+    if baseline.get("schema") != current.get("schema"):
+        print(f"⚠️ schema가 달라 비교하지 않습니다: {baseline.get('schema')} != {current.get('schema')}")
+        return []
+    base_docs = {d["name"]: d for d in baseline["documents"]}
+    regressions = []
+    print(f"\n비교 기준: {baseline['commit'].get('sha')} -> 현재: {current['commit'].get('sha')}")
+    for doc in current["documents"]:
+        base = base_docs.get(doc["name"])
+        if base is None:
+            continue
+        if base.get("pdf_sha256") != doc.get("pdf_sha256"):
+            print(f"⚠️ {doc['name']}: 입력 PDF가 달라 비교에서 제외")
+            continue
+        print(f"[{doc['name']}] 최대 RSS {base.get('peak_rss_mb')} -> {doc.get('peak_rss_mb')} MB")
+        for name, stage in doc["stages"].items():
+            base_stage = base["stages"].get(name, {})
+            if "wall_sec" not in stage or not base_stage.get("wall_sec"):
+                continue
+            ratio = stage["wall_sec"] / base_stage["wall_sec"]
+            mark = ""
+            if max_regression and ratio > max_regression:
+                mark = " ❌"
+                regressions.append((doc["name"], name, ratio))
+            print(f"  {name:<24} {base_stage['wall_sec']:>9.4f}s -> {stage['wall_sec']:>9.4f}s  x{ratio:.2f}{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pdf_parser 수집 단계별 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="합성 PDF 페이지 수 목록 (기본값: 10 100 500)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help="반복 측정 횟수 (단계별 최솟값 사용)")
+    parser.add_argument('--pdf-dir', default=None, help="합성 PDF 보관 디렉토리 (기본값: 임시 디렉토리)")
+    parser.add_argument('--format', choices=['json', 'jsonl'], default='json')
+    parser.add_argument('--compress', choices=['none', 'gzip', 'zstd'], default='none')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--chunk-overlap', type=int, default=150)
+    parser.add_argument('--chunker', choices=['native', 'langchain'], default='native')
+    parser.add_argument('--unstructured-strategy', default='fast')
+    parser.add_argument('--no-unstructured', dest='unstructured', action='store_false',
+                        help="parse_with_unstructured 단계 생략")
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로 (기본값: 표준 출력)")
+    parser.add_argument('--compare', default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument('--max-regression', type=float, default=None,
+                        help="--compare 시 이 배수보다 느려진 단계가 있으면 exit code 1")
+    args = parser.parse_args()
+
+    options = {
+        "seed": args.seed,
+        "repeat": max(1, args.repeat),
+        "format": args.format,
+        "compression": None if args.compress == "none" else args.compress,
+        "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
+        "chunker": args.chunker,
+        "unstructured": args.unstructured,
+        "unstructured_strategy": args.unstructured_strategy,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        documents = run_benchmark(args.sizes, args.pdf_dir or tmp_dir, options)
+
+    results = {
+        "schema": SCHEMA_VERSION,
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment_info(),
+        "config": {"sizes": args.sizes, **options},
+        "documents": documents,
+    }
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"✅ 결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print(f"❌ 성능 저하 {len(regressions)}건 (기준 x{args.max_regression})")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+메모리 제한 모드(--memory-budget-mb) 최대 RSS 회귀 검사
+
+합성 RFP PDF(기본 800페이지)를 새 프로세스에서 변환하고 최대 RSS가 상한을 넘으면 exit code 1을 반환한다.
+- --compare-unbounded: 같은 문서를 기본 모드로도 변환해 최대 RSS와 청크 출력이 같은지 함께 확인
+- CI에서 실행하는 것을 전제로 하며 결과는 JSON으로 출력한다.
+
+사용법:
+    python -m benchmarks.memory_ceiling
+    python -m benchmarks.memory_ceiling --pages 800 --budget-mb 512 --ceiling-mb 600 --compare-unbounded
+"""
+import sys
+import json
+import argparse
+import filecmp
+import tempfile
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.synthetic_pdf import make_rfp_pdf
+
+
+def _convert(pdf_path, output_dir, memory_budget_mb):
+    """
+    프로세스 풀 워커: PDF 한 개를 변환하고 (최대 RSS, 청크 수) 반환
+    """
+    import io
+    import logging
+    from contextlib import redirect_stdout, redirect_stderr
+    from pdf_parser.converter import PDFConverter
+    from pdf_parser.utils.instrumentation import peak_rss_mb
+
+    logging.disable(logging.WARNING)
+    converter = PDFConverter(input_dir=Path(pdf_path).parent, output_dir=output_dir,
+                             unstructured_mode="off", memory_budget_mb=memory_budget_mb)
+    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        converter.convert_single_pdf(Path(pdf_path))
+    metrics = converter.metrics[0]
+    return {"status": metrics.status, "peak_rss_mb": round(peak_rss_mb(), 1), "chunks": metrics.chunks,
+            "total_sec": round(metrics.wall("total"), 2)}
+
+
+def run_isolated(pdf_path, output_dir, memory_budget_mb):
+    # spawn: 부모 프로세스 메모리를 물려받지 않은 새 프로세스에서 측정
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_convert, str(pdf_path), str(output_dir), memory_budget_mb).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메모리 제한 모드 최대 RSS 회귀 검사")
+    parser.add_argument('--pages', type=int, default=800, help="합성 PDF 페이지 수 (기본값: 800)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--budget-mb', type=int, default=512, help="--memory-budget-mb 값 (기본값: 512)")
+    parser.add_argument('--ceiling-mb', type=float, default=None, help="허용 최대 RSS (기본값: budget-mb)")
+    parser.add_argument('--pdf', default=None, help="합성 PDF 대신 사용할 PDF 경로")
+    parser.add_argument('--compare-unbounded', action='store_true', help="기본 모드로도 변환해 RSS와 출력 비교")
+    args = parser.parse_args()
+    ceiling = args.ceiling_mb or args.budget_mb
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        pdf_path = Path(args.pdf) if args.pdf else tmp_dir / f"rfp_{args.pages}p_seed{args.seed}.pdf"
+        if not args.pdf:
+            make_rfp_pdf(pdf_path, args.pages, args.seed)
+
+        results = {"pdf": pdf_path.name, "budget_mb": args.budget_mb, "ceiling_mb": ceiling,
+                   "bounded": run_isolated(pdf_path, tmp_dir / "bounded", args.budget_mb)}
+        if args.compare_unbounded:
+            results["unbounded"] = run_isolated(pdf_path, tmp_dir / "unbounded", None)
+            output_name = f"{pdf_path.stem}_chunked.json"
+            results["identical_output"] = filecmp.cmp(tmp_dir / "bounded" / output_name,
+                                                      tmp_dir / "unbounded" / output_name, shallow=False)
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    bounded = results["bounded"]
+    if bounded["status"] != "success":
+        print(f"❌ 변환 실패: {bounded['status']}")
+        sys.exit(1)
+    if bounded["peak_rss_mb"] > ceiling:
+        print(f"❌ 최대 RSS {bounded['peak_rss_mb']}MB > 상한 {ceiling}MB")
+        sys.exit(1)
+    if results.get("identical_output") is False:
+        print("❌ 메모리 제한 모드 출력이 기본 모드와 다릅니다")
+        sys.exit(1)
+    print(f"✅ 최대 RSS {bounded['peak_rss_mb']}MB <= 상한 {ceiling}MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+pdf_parser CLI 시작 시간 검사 (python -X importtime 기반)
+
+새 프로세스에서 `python -X importtime -c "import <모듈>"`을 반복 실행해 모듈별 누적 import 시간을 재고,
+`python -m pdf_parser.cli --help` 전체 실행 시간도 함께 측정한다.
+- 무거운 의존성(unstructured, langchain, fitz/pymupdf, pdfplumber, numpy, tiktoken)이
+  CLI import 시점에 로드되면 실패로 본다. (실제 사용 시점에 불러와야 함)
+- pdf_parser.cli import 시간이 --budget-ms를 넘으면 exit code 1 (CI 검사용)
+- 반복 측정 중 최솟값을 사용하며 결과는 JSON으로 출력한다.
+
+사용법:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget-ms 100 --repeat 10 --top 15
+"""
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+# CLI 시작 시 로드되면 안 되는 무거운 패키지 (최상위 패키지 이름)
+HEAVY_PACKAGES = ("unstructured", "langchain", "langchain_text_splitters", "fitz", "pymupdf", "pdfplumber",
+                  "numpy", "tiktoken")
+DEFAULT_BUDGET_MS = 150.0
+
+
+def parse_importtime(stderr):
+    """
+    -X importtime 출력 파싱
+    - 반환값: [(모듈 이름, self ms, 누적 ms, 깊이), ...] (출력 순서 = import가 끝난 순서)
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            depth = (len(name) - len(name.lstrip())) // 2
+            records.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000, depth))
+        except ValueError:
+            continue
+    return records
+
+
+def measure_import(module, repeat):
+    """module import를 repeat회 측정, 누적 시간이 가장 짧은 회차의 결과 반환"""
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+        records = parse_importtime(result.stderr)
+        total = next((cum for name, _, cum, _ in reversed(records) if name == module), None)
+        if total is not None and (best is None or total < best[0]):
+            best = (total, records)
+    return best
+
+
+def measure_help(repeat):
+    """python -m pdf_parser.cli --help 전체 실행 시간(ms), repeat회 중 최솟값"""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "pdf_parser.cli", "--help"], capture_output=True, check=True)
+        elapsed = (time.perf_counter() - t0) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def heavy_modules(records):
+    loaded = sorted({name.split(".")[0] for name, *_ in records})
+    return [name for name in loaded if name in HEAVY_PACKAGES]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pdf_parser CLI 시작 시간 검사 (-X importtime)")
+    parser.add_argument('--module', default="pdf_parser.cli", help="검사할 모듈 (기본값: pdf_parser.cli)")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"모듈 누적 import 시간 상한(ms), 넘으면 exit code 1 (기본값: {DEFAULT_BUDGET_MS:.0f})")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 측정 횟수 (최솟값 사용, 기본값: 5)")
+    parser.add_argument('--top', type=int, default=10, help="출력할 느린 모듈 수 (self 시간 기준)")
+    parser.add_argument('--allow-heavy', action='store_true', help="무거운 의존성이 로드돼도 실패로 보지 않음")
+    args = parser.parse_args()
+    repeat = max(1, args.repeat)
+
+    total_ms, records = measure_import(args.module, repeat)
+    converter_ms, _ = measure_import("pdf_parser.converter", repeat)
+    heavy = heavy_modules(records)
+    slowest = sorted(records, key=lambda r: r[1], reverse=True)[:args.top]
+    results = {
+        "python": sys.version.split()[0],
+        "module": args.module,
+        "import_ms": round(total_ms, 1),
+        "budget_ms": args.budget_ms,
+        "converter_import_ms": round(converter_ms, 1),
+        "help_wall_ms": round(measure_help(repeat), 1),
+        "heavy_modules": heavy,
+        "slowest_modules": [{"module": name, "self_ms": round(self_ms, 2), "cumulative_ms": round(cum_ms, 2)}
+                            for name, self_ms, cum_ms, _ in slowest],
+    }
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+    failed = False
+    if heavy and not args.allow_heavy:
+        print(f"❌ {args.module} import 시 무거운 의존성 로드: {', '.join(heavy)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"❌ {args.module} import {total_ms:.1f}ms > 예산 {args.budget_ms:.0f}ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print(f"✅ {args.module} import {total_ms:.1f}ms <= 예산 {args.budget_ms:.0f}ms")
+
+if __name__ == "__main__":
+    main()
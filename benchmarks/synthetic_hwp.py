@@ -0,0 +1,294 @@
+"""
+벤치마크/검증용 합성 RFP(제안요청서) HWP 5.0 생성기
+
+같은 (paragraphs, seed)이면 항상 같은 바이트의 HWP 파일을 만든다.
+- olefile은 OLE 복합 파일을 새로 만들 수 없으므로 최소한의 CFB(v3, 512바이트 섹터) writer를 포함한다.
+- 본문은 BodyText/SectionN 스트림에 PARA_HEADER / PARA_TEXT / PARA_CHAR_SHAPE / PARA_LINE_SEG 레코드로 기록하고
+  raw deflate로 압축한다. (--uncompressed로 비압축 문서도 생성)
+- 탭/줄 나눔/하이퍼링크 필드 같은 컨트롤 문자, 표(셀 문단이 하위 레벨에 중첩), 4095바이트를 넘는 긴 문단
+  (확장 레코드 크기)을 섞는다.
+- make_rfp_hwp는 hwp_parser.iter_paragraphs가 돌려줘야 하는 문단 리스트를 함께 반환한다.
+
+사용법:
+    python -m benchmarks.synthetic_hwp bench_hwp/rfp_2000.hwp --paragraphs 2000
+"""
+import zlib
+import random
+import struct
+import argparse
+from pathlib import Path
+from benchmarks.synthetic_pdf import ROMAN, KOREAN_ITEMS, SECTION_TITLES, TABLE_HEADERS, TABLE_CELLS, _sentence
+
+# ---------------------------------------------------------------------------
+# 최소 CFB(OLE 복합 파일) writer
+# ---------------------------------------------------------------------------
+SECTOR_SIZE = 512
+MINI_SECTOR_SIZE = 64
+MINI_STREAM_CUTOFF = 4096
+FREESECT, ENDOFCHAIN, FATSECT, NOSTREAM = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD, 0xFFFFFFFF
+_STORAGE, _STREAM, _ROOT = 1, 2, 5
+
+
+def _chain(start, count):
+    """start부터 연속된 count개 섹터의 FAT 체인"""
+    return [start + i + 1 for i in range(count - 1)] + [ENDOFCHAIN] if count else []
+
+
+def _pad(data, size):
+    return data + b"\x00" * (-len(data) % size)
+
+
+def write_ole_file(path, streams):
+    """
+    streams({"FileHeader": bytes, "BodyText/Section0": bytes, ...})로 OLE 복합 파일 생성
+    - MINI_STREAM_CUTOFF 미만 스트림은 mini stream에, 나머지는 일반 섹터에 연속으로 기록한다.
+    - DIFAT 확장 섹터는 만들지 않으므로 파일 크기는 약 7MB(FAT 섹터 109개)까지
+    """
+    entries = [{"name": "Root Entry", "type": _ROOT, "children": []}]
+    storages = {}
+    for stream_path, data in streams.items():
+        parent = 0
+        parts = stream_path.split("/")
+        for depth, part in enumerate(parts[:-1]):
+            key = "/".join(parts[:depth + 1])
+            if key not in storages:
+                storages[key] = len(entries)
+                entries.append({"name": part, "type": _STORAGE, "children": []})
+                entries[parent]["children"].append(storages[key])
+            parent = storages[key]
+        entries[parent]["children"].append(len(entries))
+        entries.append({"name": parts[-1], "type": _STREAM, "data": data, "children": []})
+
+    # mini stream / 일반 섹터 배치
+    mini_stream, mini_fat = bytearray(), []
+    big_streams = []
+    for entry in entries:
+        data = entry.get("data")
+        if data is None:
+            continue
+        entry["size"] = len(data)
+        if len(data) < MINI_STREAM_CUTOFF:
+            start = len(mini_stream) // MINI_SECTOR_SIZE
+            count = -(-len(data) // MINI_SECTOR_SIZE)
+            entry["start"] = start if count else ENDOFCHAIN
+            mini_fat.extend(_chain(start, count))
+            mini_stream += _pad(data, MINI_SECTOR_SIZE)
+        else:
+            big_streams.append(entry)
+
+    dir_count = -(-len(entries) // (SECTOR_SIZE // 128))
+    mini_fat_count = -(-len(mini_fat) // (SECTOR_SIZE // 4))
+    mini_stream_count = -(-len(mini_stream) // SECTOR_SIZE)
+    big_counts = [-(-len(e["data"]) // SECTOR_SIZE) for e in big_streams]
+    others = dir_count + mini_fat_count + mini_stream_count + sum(big_counts)
+    fat_count = 1
+    while fat_count * (SECTOR_SIZE // 4) < fat_count + others:
+        fat_count += 1
+    if fat_count > 109:
+        raise ValueError("파일이 너무 큽니다 (DIFAT 확장 미지원)")
+
+    fat = [FATSECT] * fat_count
+    dir_start = len(fat)
+    fat.extend(_chain(dir_start, dir_count))
+    mini_fat_start = len(fat) if mini_fat_count else ENDOFCHAIN
+    fat.extend(_chain(len(fat), mini_fat_count))
+    mini_stream_start = len(fat) if mini_stream_count else ENDOFCHAIN
+    fat.extend(_chain(len(fat), mini_stream_count))
+    for entry, count in zip(big_streams, big_counts):
+        entry["start"] = len(fat)
+        fat.extend(_chain(len(fat), count))
+    fat.extend([FREESECT] * (fat_count * (SECTOR_SIZE // 4) - len(fat)))
+    entries[0]["start"], entries[0]["size"] = mini_stream_start, len(mini_stream)
+
+    # 디렉토리: 형제 노드는 (이름 길이, 대문자 이름) 순서의 균형 이진 트리로 연결 (모두 black)
+    for entry in entries:
+        entry.setdefault("left", NOSTREAM)
+        entry.setdefault("right", NOSTREAM)
+    def build_tree(ids):
+        if not ids:
+            return NOSTREAM
+        mid = len(ids) // 2
+        node = entries[ids[mid]]
+        node["left"], node["right"] = build_tree(ids[:mid]), build_tree(ids[mid + 1:])
+        return ids[mid]
+    for entry in entries:
+        children = sorted(entry["children"], key=lambda i: (len(entries[i]["name"]), entries[i]["name"].upper()))
+        entry["child"] = build_tree(children)
+
+    directory = bytearray()
+    for entry in entries:
+        name = (entry["name"] + "\x00").encode("utf-16-le")
+        directory += struct.pack("<64sHBBIII16sIQQIQ", name, len(name), entry["type"], 1,
+                                 entry["left"], entry["right"], entry["child"], b"\x00" * 16, 0, 0, 0,
+                                 entry.get("start", 0), entry.get("size", 0))
+    empty_entry = struct.pack("<64sHBBIII16sIQQIQ", b"", 0, 0, 0, NOSTREAM, NOSTREAM, NOSTREAM,
+                              b"\x00" * 16, 0, 0, 0, 0, 0)
+    while len(directory) < dir_count * SECTOR_SIZE:
+        directory += empty_entry
+
+    difat = list(range(fat_count)) + [FREESECT] * (109 - fat_count)
+    header = struct.pack("<8s16sHHHHH6sIIIIIIIII", b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1", b"\x00" * 16,
+                         0x3E, 3, 0xFFFE, 9, 6, b"\x00" * 6, 0, fat_count, dir_start, 0,
+                         MINI_STREAM_CUTOFF, mini_fat_start, mini_fat_count, ENDOFCHAIN, 0)
+    header += struct.pack("<109I", *difat)
+
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(struct.pack(f"<{len(fat)}I", *fat))
+        f.write(directory)
+        f.write(_pad(struct.pack(f"<{len(mini_fat)}I", *mini_fat), SECTOR_SIZE) if mini_fat else b"")
+        f.write(_pad(bytes(mini_stream), SECTOR_SIZE))
+        for entry in big_streams:
+            f.write(_pad(entry["data"], SECTOR_SIZE))
+
+
+# ---------------------------------------------------------------------------
+# HWP 본문 레코드
+# ---------------------------------------------------------------------------
+HWPTAG_BEGIN = 0x10
+TAG_PARA_HEADER, TAG_PARA_TEXT, TAG_PARA_CHAR_SHAPE, TAG_PARA_LINE_SEG = (HWPTAG_BEGIN + 50, HWPTAG_BEGIN + 51,
+                                                                          HWPTAG_BEGIN + 52, HWPTAG_BEGIN + 53)
+TAG_CTRL_HEADER, TAG_LIST_HEADER, TAG_TABLE = HWPTAG_BEGIN + 55, HWPTAG_BEGIN + 56, HWPTAG_BEGIN + 61
+
+
+def _record(tag_id, level, data):
+    if len(data) < 0xFFF:
+        return struct.pack("<I", tag_id | level << 10 | len(data) << 20) + data
+    return struct.pack("<II", tag_id | level << 10 | 0xFFF << 20, len(data)) + data
+
+
+def _control(code, ctrl_id=b"    "):
+    """8 WCHAR 컨트롤 (코드, 컨트롤 ID 4바이트, 부가 정보 8바이트, 코드)"""
+    return struct.pack("<H", code) + ctrl_id[::-1] + b"\x0d\x00\x0a\x00\x01\x00\x00\x00" + struct.pack("<H", code)
+
+
+def _paragraph(level, units):
+    """units(bytes 조각 리스트, 마지막에 문단 끝 13 추가)로 문단 레코드 묶음 생성"""
+    text = b"".join(units) + struct.pack("<H", 13)
+    nchars = len(text) // 2
+    header = struct.pack("<IIHBBHHHI", nchars, 0, 0, 0, 0, 1, 0, 1, 0)
+    return (_record(TAG_PARA_HEADER, level, header) + _record(TAG_PARA_TEXT, level + 1, text)
+            + _record(TAG_PARA_CHAR_SHAPE, level + 1, struct.pack("<II", 0, 0))
+            + _record(TAG_PARA_LINE_SEG, level + 1, b"\x00" * 36))
+
+
+def _text(s):
+    return s.encode("utf-16-le")
+
+
+def _body_paragraph(rng):
+    """
+    본문 문단 하나 (레코드 bytes, 기대 텍스트)
+    - 문장 사이에 탭/줄 나눔/묶음 빈칸/하이퍼링크 필드를 섞는다.
+    """
+    units, expected = [], []
+    for i in range(rng.randint(2, 6)):
+        if i:
+            kind = rng.random()
+            if kind < 0.1:
+                units.append(_control(9, b"    "))
+                expected.append("\t")
+            elif kind < 0.2:
+                units.append(struct.pack("<H", 10))
+                expected.append("\n")
+            elif kind < 0.25:
+                units.append(struct.pack("<H", 30))
+                expected.append(" ")
+            elif kind < 0.3:
+                # 하이퍼링크 필드: 필드 시작(확장 컨트롤 3) ... 필드 끝(인라인 컨트롤 4)
+                units += [_control(3, b"%hlk"), _text("링크"), _control(4, b"%hlk")]
+                expected.append("링크")
+            else:
+                units.append(_text(" "))
+                expected.append(" ")
+        sentence = _sentence(rng)
+        units.append(_text(sentence))
+        expected.append(sentence)
+    return _paragraph(0, units), "".join(expected)
+
+
+def _table(rng):
+    """표를 담은 문단 (레코드 bytes, 기대 문단 리스트) - 셀 문단은 표 컨트롤 아래 레벨에 중첩된다"""
+    header = rng.choice(TABLE_HEADERS)
+    rows, cols = rng.randint(2, 6), len(header)
+    caption = f"[표] {rng.choice(SECTION_TITLES)}"
+    records = _paragraph(0, [_text(caption), _control(11, b"tbl ")])
+    records += _record(TAG_CTRL_HEADER, 1, b"tbl "[::-1] + b"\x00" * 40)
+    records += _record(TAG_TABLE, 2, struct.pack("<IHH", 0, rows, cols) + b"\x00" * 16)
+    expected = [caption]
+    for r in range(rows):
+        for c in range(cols):
+            cell = header[c] if r == 0 else f"{rng.choice(TABLE_CELLS)}{r}-{c}"
+            records += _record(TAG_LIST_HEADER, 2, struct.pack("<HI", 1, 0) + b"\x00" * 26)
+            records += _paragraph(2, [_text(cell)])
+            expected.append(cell)
+    return records, expected
+
+
+def make_rfp_hwp(path, paragraphs=500, seed=0, compressed=True, section_paragraphs=400, long_paragraphs=True):
+    """
+    합성 RFP HWP 생성
+    - section_paragraphs개 문단마다 섹션을 나눈다. (None이면 한 섹션)
+    - long_paragraphs=False이면 확장 레코드 크기를 쓰는 긴 문단을 넣지 않는다. (HWPLoader 비교용)
+    - 반환값: iter_paragraphs가 돌려줘야 하는 문단 텍스트 리스트
+    """
+    rng = random.Random(seed)
+    sections, expected = [], []
+    body, count = bytearray(), 0
+    chapter, sub = 0, 0
+    while count < paragraphs:
+        kind = rng.random()
+        if kind < 0.08 or count == 0:
+            title = f"{ROMAN[chapter % len(ROMAN)]}. {SECTION_TITLES[chapter % len(SECTION_TITLES)]}"
+            chapter, sub = chapter + 1, 0
+            records, texts = _paragraph(0, [_text(title)]), [title]
+        elif kind < 0.2:
+            title = f"{KOREAN_ITEMS[sub % len(KOREAN_ITEMS)]}. {rng.choice(SECTION_TITLES)}"
+            sub += 1
+            records, texts = _paragraph(0, [_text(title)]), [title]
+        elif kind < 0.3:
+            records, texts = _table(rng)
+        elif kind < 0.32 and long_paragraphs:
+            # 확장 레코드 크기(0xFFF 이상)를 쓰는 긴 문단
+            text = " ".join(_sentence(rng) for _ in range(150))
+            records, texts = _paragraph(0, [_text(text)]), [text]
+        elif kind < 0.35:
+            records, texts = _paragraph(0, []), []  # 빈 문단
+        else:
+            records, texts = _body_paragraph(rng)
+            texts = [texts]
+        body += records
+        expected.extend(texts)
+        count += 1
+        if (section_paragraphs and count % section_paragraphs == 0) or count == paragraphs:
+            sections.append(bytes(body))
+            body = bytearray()
+
+    streams = {
+        "FileHeader": struct.pack("<32sII", b"HWP Document File", 0x05000300, 1 if compressed else 0).ljust(256, b"\x00"),
+        "DocInfo": b"",
+        "\x05HwpSummaryInformation": b"\xfe\xff" + b"\x00" * 46,
+    }
+    for i, section in enumerate(sections):
+        if compressed:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            section = compressor.compress(section) + compressor.flush()
+        streams[f"BodyText/Section{i}"] = section
+    write_ole_file(path, streams)
+    return expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 RFP HWP 생성")
+    parser.add_argument('output', help="저장할 HWP 경로")
+    parser.add_argument('--paragraphs', type=int, default=500, help="문단(제목/본문/표) 수 (기본값: 500)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--uncompressed', action='store_true', help="본문 스트림을 압축하지 않음")
+    args = parser.parse_args()
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    expected = make_rfp_hwp(args.output, args.paragraphs, args.seed, compressed=not args.uncompressed)
+    print(f"✅ {args.output} ({len(expected)}개 문단)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+벤치마크용 합성 RFP(제안요청서) PDF 생성기
+
+같은 (pages, seed)이면 항상 같은 바이트의 PDF를 만든다. (문서 ID/생성일 고정)
+- 한글 본문, 다단계 제목(Ⅰ. / 제 N 장 / 1.1 / 가.), 괘선 표, 빈 페이지를 섞는다.
+- fitz 내장 CJK 글꼴("korea")을 사용하므로 별도 글꼴 파일이 필요 없다.
+
+사용법:
+    python -m benchmarks.synthetic_pdf bench_pdfs/rfp_100.pdf --pages 100
+"""
+import random
+import argparse
+from pathlib import Path
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 (pt)
+MARGIN_X, MARGIN_TOP, MARGIN_BOTTOM = 50, 60, 60
+FONT = "korea"
+
+# 페이지 종류 비율 (나머지는 본문만 있는 페이지)
+BLANK_RATIO = 0.05
+TABLE_RATIO = 0.3
+
+ROMAN = ["Ⅰ", "Ⅱ", "Ⅲ", "Ⅳ", "Ⅴ", "Ⅵ", "Ⅶ", "Ⅷ", "Ⅸ", "Ⅹ"]
+KOREAN_ITEMS = ["가", "나", "다", "라", "마", "바", "사", "아"]
+SECTION_TITLES = ["사업 개요", "추진 배경 및 필요성", "사업 범위", "제안 요청 내용", "기술 요구사항",
+                  "보안 요구사항", "품질 관리 방안", "사업 관리 방안", "평가 기준", "제출 서류"]
+SUBJECTS = ["본 사업은", "수행사는", "발주기관은", "제안사는", "시스템은", "사업관리자는"]
+OBJECTS = ["정보시스템 고도화를", "데이터 표준화를", "클라우드 전환을", "보안 취약점 점검을",
+           "운영 유지보수를", "성능 개선을", "사용자 교육을", "산출물 관리를"]
+VERBS = ["수행하여야 한다.", "제안하여야 한다.", "지원하여야 한다.", "보장하여야 한다.",
+         "준수하여야 한다.", "검토하여야 한다."]
+TABLE_HEADERS = [["구분", "요구사항", "비고"], ["항목", "내용", "배점"], ["단계", "산출물", "기한"]]
+TABLE_CELLS = ["기능", "성능", "보안", "품질", "데이터", "인터페이스", "필수", "선택", "10점", "20점", "1개월"]
+
+
+def _sentence(rng):
+    return f"{rng.choice(SUBJECTS)} {rng.choice(OBJECTS)} {rng.choice(VERBS)}"
+
+
+def _paragraph_lines(rng, line_chars=38):
+    """한 문단 분량의 문장을 line_chars 글자 단위 줄로 나눠 반환"""
+    text = " ".join(_sentence(rng) for _ in range(rng.randint(2, 5)))
+    return [text[i:i + line_chars] for i in range(0, len(text), line_chars)]
+
+
+def _draw_table(page, rng, x0, y0, rows, cols, cell_w=150, cell_h=20):
+    """괘선 표 그리기 (fitz find_tables / pdfplumber extract_table 의 lines 전략이 인식하는 형태)"""
+    header = rng.choice(TABLE_HEADERS)[:cols]
+    for r in range(rows + 1):
+        page.draw_line((x0, y0 + r * cell_h), (x0 + cols * cell_w, y0 + r * cell_h))
+    for c in range(cols + 1):
+        page.draw_line((x0 + c * cell_w, y0), (x0 + c * cell_w, y0 + rows * cell_h))
+    for r in range(rows):
+        for c in range(cols):
+            text = header[c] if r == 0 else f"{rng.choice(TABLE_CELLS)}{r}-{c}"
+            page.insert_text((x0 + c * cell_w + 5, y0 + r * cell_h + 14), text, fontname=FONT, fontsize=9)
+    return y0 + rows * cell_h
+
+
+def _fill_page(page, rng, page_index, state, with_table):
+    y = MARGIN_TOP
+    bottom = PAGE_HEIGHT - MARGIN_BOTTOM
+
+    # 장이 바뀌는 페이지에는 상위 제목을 넣는다
+    if page_index % 10 == 0:
+        chapter = state["chapter"] = state["chapter"] + 1
+        state["section"] = 0
+        page.insert_text((MARGIN_X, y), f"{ROMAN[(chapter - 1) % len(ROMAN)]}. {SECTION_TITLES[(chapter - 1) % len(SECTION_TITLES)]}",
+                         fontname=FONT, fontsize=16)
+        y += 32
+        page.insert_text((MARGIN_X, y), f"제 {chapter} 장 {rng.choice(SECTION_TITLES)}", fontname=FONT, fontsize=14)
+        y += 28
+
+    state["section"] += 1
+    page.insert_text((MARGIN_X, y), f"{max(state['chapter'], 1)}.{state['section']} {rng.choice(SECTION_TITLES)}",
+                     fontname=FONT, fontsize=12)
+    y += 24
+
+    table_drawn = not with_table
+    for k, item in enumerate(KOREAN_ITEMS):
+        if not table_drawn and k == 1:
+            rows, cols = rng.randint(3, 6), 3
+            if y + rows * 20 + 20 > bottom:
+                break
+            y = _draw_table(page, rng, MARGIN_X, y + 6, rows, cols) + 20
+            table_drawn = True
+        lines = _paragraph_lines(rng)
+        if y + 20 + len(lines) * 14 > bottom:
+            break
+        page.insert_text((MARGIN_X + 10, y), f"{item}. {rng.choice(OBJECTS)[:-1]} 관련 요구사항", fontname=FONT, fontsize=11)
+        y += 18
+        for line in lines:
+            page.insert_text((MARGIN_X + 20, y), line, fontname=FONT, fontsize=9)
+            y += 14
+        y += 6
+
+    # 하단 쪽번호 (clean_text가 제거하는 "- N -" 형식)
+    page.insert_text((PAGE_WIDTH / 2 - 10, PAGE_HEIGHT - 30), f"- {page_index + 1} -", fontname=FONT, fontsize=9)
+
+
+def make_rfp_pdf(path, pages, seed=0):
+    """
+    합성 RFP PDF 생성
+    - 반환값: 페이지 종류 통계 {"blank": n, "table": n, "text": n}
+    """
+    import fitz
+    rng = random.Random(seed * 100003 + pages)
+    doc = fitz.open()
+    state = {"chapter": 0, "section": 0}
+    stats = {"blank": 0, "table": 0, "text": 0}
+    for i in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        roll = rng.random()
+        # 첫 페이지는 항상 본문 (문서 제목 / doc_id 생성 경로를 타도록)
+        if i > 0 and roll < BLANK_RATIO:
+            stats["blank"] += 1
+            continue
+        with_table = roll < BLANK_RATIO + TABLE_RATIO
+        stats["table" if with_table else "text"] += 1
+        _fill_page(page, rng, i, state, with_table)
+
+    doc.set_metadata({"title": f"synthetic-rfp-{pages}-{seed}", "producer": "benchmarks.synthetic_pdf",
+                      "creationDate": "", "modDate": ""})
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc.save(path, garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 RFP PDF 생성")
+    parser.add_argument('output', help="생성할 PDF 경로")
+    parser.add_argument('--pages', type=int, default=100, help="페이지 수 (기본값: 100)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    stats = make_rfp_pdf(args.output, args.pages, args.seed)
+    print(f"✅ {args.output}: {args.pages}페이지 (빈 {stats['blank']} / 표 {stats['table']} / 본문 {stats['text']})")
+
+if __name__ == "__main__":
+    main()
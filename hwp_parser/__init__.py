@@ -0,0 +1 @@
+from .reader import iter_paragraphs, extract_hwp_text, read_file_header, HWPError
\ No newline at end of file
@@ -0,0 +1,186 @@
+import re
+import zlib
+import struct
+import logging
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# HWP 5.0 문서 구조 (한글 문서 파일 형식 5.0 공개 문서 기준)
+# - OLE 복합 파일 안에 FileHeader, BodyText/Section0, Section1, ... 스트림이 있다.
+# - 본문 스트림은 레코드의 나열이며, 문서 속성에 압축 플래그가 있으면 raw deflate(zlib -15)로 압축돼 있다.
+# - 레코드 헤더(4바이트): tag id 10비트 / level 10비트 / size 12비트, size가 0xFFF이면 뒤 4바이트가 실제 크기
+# ---------------------------------------------------------------------------
+HWP_SIGNATURE = b"HWP Document File"
+FILE_HEADER_SIZE = 256
+
+# FileHeader 문서 속성 플래그
+FLAG_COMPRESSED = 0x01
+FLAG_PASSWORD = 0x02
+FLAG_DISTRIBUTION = 0x04
+
+HWPTAG_BEGIN = 0x10
+HWPTAG_PARA_HEADER = HWPTAG_BEGIN + 50
+HWPTAG_PARA_TEXT = HWPTAG_BEGIN + 51
+
+# 본문 스트림을 한 번에 읽는 크기 (압축 해제 전)
+READ_SIZE = 64 * 1024
+
+# PARA_TEXT 제어 문자: 문자 컨트롤은 1 WCHAR, 인라인/확장 컨트롤은 8 WCHAR(16바이트)를 차지한다
+_CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+_CONTROL_TEXT = {
+    9: "\t",     # 탭 (인라인 컨트롤)
+    10: "\n",    # 줄 나눔
+    24: "-",     # 하이픈
+    30: " ",     # 묶음 빈칸
+    31: " ",     # 고정폭 빈칸
+}
+# UTF-16LE에서 0x00~0x1F 코드 유닛 (짝수 오프셋에서 매칭된 것만 제어 문자)
+_CONTROL_UNIT = re.compile(rb"[\x00-\x1f]\x00")
+
+
+class HWPError(Exception):
+    """HWP 파일을 읽을 수 없음 (형식 오류, 암호/배포용 문서 등)"""
+
+
+def read_file_header(ole):
+    """
+    FileHeader 스트림 파싱
+    - 반환값: {"version": "5.0.3.0", "compressed": bool, "password": bool, "distribution": bool}
+    """
+    if not ole.exists("FileHeader"):
+        raise HWPError("FileHeader 스트림이 없습니다 (HWP 5.0 문서가 아님)")
+    data = ole.openstream("FileHeader").read(FILE_HEADER_SIZE)
+    if len(data) < 40 or not data.startswith(HWP_SIGNATURE):
+        raise HWPError("HWP 서명이 올바르지 않습니다")
+    version, flags = struct.unpack_from("<II", data, 32)
+    return {
+        "version": f"{version >> 24 & 0xFF}.{version >> 16 & 0xFF}.{version >> 8 & 0xFF}.{version & 0xFF}",
+        "compressed": bool(flags & FLAG_COMPRESSED),
+        "password": bool(flags & FLAG_PASSWORD),
+        "distribution": bool(flags & FLAG_DISTRIBUTION),
+    }
+
+
+def section_streams(ole):
+    """BodyText/SectionN 스트림 경로를 섹션 번호 순서대로"""
+    sections = []
+    for entry in ole.listdir(streams=True, storages=False):
+        if len(entry) == 2 and entry[0] == "BodyText" and entry[1].startswith("Section"):
+            try:
+                sections.append((int(entry[1][len("Section"):]), "/".join(entry)))
+            except ValueError:
+                continue
+    return [path for _, path in sorted(sections)]
+
+
+def iter_records(stream, compressed, tags=None, read_size=READ_SIZE):
+    """
+    본문 스트림에서 레코드를 하나씩 (tag_id, level, data)로 yield
+    - 압축된 스트림은 zlib.decompressobj(-15)로 read_size씩 풀면서 완성된 레코드만 꺼내므로
+      압축 해제된 섹션 전체를 메모리에 올리지 않는다.
+    - tags를 주면 해당 tag id 레코드만 yield (나머지는 데이터를 복사하지 않고 건너뜀)
+    """
+    decompressor = zlib.decompressobj(-15) if compressed else None
+    pending = b""
+    while True:
+        raw = stream.read(read_size)
+        if not raw:
+            break
+        data = pending + (decompressor.decompress(raw) if decompressor else raw)
+        consumed = yield from _parse_records(data, tags)
+        pending = data[consumed:]
+    if decompressor:
+        pending += decompressor.flush()
+    consumed = yield from _parse_records(pending, tags)
+    if consumed < len(pending):
+        logging.warning(f"[hwp] 레코드가 잘린 채 끝남 ({len(pending) - consumed}바이트 무시)")
+
+
+def _parse_records(data, tags):
+    """data 앞에서부터 완성된 레코드를 yield하고, 소비한 바이트 수를 반환"""
+    unpack_from = struct.unpack_from
+    pos, size = 0, len(data)
+    while pos + 4 <= size:
+        header, = unpack_from("<I", data, pos)
+        tag_id, length = header & 0x3FF, header >> 20
+        start = pos + 4
+        if length == 0xFFF:
+            if start + 4 > size:
+                break
+            length, = unpack_from("<I", data, start)
+            start += 4
+        end = start + length
+        if end > size:
+            break
+        if tags is None or tag_id in tags:
+            yield tag_id, (header >> 10) & 0x3FF, data[start:end]
+        pos = end
+    return pos
+
+
+def decode_para_text(data):
+    """
+    PARA_TEXT 레코드(UTF-16LE)를 문자열로 변환
+    - 표/그림 등 확장 컨트롤과 필드 같은 인라인 컨트롤의 부가 데이터(7 WCHAR)는 건너뛰고,
+      탭/줄 나눔/묶음 빈칸 등은 대응하는 문자로 바꾼다. 문단 끝(13)은 버린다.
+    """
+    search = _CONTROL_UNIT.search
+    # 대부분의 문단은 끝의 문단 끝(13) 외에 제어 문자가 없다
+    if data.endswith(b"\r\x00") and search(data, 0, len(data) - 2) is None:
+        return data[:-2].decode("utf-16-le", errors="replace")
+    parts = []
+    pos, size = 0, len(data)
+    while pos < size:
+        match = search(data, pos)
+        while match is not None and match.start() % 2:
+            match = search(data, match.start() + 1)
+        if match is None:
+            parts.append(data[pos:].decode("utf-16-le", errors="replace"))
+            break
+        start = match.start()
+        if start > pos:
+            parts.append(data[pos:start].decode("utf-16-le", errors="replace"))
+        code = data[start]
+        parts.append(_CONTROL_TEXT.get(code, ""))
+        pos = start + (2 if code in _CHAR_CONTROLS else 16)
+    return "".join(parts)
+
+
+def iter_paragraphs(hwp_path, skip_empty=True):
+    """
+    HWP 문서의 문단 텍스트를 문서 순서대로 yield하는 제너레이터
+    - 섹션 스트림을 순서대로 열어 레코드를 스트리밍으로 읽으므로 메모리 사용량이 문서 크기와 무관하게 일정하다.
+      (olefile이 압축된 섹션 스트림 하나는 메모리로 읽는다)
+    - 표 셀 안의 문단도 문서에 나타나는 순서대로 하나의 문단으로 나온다.
+    - 암호가 걸린 문서와 배포용 문서(본문이 ViewText에 암호화됨)는 HWPError
+
+    사용 예:
+        for paragraph in iter_paragraphs("제안요청서.hwp"):
+            ...
+    """
+    import olefile
+
+    hwp_path = Path(hwp_path)
+    if not olefile.isOleFile(str(hwp_path)):
+        raise HWPError(f"OLE 복합 파일이 아닙니다 (HWPX 등 다른 형식일 수 있음): {hwp_path.name}")
+    with olefile.OleFileIO(str(hwp_path)) as ole:
+        header = read_file_header(ole)
+        if header["password"]:
+            raise HWPError(f"암호가 걸린 문서입니다: {hwp_path.name}")
+        if header["distribution"]:
+            raise HWPError(f"배포용 문서는 지원하지 않습니다: {hwp_path.name}")
+        sections = section_streams(ole)
+        if not sections:
+            raise HWPError(f"BodyText 섹션이 없습니다: {hwp_path.name}")
+        for section in sections:
+            with ole.openstream(section) as stream:
+                for _, _, data in iter_records(stream, header["compressed"], tags=(HWPTAG_PARA_TEXT,)):
+                    text = decode_para_text(data)
+                    if skip_empty and not text.strip():
+                        continue
+                    yield text
+
+
+def extract_hwp_text(hwp_path, separator="\n"):
+    """문서 전체 텍스트 (문단을 separator로 연결)"""
+    return separator.join(iter_paragraphs(hwp_path))
@@ -1 +1,2 @@
-from .pdf_to_markdown_mineru import process_pdfs_with_mineru
\ No newline at end of file
+from .pdf_to_markdown_mineru import process_pdfs_with_mineru
+from .mineru_scheduler import schedule_mineru, max_concurrent_jobs
@@ -0,0 +1,233 @@
+import os
+import time
+import glob
+import shlex
+import shutil
+import signal
+import tempfile
+import subprocess
+from pathlib import Path
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# mineru 실행 명령 (테스트 시 MINERU_CMD="python -m benchmarks.fake_mineru" 처럼 대체 실행 파일 지정)
+MINERU_CMD_ENV = "MINERU_CMD"
+DEFAULT_MINERU_CMD = "mineru"
+
+# 한 번의 mineru 실행에 넣는 PDF 수 (레이아웃 모델 로드 비용을 여러 PDF가 나눠 가짐)
+DEFAULT_BATCH_SIZE = 8
+# mineru 프로세스 하나에 할당하는 가상 VRAM(GB), 동시 실행 수 = vram_size // job_vram
+DEFAULT_JOB_VRAM_GB = 8
+# mineru 프로세스 하나가 쓰는 CPU 코어 수 (동시 실행 수 상한 계산용)
+DEFAULT_JOB_CPUS = 4
+# 제한 시간: 실행 한 번당 기본 시간 + PDF 한 개당 시간 (초)
+DEFAULT_STARTUP_TIMEOUT = 300
+DEFAULT_TIMEOUT_PER_PDF = 600
+DEFAULT_RETRIES = 1
+
+
+@dataclass
+class MineruJob:
+    """mineru 실행 한 번에 처리할 PDF 묶음"""
+    pdf_files: list
+    attempt: int = 0
+
+
+@dataclass
+class MineruJobResult:
+    job: MineruJob
+    returncode: int = None        # 제한 시간 초과 시 None
+    timed_out: bool = False
+    elapsed: float = 0.0
+    markdown: dict = None         # {pdf_file: md 경로} (이번 실행에서 만들어진 것만)
+    stderr: str = ""
+
+
+def mineru_command():
+    """MINERU_CMD 환경 변수(셸 문법)가 있으면 그 명령, 없으면 mineru"""
+    return shlex.split(os.environ.get(MINERU_CMD_ENV) or DEFAULT_MINERU_CMD)
+
+
+def max_concurrent_jobs(vram_size, job_vram=DEFAULT_JOB_VRAM_GB, job_cpus=DEFAULT_JOB_CPUS):
+    """
+    VRAM/CPU 예산 안에서 동시에 실행할 mineru 프로세스 수
+    - vram_size: 전체 가상 VRAM 예산(GB), job_vram: 프로세스당 VRAM(GB)
+    """
+    by_vram = int(float(vram_size) // float(job_vram)) if job_vram else 1
+    by_cpu = (os.cpu_count() or 1) // max(1, job_cpus)
+    return max(1, min(by_vram, by_cpu))
+
+
+def make_batches(pdf_files, batch_size, first_batch_size=None):
+    """
+    PDF 목록을 batch_size개씩 MineruJob으로 나눔
+    - first_batch_size를 주면 첫 묶음만 그 크기로 (첫 문서 결과를 빨리 받기 위함)
+    """
+    batch_size = max(1, int(batch_size))
+    head = min(max(1, int(first_batch_size or batch_size)), len(pdf_files))
+    jobs = [MineruJob(list(pdf_files[:head]))] if pdf_files else []
+    return jobs + [MineruJob(list(pdf_files[i:i + batch_size])) for i in range(head, len(pdf_files), batch_size)]
+
+
+def find_markdown(output_dir, pdf_file, since=None):
+    """
+    mineru 출력 Markdown 경로 (output_dir/<이름>/<방식>/<이름>.md), 없으면 None
+    - since(time.time())를 주면 그 이후에 수정된 파일만 인정 (이전 실행의 결과를 성공으로 보지 않음)
+    """
+    stem = Path(pdf_file).stem
+    for md_path in sorted(glob.glob(os.path.join(glob.escape(str(output_dir)), glob.escape(stem), "*", f"{glob.escape(stem)}.md"))):
+        if since is None or os.path.getmtime(md_path) >= since:
+            return md_path
+    return None
+
+
+def _stage_batch(pdf_files, staging_root):
+    """
+    PDF 묶음을 임시 디렉토리에 심볼릭 링크(불가능하면 복사)로 모아 디렉토리 경로 반환
+    - mineru -p에 디렉토리를 주면 한 번의 실행(모델 로드 1회)으로 안의 PDF를 모두 처리한다.
+    """
+    staging_dir = tempfile.mkdtemp(prefix="batch_", dir=staging_root)
+    for pdf_file in pdf_files:
+        target = os.path.join(staging_dir, os.path.basename(pdf_file))
+        try:
+            os.symlink(os.path.abspath(pdf_file), target)
+        except OSError:
+            shutil.copy2(pdf_file, target)
+    return staging_dir
+
+
+def _kill_process_group(process):
+    """mineru가 띄운 자식 프로세스까지 함께 종료"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_mineru_job(job, output_dir, staging_root, lang="korean", job_vram=DEFAULT_JOB_VRAM_GB,
+                   timeout=None, extra_args=None):
+    """
+    mineru를 한 번 실행해 job의 PDF들을 변환
+    - PDF가 여러 개면 임시 디렉토리에 모아 디렉토리 단위로 넘긴다.
+    - 제한 시간을 넘기면 프로세스 그룹 전체를 종료하고 timed_out=True
+    - 종료 코드와 무관하게 이번 실행에서 만들어진 Markdown만 성공으로 집계
+    """
+    env = os.environ.copy()
+    env["MINERU_VIRTUAL_VRAM_SIZE"] = str(job_vram)
+    staging_dir = _stage_batch(job.pdf_files, staging_root) if len(job.pdf_files) > 1 else None
+    source = staging_dir or job.pdf_files[0]
+    cmd = mineru_command() + ["-p", source, "-o", str(output_dir), "--lang", lang, "--output-format", "markdown"]
+    cmd += list(extra_args or [])
+
+    result = MineruJobResult(job)
+    started = time.time()
+    try:
+        process = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                   start_new_session=hasattr(os, "killpg"))
+        try:
+            _, result.stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process_group(process)
+            _, result.stderr = process.communicate()
+            result.timed_out = True
+        result.returncode = None if result.timed_out else process.returncode
+    except OSError as e:
+        result.stderr = f"{type(e).__name__}: {e}"
+    finally:
+        if staging_dir:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    result.elapsed = time.time() - started
+    # 파일 시스템 mtime 해상도를 고려해 1초 여유
+    result.markdown = {pdf_file: md_path for pdf_file in job.pdf_files
+                       if (md_path := find_markdown(output_dir, pdf_file, since=started - 1))}
+    return result
+
+
+def _retry_jobs(pdf_files, attempt):
+    """실패한 PDF 재시도 작업: 여러 개면 반으로 나눠 문제 PDF가 나머지를 계속 실패시키지 않도록 한다"""
+    if len(pdf_files) == 1:
+        return [MineruJob(pdf_files, attempt)]
+    middle = len(pdf_files) // 2
+    return [MineruJob(pdf_files[:middle], attempt), MineruJob(pdf_files[middle:], attempt)]
+
+
+def schedule_mineru(pdf_files, output_dir, vram_size="16", lang="korean", batch_size=DEFAULT_BATCH_SIZE,
+                    max_jobs=None, job_vram=None, startup_timeout=DEFAULT_STARTUP_TIMEOUT,
+                    timeout_per_pdf=DEFAULT_TIMEOUT_PER_PDF, retries=DEFAULT_RETRIES, on_complete=None,
+                    first_batch_size=None, extra_args=None):
+    """
+    PDF들을 묶음 단위로 mineru에 넘겨 동시에 여러 개 실행하는 스케줄러
+
+    - batch_size: mineru 실행 한 번에 넣는 PDF 수
+    - max_jobs: 동시 실행 수 (None이면 vram_size // job_vram 과 CPU 수로 계산)
+    - job_vram: 프로세스당 가상 VRAM(GB, None이면 min(vram_size, 8))
+    - 제한 시간: startup_timeout + timeout_per_pdf * 묶음 PDF 수 (timeout_per_pdf가 0/None이면 제한 없음)
+    - retries: 실패한 PDF 재시도 횟수, 묶음이 실패하면 반으로 나눠 다시 실행
+    - on_complete(pdf_file, md_path): PDF 하나의 Markdown이 만들어질 때마다 호출 (호출한 스레드에서 실행)
+      묶음이 끝나야 호출되므로 first_batch_size=1이면 첫 문서를 묶음 하나만큼 기다리지 않고 받는다.
+    - 실행은 동시 실행 수만큼만 넘기고, 다음 실행은 끝난 묶음의 on_complete가 모두 돌아온 뒤에 시작한다.
+      on_complete가 막히면(예: 정제 큐가 가득 참) 새 mineru 실행도 미뤄진다. (배압)
+    - 반환값: {"success": [...], "failed": [...], "total": N, "timeouts": [...]}
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pdf_files = list(pdf_files)
+    results = {"success": [], "failed": [], "total": len(pdf_files), "timeouts": []}
+    if not pdf_files:
+        return results
+
+    if job_vram is None:
+        job_vram = min(float(vram_size), DEFAULT_JOB_VRAM_GB)
+    job_vram = int(job_vram) if float(job_vram).is_integer() else job_vram
+    jobs = make_batches(pdf_files, batch_size, first_batch_size)
+    workers = max(1, min(max_jobs or max_concurrent_jobs(vram_size, job_vram), len(jobs)))
+    print(f"🗂 mineru 실행 {len(jobs)}회 (묶음 {max(1, int(batch_size))}개씩), 동시 실행 {workers}개, "
+          f"프로세스당 VRAM {job_vram}GB")
+
+    staging_root = tempfile.mkdtemp(prefix="_mineru_staging_", dir=output_dir)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            def submit(job):
+                timeout = (startup_timeout or 0) + timeout_per_pdf * len(job.pdf_files) if timeout_per_pdf else None
+                return executor.submit(run_mineru_job, job, output_dir, staging_root, lang, job_vram,
+                                       timeout, extra_args)
+
+            # 작업을 한꺼번에 넘기지 않고 빈 자리만큼만 넘긴다 (재시도는 앞에 넣어 먼저 실행)
+            queued = deque(jobs)
+            pending = set()
+            while queued or pending:
+                while queued and len(pending) < workers:
+                    pending.add(submit(queued.popleft()))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    job = result.job
+                    for pdf_file, md_path in result.markdown.items():
+                        print(f"✅ 성공: {os.path.basename(pdf_file)}")
+                        results["success"].append(pdf_file)
+                        if on_complete is not None:
+                            on_complete(pdf_file, md_path)
+                    missing = [pdf_file for pdf_file in job.pdf_files if pdf_file not in result.markdown]
+                    if not missing:
+                        continue
+
+                    reason = (f"제한 시간 초과 ({result.elapsed:.0f}s)" if result.timed_out
+                              else f"종료 코드 {result.returncode}")
+                    print(f"❌ mineru 실패 ({reason}): {', '.join(os.path.basename(p) for p in missing)}")
+                    if result.stderr:
+                        print("에러:", result.stderr[-2000:])
+                    if job.attempt < retries:
+                        for retry in reversed(_retry_jobs(missing, job.attempt + 1)):
+                            print(f"🔁 재시도 {retry.attempt}/{retries}: {len(retry.pdf_files)}개 PDF")
+                            queued.appendleft(retry)
+                        continue
+                    results["failed"].extend(missing)
+                    if result.timed_out:
+                        results["timeouts"].extend(missing)
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
+    return results
@@ -1,57 +1,39 @@
-import subprocess
-import os
 import glob
+from .mineru_scheduler import (schedule_mineru, DEFAULT_BATCH_SIZE, DEFAULT_RETRIES,
+                               DEFAULT_STARTUP_TIMEOUT, DEFAULT_TIMEOUT_PER_PDF)
 
-def process_pdfs_with_mineru(input_dir="/pdfs", output_dir="./output", vram_size="16", lang="korean"):
+def process_pdfs_with_mineru(input_dir="/pdfs", output_dir="./output", vram_size="16", lang="korean",
+                             batch_size=DEFAULT_BATCH_SIZE, max_jobs=None, job_vram=None,
+                             startup_timeout=DEFAULT_STARTUP_TIMEOUT, timeout_per_pdf=DEFAULT_TIMEOUT_PER_PDF,
+                             retries=DEFAULT_RETRIES, on_complete=None, first_batch_size=None):
     """
     MinerU를 사용해 PDF 파일들을 마크다운으로 변환
+    - PDF를 batch_size개씩 묶어 mineru 한 번에 넘기고(모델 로드 1회), VRAM 예산 안에서 여러 개를 동시에 실행
+    - batch_size=1, max_jobs=1이면 기존처럼 PDF마다 순서대로 실행
+    - 세부 옵션은 layout_parser.mineru_scheduler.schedule_mineru 참고
     """
-    # 환경 변수 설정
-    env = os.environ.copy()
-    env["MINERU_VIRTUAL_VRAM_SIZE"] = vram_size
-    
     # PDF 파일 찾기
-    pdf_files = glob.glob(f"{input_dir}/*.pdf")
-    
-    results = {
-        "success": [],
-        "failed": [],
-        "total": len(pdf_files)
-    }
-    
+    pdf_files = sorted(glob.glob(f"{glob.escape(input_dir)}/*.pdf"))
+
     if not pdf_files:
         print("PDF 파일을 찾을 수 없습니다.")
-        return results
-        
+        return {"success": [], "failed": [], "total": 0, "timeouts": []}
+
     print(f"{len(pdf_files)}개의 PDF 파일을 발견했습니다.")
-    
-    for pdf_file in pdf_files:
-        print(f"\n처리 중: {pdf_file}")
-        
-        cmd = [
-            "mineru", 
-            "-p", pdf_file,
-            "-o", output_dir,
-            "--lang", lang,
-            "--output-format", "markdown"
-        ]
-        
-        try:
-            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"✅ 성공: {os.path.basename(pdf_file)}")
-                results["success"].append(pdf_file)
-                print(result.stdout)
-            else:
-                print(f"❌ 실패: {os.path.basename(pdf_file)}")
-                print("에러:", result.stderr)
-                results["failed"].append(pdf_file)
-                
-        except Exception as e:
-            print(f"❌ 예외 발생: {pdf_file}")
-            print(f"에러: {e}")
-            results["failed"].append(pdf_file)
-    
+
+    results = schedule_mineru(
+        pdf_files, output_dir,
+        vram_size=vram_size,
+        lang=lang,
+        batch_size=batch_size,
+        max_jobs=max_jobs,
+        job_vram=job_vram,
+        startup_timeout=startup_timeout,
+        timeout_per_pdf=timeout_per_pdf,
+        retries=retries,
+        on_complete=on_complete,
+        first_batch_size=first_batch_size,
+    )
+
     print(f"\n처리 완료! 성공: {len(results['success'])}, 실패: {len(results['failed'])}")
-    return results
\ No newline at end of file
+    return results
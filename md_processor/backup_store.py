@@ -0,0 +1,224 @@
+import os
+import sys
+import json
+import shutil
+import logging
+import argparse
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+from pdf_parser.utils.manifest import file_sha256, write_json_atomic
+
+BACKUP_DIR_NAME = "_original_mineru"
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+# index.json을 중간 저장하는 주기 (새로 저장한 파일 수 기준, 중단돼도 저장된 객체를 잃지 않도록)
+SAVE_EVERY = 50
+
+# Linux FICLONE ioctl (btrfs, XFS reflink=1 등에서 블록을 공유하는 복사본 생성)
+_FICLONE = 0x40049409
+
+
+def clone_file(src, dst) -> str:
+    """
+    src를 dst로 복사, 반환값: "reflink" / "copy"
+    - 파일 시스템이 지원하면 reflink(copy-on-write)로 데이터 블록을 쓰지 않고 복사한다.
+    - 하드링크는 쓰지 않는다: 원본 Markdown은 백업 직후 같은 파일에 덮어쓰며 정제되므로
+      inode를 공유하면 백업 내용도 함께 바뀐다.
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return "reflink"
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    return "copy"
+
+
+class BackupStore:
+    """
+    MinerU 원본 Markdown 내용 주소 기반(content-addressed) 백업 저장소
+
+    <출력 디렉토리>/_original_mineru/
+    ├─ objects/ab/abcdef...   # sha256 이름의 원본 파일 (읽기 전용, 같은 내용은 한 번만 저장)
+    └─ index.json             # 출력 디렉토리 기준 상대 경로 -> {sha256, size, mtime_ns, versions}
+
+    - 이미 저장된 해시의 파일은 다시 쓰지 않는다. (size/mtime이 지난 백업 때와 같으면 해시 계산도 생략)
+    - restore()로 정제 전 MinerU 출력으로 되돌리고, verify()로 객체가 손상되지 않았는지 검사한다.
+    - 여러 스레드에서 put()을 호출해도 된다.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self.root = self.output_dir / BACKUP_DIR_NAME
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / INDEX_NAME
+        self.files = self._load()
+        self.stats = {"stored": 0, "unchanged": 0, "reflink": 0, "copy": 0}
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+    def _load(self):
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return {}
+            return data.get("files", {})
+        except Exception as e:
+            logging.warning(f"[backup] 백업 인덱스 로드 실패, 새로 생성합니다: {e}")
+            return {}
+
+    def object_path(self, digest) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _key(self, md_path) -> str:
+        path = Path(md_path).resolve()
+        try:
+            return path.relative_to(self.output_dir.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+    def put(self, md_path) -> str:
+        """
+        md_path를 저장소에 백업하고 sha256 반환
+        - 같은 내용이 이미 저장돼 있으면 인덱스만 갱신한다.
+        """
+        key = self._key(md_path)
+        stat = os.stat(md_path)
+        with self._lock:
+            entry = self.files.get(key)
+        if (entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+                and self.object_path(entry["sha256"]).exists()):
+            with self._lock:
+                self.stats["unchanged"] += 1
+            return entry["sha256"]
+
+        digest = file_sha256(md_path)
+        object_path = self.object_path(digest)
+        method = None
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_name(f"{digest}.{threading.get_ident()}.tmp")
+            method = clone_file(md_path, tmp_path)
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, object_path)
+
+        with self._lock:
+            versions = (self.files.get(key) or {}).get("versions", [])
+            self.files[key] = {
+                "sha256": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "versions": versions if versions and versions[-1] == digest else versions + [digest],
+            }
+            if method is None:
+                self.stats["unchanged"] += 1
+            else:
+                self.stats["stored"] += 1
+                self.stats[method] += 1
+            self._unsaved += 1
+            if self._unsaved >= SAVE_EVERY:
+                self._save_locked()
+        return digest
+
+    def restore(self, names: Optional[Iterable[str]] = None, target_dir=None) -> dict:
+        """
+        백업된 원본으로 되돌림
+        - names: 인덱스 키(출력 디렉토리 기준 상대 경로) 또는 파일 이름 목록, None이면 전체
+        - target_dir: 복원 위치 (None이면 원래 위치에 덮어씀)
+        - 반환값: {"restored": [...], "unchanged": [...], "missing": [...]}
+        """
+        result = {"restored": [], "unchanged": [], "missing": []}
+        base = Path(target_dir) if target_dir else self.output_dir
+        for key in self._select(names):
+            entry = self.files[key]
+            object_path = self.object_path(entry["sha256"])
+            if not object_path.exists():
+                result["missing"].append(key)
+                continue
+            dst = base / key if not Path(key).is_absolute() else Path(key)
+            if dst.exists() and dst.stat().st_size == entry["size"] and file_sha256(dst) == entry["sha256"]:
+                result["unchanged"].append(key)
+                continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = dst.with_name(dst.name + ".restore.tmp")
+            clone_file(object_path, tmp_path)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, dst)
+            result["restored"].append(key)
+        return result
+
+    def verify(self, names: Optional[Iterable[str]] = None) -> dict:
+        """
+        인덱스가 가리키는 객체가 있고 내용 해시가 이름과 같은지 검사
+        - 반환값: {"ok": [...], "corrupt": [...], "missing": [...]}
+        """
+        result = {"ok": [], "corrupt": [], "missing": []}
+        checked = {}
+        for key in self._select(names):
+            digest = self.files[key]["sha256"]
+            if digest not in checked:
+                object_path = self.object_path(digest)
+                checked[digest] = ("missing" if not object_path.exists()
+                                   else "ok" if file_sha256(object_path) == digest else "corrupt")
+            result[checked[digest]].append(key)
+        return result
+
+    def _select(self, names):
+        if names is None:
+            return sorted(self.files)
+        wanted = set(names)
+        return sorted(key for key in self.files if key in wanted or Path(key).name in wanted)
+
+    def _save_locked(self):
+        write_json_atomic(self.index_path, {"version": INDEX_VERSION, "files": self.files})
+        self._unsaved = 0
+
+    def save(self):
+        with self._lock:
+            self._save_locked()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MinerU 원본 Markdown 백업 저장소 (복원/검사)")
+    parser.add_argument('command', choices=["list", "verify", "restore"], help="list: 목록, verify: 무결성 검사, restore: 복원")
+    parser.add_argument('names', nargs='*', help="대상 파일 (인덱스 경로 또는 파일 이름, 생략 시 전체)")
+    parser.add_argument('-o', '--output', required=True, help="pdf_to_md_pipeline 출력 디렉토리")
+    parser.add_argument('--to', default=None, help="restore 위치 (기본값: 원래 위치에 덮어씀)")
+    args = parser.parse_args()
+
+    store = BackupStore(args.output)
+    if not store.files:
+        print(f"❌ 백업 인덱스가 없습니다: {store.index_path}")
+        sys.exit(1)
+    names = args.names or None
+
+    if args.command == "list":
+        for key in store._select(names):
+            entry = store.files[key]
+            print(f"{entry['sha256'][:12]}  {entry['size']:>10}  {key}  (버전 {len(entry.get('versions', []))}개)")
+    elif args.command == "verify":
+        result = store.verify(names)
+        for status in ("corrupt", "missing"):
+            for key in result[status]:
+                print(f"❌ {status}: {key}")
+        print(f"🔍 검사: 정상 {len(result['ok'])}개, 손상 {len(result['corrupt'])}개, 누락 {len(result['missing'])}개")
+        if result["corrupt"] or result["missing"]:
+            sys.exit(1)
+    else:
+        result = store.restore(names, args.to)
+        for key in result["missing"]:
+            print(f"❌ 백업 객체 없음: {key}")
+        print(f"♻️ 복원: {len(result['restored'])}개, 이미 원본과 같음: {len(result['unchanged'])}개, "
+              f"누락: {len(result['missing'])}개")
+        if result["missing"]:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
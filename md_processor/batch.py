@@ -0,0 +1,186 @@
+import os
+import sys
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pdf_parser.utils.manifest import file_sha256, write_json_atomic
+
+MANIFEST_NAME = ".md_clean_manifest.json"
+MANIFEST_VERSION = 1
+# 진행 상황 출력 주기 (초)
+PROGRESS_INTERVAL = 2.0
+
+
+def file_state(path, with_hash: bool = True) -> Dict:
+    """{"size", "mtime_ns"[, "sha256"]}"""
+    stat = os.stat(path)
+    state = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if with_hash:
+        state["sha256"] = file_sha256(path)
+    return state
+
+
+class CleaningManifest:
+    """
+    Markdown 정제 증분 처리 매니페스트 (기본값: <출력 루트>/.md_clean_manifest.json)
+    - 입력 루트 기준 상대 경로 -> {입력 파일 상태, 출력 파일 상태, 정제 설정}
+    - 입력의 size/mtime이 같으면 그대로, 다르면 내용 해시를 비교해 바뀌지 않은 파일은 건너뛴다.
+    - 인플레이스 정제(입력 = 출력)는 정제 후 파일 상태를 입력 상태로 기록하므로,
+      다음 실행에서 이미 정제된 파일을 다시 정제하지 않고 MinerU가 새로 쓴 파일만 처리한다.
+    """
+
+    def __init__(self, root, input_root, config: Dict, name: str = MANIFEST_NAME):
+        self.path = Path(root) / name
+        self.input_root = Path(input_root)
+        self.config = config
+        self.files = self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return data.get("files", {})
+        except Exception as e:
+            logging.warning(f"[md_manifest] 매니페스트 로드 실패, 새로 생성합니다: {e}")
+            return {}
+
+    def _key(self, input_path) -> str:
+        try:
+            return Path(input_path).relative_to(self.input_root).as_posix()
+        except ValueError:
+            return str(input_path)
+
+    def is_up_to_date(self, input_path, output_path) -> bool:
+        entry = self.files.get(self._key(input_path))
+        if not entry or entry.get("config") != self.config:
+            return False
+        in_place = Path(input_path) == Path(output_path)
+        if not in_place:
+            # 출력이 지워졌거나 다른 곳에서 수정됐으면 다시 정제
+            try:
+                output = file_state(output_path, with_hash=False)
+            except FileNotFoundError:
+                return False
+            if output != entry.get("output"):
+                return False
+        try:
+            current = file_state(input_path, with_hash=False)
+        except FileNotFoundError:
+            return False
+        recorded = entry.get("input", {})
+        if current["size"] != recorded.get("size"):
+            return False
+        if current["mtime_ns"] == recorded.get("mtime_ns"):
+            return True
+        return file_sha256(input_path) == recorded.get("sha256")
+
+    def record(self, input_path, input_state: Dict, output_state: Dict):
+        self.files[self._key(input_path)] = {"input": input_state, "output": output_state, "config": self.config}
+
+    def save(self):
+        write_json_atomic(self.path, {"version": MANIFEST_VERSION, "files": self.files})
+
+
+def _run_job(worker: Callable, input_path: str, output_path: str, worker_args: Tuple):
+    """
+    프로세스 풀 워커: worker(input_path, output_path, *worker_args) 실행 후 (오류, 입력 상태, 출력 상태)
+    - 인플레이스면 정제된 파일 상태를 입력 상태로 기록한다.
+    """
+    try:
+        worker(input_path, output_path, *worker_args)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", None, None
+    in_place = Path(input_path) == Path(output_path)
+    output_state = file_state(output_path, with_hash=in_place)
+    input_state = output_state if in_place else file_state(input_path)
+    return None, input_state, {"size": output_state["size"], "mtime_ns": output_state["mtime_ns"]}
+
+
+class Progress:
+    """완료 개수를 모아 PROGRESS_INTERVAL마다 한 줄로 출력"""
+
+    def __init__(self, label: str, total: int, skipped: int):
+        self.label = label
+        self.total = total
+        self.done = self.skipped = skipped
+        self.succeeded = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self.last_print = self.started
+
+    def update(self, ok: bool):
+        self.done += 1
+        if ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        now = time.perf_counter()
+        if now - self.last_print >= PROGRESS_INTERVAL:
+            self.print()
+            self.last_print = now
+
+    def print(self):
+        elapsed = time.perf_counter() - self.started
+        processed = self.succeeded + self.failed
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        percent = self.done / self.total * 100 if self.total else 100.0
+        print(f"📊 {self.label} {self.done}/{self.total} ({percent:.1f}%) | 성공 {self.succeeded} | "
+              f"실패 {self.failed} | 건너뜀 {self.skipped} | {rate:.1f}개/s", flush=True)
+
+
+def run_batch(jobs: Sequence[Tuple[str, str]], worker: Callable, worker_args: Tuple = (),
+              manifest: Optional[CleaningManifest] = None, workers: int = 1, label: str = "정제",
+              force: bool = False) -> Dict:
+    """
+    (입력, 출력) 목록을 worker로 처리하는 일괄 실행기
+    - manifest가 있으면 바뀌지 않은 파일은 건너뛰고, 성공한 파일을 기록한다.
+      (force=True면 모두 다시 처리하되 매니페스트는 갱신)
+    - workers > 1이면 프로세스 풀에서 병렬 처리 (worker는 모듈 수준 함수여야 함)
+    - 파일마다 출력하지 않고 진행 상황을 모아 주기적으로 한 줄씩 출력한다.
+    - 반환값: {"total", "processed", "skipped", "failed", "failures": [(입력, 오류)], "sec"}
+    """
+    pending = [(str(i), str(o)) for i, o in jobs
+               if force or manifest is None or not manifest.is_up_to_date(i, o)]
+    progress = Progress(label, len(jobs), len(jobs) - len(pending))
+    failures: List[Tuple[str, str]] = []
+
+    def finish(input_path, result):
+        error, input_state, output_state = result
+        if error is None:
+            if manifest is not None:
+                manifest.record(input_path, input_state, output_state)
+        else:
+            failures.append((input_path, error))
+        progress.update(error is None)
+
+    try:
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_run_job, worker, i, o, worker_args): i for i, o in pending}
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+        else:
+            for input_path, output_path in pending:
+                finish(input_path, _run_job(worker, input_path, output_path, worker_args))
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+    progress.print()
+    for input_path, error in failures:
+        print(f"❌ 오류: {input_path} → {error}", file=sys.stderr)
+    return {
+        "total": len(jobs),
+        "processed": progress.succeeded,
+        "skipped": progress.skipped,
+        "failed": progress.failed,
+        "failures": failures,
+        "sec": round(time.perf_counter() - progress.started, 2),
+    }
@@ -10,6 +10,14 @@ def main():
     parser.add_argument('-o', '--output', help='출력 경로 (파일 또는 디렉토리)')
     parser.add_argument('--no-remove-consecutive', action='store_false', dest='remove_consecutive',
                         help='연속 헤더 제거 비활성화')
+    parser.add_argument('--stream', action='store_true',
+                        help='파일 전체를 메모리에 올리지 않고 라인 단위로 읽고 쓰기 (큰 파일용, 결과는 같음)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='디렉토리 처리 시 병렬 정제 프로세스 수 (기본값: 1)')
+    parser.add_argument('--force', action='store_true',
+                        help='매니페스트를 무시하고 바뀌지 않은 파일도 다시 정제')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='디렉토리 처리 시 진행 상황 대신 파일별 처리 메시지 출력')
 
     args = parser.parse_args()
 
@@ -25,7 +33,8 @@ def main():
         process_md_file(
             input_path=args.file,
             output_path=args.output,
-            remove_consecutive=args.remove_consecutive
+            remove_consecutive=args.remove_consecutive,
+            stream=args.stream
         )
 
     if args.dir:
@@ -36,7 +45,11 @@ def main():
         process_directory(
             input_dir=args.dir,
             output_dir=args.output,
-            remove_consecutive=args.remove_consecutive
+            remove_consecutive=args.remove_consecutive,
+            stream=args.stream,
+            workers=args.workers,
+            incremental=not args.force,
+            verbose=args.verbose
         )
 
 if __name__ == "__main__":
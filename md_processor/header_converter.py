@@ -2,10 +2,14 @@ import re
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
 from dataclasses import dataclass
+from md_processor.batch import CleaningManifest, run_batch
 
-@dataclass
+# process_directory_recursive 매니페스트 (pipeline.process_directory의 인플레이스 매니페스트와 분리)
+CLEANED_2_MANIFEST_NAME = ".md_cleaned_2_manifest.json"
+
+@dataclass(slots=True)
 class LineInfo:
     """라인 정보를 담는 데이터 클래스"""
     original: str
@@ -16,6 +20,73 @@ class LineInfo:
     is_consecutive: bool = False
     should_remove: bool = False
 
+# 정규식 패턴들을 카테고리별로 정리 (모듈 로드 시 한 번만 컴파일, 모든 변환기 인스턴스가 공유)
+PATTERNS: Dict[str, Dict[str, re.Pattern]] = {
+    'roman': {
+        'unicode': re.compile(r'^(Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)\.?\s*(.+)'),
+        'ascii': re.compile(r'^([IVX]+)\.?\s*(.+)', re.IGNORECASE)
+    },
+    'numbered': {
+        'hierarchical': re.compile(r'^(\d+(?:\.\d+)*)\.\s*(.+)'),
+        'simple': re.compile(r'^(\d+)\s+(.+)')  # 점 없는 숫자 패턴 추가
+    },
+    'symbols': {
+        'square': re.compile(r'^□\s*(.+)'),
+        'note': re.compile(r'^※\s*(.+)'),
+        'circle': re.compile(r'^○\s*(.+)'),
+        'bullet': re.compile(r'^•\s*(.+)'),
+        'dash': re.compile(r'^-\s*(.+)')
+    },
+    'exclude': {
+        'parentheses': re.compile(r'^\d+\)\s*(.+)'),
+        'korean_paren': re.compile(r'^[가-힣]\)\s*(.+)'),
+        'alpha_paren': re.compile(r'^[a-zA-Z]\)\s*(.+)')
+    },
+    'cleanup': {
+        'markdown_header': re.compile(r'^#+\s*(.*)'),
+        'meaningless': re.compile(r'^[#\s]*$|^[#\s·•\-_=]*$|^[#\s]*\.\s*$')
+    },
+    'toc': {
+        # 목차 패턴: 로마숫자 + 텍스트 + 점선 + 페이지번호
+        'roman_toc': re.compile(r'^(Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)\.?\s*(.+?)[\s·]{2,}\s*\d+$'),
+        # 숫자 목차: 1. 제목 ··· 페이지
+        'numbered_toc': re.compile(r'^(\d+(?:\.\d+)*)\.\s*(.+?)[\s·]{2,}\s*\d+$'),
+        # 일반 목차: 텍스트 ··· 페이지
+        'general_toc': re.compile(r'^(.+?)[\s·]{3,}\s*\d+$'),
+        # 점선만 있는 라인
+        'dotted_line': re.compile(r'^[·\s]{3,}$')
+    }
+}
+
+# 페이지 번호로 끝나는 목차 패턴 3개(roman_toc / numbered_toc / general_toc)를 하나로 합친 정규식
+_TOC_ENTRY = re.compile(
+    r'(?:(?:Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)\.?\s*.+?[\s·]{2,}'
+    r'|\d+(?:\.\d+)*\.\s*.+?[\s·]{2,}'
+    r'|.+?[\s·]{3,})\s*\d+$'
+)
+# 헤더 텍스트로 의미없는 패턴 (re.match 기준)
+# - '\[.*\].*···\s*\d+$', '.*···\s*\d+$'는 마지막 목차 패턴에 포함되므로 생략
+_MEANINGLESS_TEXT = re.compile(
+    r'[·•\-_=]{1,5}$'
+    r'|\d+\.?$'
+    r'|<.*>$'
+    r'|ㅇ\s'
+    r'|.*\(\d{4}\.\d{1,2}\.\d{1,2}\.?기준\)'
+    r'|.*[\s·]{3,}\s*\d+$'  # 목차 패턴 추가
+)
+# 제외 패턴 3개(숫자/한글/영문 + 괄호)를 합친 정규식
+_EXCLUDED = re.compile(r'(?:\d+|[가-힣]|[a-zA-Z])\)\s*.')
+# 로마 숫자/숫자 헤더가 될 수 있는 첫 글자 (아니면 헤더 패턴 검사를 건너뜀)
+_HEADER_START = re.compile(r'[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]|\d|(?i:[IVX])')
+_LEADING_HASHES = re.compile(r'^#+\s*')
+_VALID_ROMANS = frozenset({
+    'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
+    'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII', 'XIX', 'XX'
+})
+_TITLE_KEYWORDS = ('목적', '개요', '요약', '결론', '배경')
+# 목차로 인정하는 최소 연속 라인 수
+_MIN_TOC_LINES = 3
+
 class OptimizedMarkdownConverter:
     """
     Markdown 문서의 구조를 자동으로 분석하고 의미 있는 제목 헤더로 변환하는 도구입니다.
@@ -32,73 +103,32 @@ class OptimizedMarkdownConverter:
         self.max_header_length = 60 
         self.min_header_length = 2
         self.enable_consecutive_header_removal = True
+        # False면 문서별 처리 메시지를 출력하지 않음 (디렉토리 일괄 처리용)
+        self.verbose = True
         
-        # 정규식 패턴들을 카테고리별로 정리
-        self.patterns = self._compile_patterns()
+        # 정규식 패턴들 (모듈 수준에서 컴파일된 것을 공유하므로 인스턴스 생성 비용이 없다)
+        self.patterns = PATTERNS
         
         # 로마 숫자 추적을 단순화
         self.has_roman_numerals = False
-        
-    def _compile_patterns(self) -> Dict[str, Dict[str, re.Pattern]]:
-        """패턴들을 카테고리별로 정리하여 컴파일"""
-        return {
-            'roman': {
-                'unicode': re.compile(r'^(Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)\.?\s*(.+)'),
-                'ascii': re.compile(r'^([IVX]+)\.?\s*(.+)', re.IGNORECASE)
-            },
-            'numbered': {
-                'hierarchical': re.compile(r'^(\d+(?:\.\d+)*)\.\s*(.+)'),
-                'simple': re.compile(r'^(\d+)\s+(.+)')  # 점 없는 숫자 패턴 추가
-            },
-            'symbols': {
-                'square': re.compile(r'^□\s*(.+)'),
-                'note': re.compile(r'^※\s*(.+)'),
-                'circle': re.compile(r'^○\s*(.+)'),
-                'bullet': re.compile(r'^•\s*(.+)'),
-                'dash': re.compile(r'^-\s*(.+)')
-            },
-            'exclude': {
-                'parentheses': re.compile(r'^\d+\)\s*(.+)'),
-                'korean_paren': re.compile(r'^[가-힣]\)\s*(.+)'),
-                'alpha_paren': re.compile(r'^[a-zA-Z]\)\s*(.+)')
-            },
-            'cleanup': {
-                'markdown_header': re.compile(r'^#+\s*(.*)'),
-                'meaningless': re.compile(r'^[#\s]*$|^[#\s·•\-_=]*$|^[#\s]*\.\s*$')
-            },
-            'toc': {
-                # 목차 패턴: 로마숫자 + 텍스트 + 점선 + 페이지번호
-                'roman_toc': re.compile(r'^(Ⅰ|Ⅱ|Ⅲ|Ⅳ|Ⅴ|Ⅵ|Ⅶ|Ⅷ|Ⅸ|Ⅹ)\.?\s*(.+?)[\s·]{2,}\s*\d+$'),
-                # 숫자 목차: 1. 제목 ··· 페이지
-                'numbered_toc': re.compile(r'^(\d+(?:\.\d+)*)\.\s*(.+?)[\s·]{2,}\s*\d+$'),
-                # 일반 목차: 텍스트 ··· 페이지
-                'general_toc': re.compile(r'^(.+?)[\s·]{3,}\s*\d+$'),
-                # 점선만 있는 라인
-                'dotted_line': re.compile(r'^[·\s]{3,}$')
-            }
-        }
 
     def _is_toc_line(self, line: str) -> bool:
         """목차 라인인지 판단"""
         line = line.strip()
         
-        # 빈 라인이거나 점선만 있는 라인
-        if not line or self.patterns['toc']['dotted_line'].match(line):
-            return True
-            
-        # 로마숫자 목차 패턴
-        if self.patterns['toc']['roman_toc'].match(line):
-            return True
-            
-        # 숫자 목차 패턴
-        if self.patterns['toc']['numbered_toc'].match(line):
-            return True
-            
-        # 일반 목차 패턴 (제목··페이지)
-        if self.patterns['toc']['general_toc'].match(line):
+        # 빈 라인
+        if not line:
             return True
-            
-        return False
+        
+        # 점선만 있는 라인은 ·로, 나머지 목차 패턴은 페이지 번호(숫자)로 끝난다
+        last = line[-1]
+        if last == '·':
+            return self.patterns['toc']['dotted_line'].match(line) is not None
+        if not last.isdecimal():
+            return False
+        
+        # 로마숫자 / 숫자 / 일반 목차 패턴 (제목··페이지)
+        return _TOC_ENTRY.match(line) is not None
 
     def _detect_toc_section(self, lines: List[str]) -> Tuple[int, int]:
         """
@@ -117,7 +147,7 @@ class OptimizedMarkdownConverter:
                 toc_end = i
             else:
                 # 목차가 아닌 라인이 나왔을 때
-                if consecutive_toc_count >= 3:  # 최소 3줄 이상의 목차 패턴이 있어야 목차로 인정
+                if consecutive_toc_count >= _MIN_TOC_LINES:  # 최소 3줄 이상의 목차 패턴이 있어야 목차로 인정
                     break
                 else:
                     # 목차 패턴이 충분하지 않으면 리셋
@@ -126,38 +156,30 @@ class OptimizedMarkdownConverter:
                     consecutive_toc_count = 0
         
         # 목차 패턴이 충분하지 않으면 목차 없음으로 처리
-        if consecutive_toc_count < 3:
+        if consecutive_toc_count < _MIN_TOC_LINES:
             return -1, -1
             
         return toc_start, toc_end
 
     def _is_valid_text(self, text: str) -> bool:
         """텍스트가 유효한 헤더 텍스트인지 통합 검증"""
-        if not text or len(text.strip()) < self.min_header_length:
+        if not text:
             return False
         
         clean_text = text.strip()
-        if len(clean_text) > self.max_header_length:
+        if len(clean_text) < self.min_header_length or len(clean_text) > self.max_header_length:
             return False
         
-        # 의미없는 패턴들을 통합
-        meaningless_patterns = [
-            r'^[·•\-_=]{1,5}$',
-            r'^\d+\.?$',
-            r'^\[.*\].*···\s*\d+$',
-            r'^<.*>$',
-            r'^ㅇ\s',
-            r'.*\(\d{4}\.\d{1,2}\.\d{1,2}\.?기준\)',
-            r'.*···\s*\d+$',
-            r'.*[\s·]{3,}\s*\d+$'  # 목차 패턴 추가
-        ]
-        
-        return not any(re.match(pattern, clean_text) for pattern in meaningless_patterns)
+        # 의미없는 패턴들을 통합한 정규식 하나로 검사
+        return _MEANINGLESS_TEXT.match(clean_text) is None
 
-    def _extract_roman_numeral(self, line: str) -> Optional[Tuple[str, str]]:
-        """로마 숫자 추출 통합 메서드 (목차 제외)"""
+    def _extract_roman_numeral(self, line: str, is_toc: Optional[bool] = None) -> Optional[Tuple[str, str]]:
+        """
+        로마 숫자 추출 통합 메서드 (목차 제외)
+        - is_toc: 이미 계산한 목차 라인 여부 (None이면 여기서 계산)
+        """
         # 목차 패턴인지 먼저 확인
-        if self._is_toc_line(line):
+        if self._is_toc_line(line) if is_toc is None else is_toc:
             return None
             
         # 유니코드 로마 숫자 먼저 확인
@@ -174,14 +196,14 @@ class OptimizedMarkdownConverter:
 
     def _is_valid_roman_numeral(self, text: str) -> bool:
         """로마 숫자 유효성 검사"""
-        valid_romans = {
-            'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
-            'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII', 'XIX', 'XX'
-        }
-        return text.upper() in valid_romans
+        return text.upper() in _VALID_ROMANS
 
-    def _classify_line_type(self, line: str, line_index: int, in_toc_section: bool = False) -> LineInfo:
-        """라인 분류 로직을 단순화 (목차 처리 추가)"""
+    def _classify_line_type(self, line: str, line_index: int, in_toc_section: bool = False,
+                            is_toc: Optional[bool] = None) -> LineInfo:
+        """
+        라인 분류 로직을 단순화 (목차 처리 추가)
+        - is_toc: 목차 감지 단계에서 계산한 목차 라인 여부 (다시 계산하지 않도록 전달)
+        """
         line = line.strip()
         
         if not line:
@@ -192,38 +214,39 @@ class OptimizedMarkdownConverter:
             return LineInfo(line, 'toc_content', 0, line, line_index)
         
         # 제외 패턴 먼저 확인
-        for pattern in self.patterns['exclude'].values():
-            if pattern.match(line):
-                return LineInfo(line, 'excluded', 0, line, line_index)
-        
-        # 로마 숫자 확인
-        roman_result = self._extract_roman_numeral(line)
-        if roman_result:
-            roman_num, header_text = roman_result
-            if self._is_valid_text(header_text):
-                self.has_roman_numerals = True
-                return LineInfo(line, 'roman', 1, line, line_index)  # 원본 line 유지
-        
-        # 계층형 숫자 확인 (점 있는 버전)
-        match = self.patterns['numbered']['hierarchical'].match(line)
-        if match:
-            number_part, header_text = match.groups()
-            if self._is_valid_text(header_text):
-                # 로마 숫자가 있으면: 1.x는 H2, 로마 숫자가 없으면: 1은 H1, 1.x는 H2
-                if self.has_roman_numerals:
-                    level = 2  # 로마 숫자 다음은 모두 H2
-                else:
-                    level = 1 if number_part.count('.') == 0 else 2
-                return LineInfo(line, 'numbered', level, line, line_index)  # 원본 line 유지
-        
-        # 점 없는 숫자 패턴 (1 추진목표)
-        match = self.patterns['numbered']['simple'].match(line)
-        if match:
-            number_part, header_text = match.groups()
-            if self._is_valid_text(header_text):
-                # 로마 숫자가 있으면 H2, 없으면 H1
-                level = 2 if self.has_roman_numerals else 1
-                return LineInfo(line, 'numbered_simple', level, line, line_index)  # 원본 line 유지
+        if _EXCLUDED.match(line):
+            return LineInfo(line, 'excluded', 0, line, line_index)
+        
+        # 로마 숫자/숫자로 시작하지 않으면 헤더 패턴 검사 생략
+        if _HEADER_START.match(line):
+            # 로마 숫자 확인
+            roman_result = self._extract_roman_numeral(line, is_toc)
+            if roman_result:
+                roman_num, header_text = roman_result
+                if self._is_valid_text(header_text):
+                    self.has_roman_numerals = True
+                    return LineInfo(line, 'roman', 1, line, line_index)  # 원본 line 유지
+            
+            # 계층형 숫자 확인 (점 있는 버전)
+            match = self.patterns['numbered']['hierarchical'].match(line)
+            if match:
+                number_part, header_text = match.groups()
+                if self._is_valid_text(header_text):
+                    # 로마 숫자가 있으면: 1.x는 H2, 로마 숫자가 없으면: 1은 H1, 1.x는 H2
+                    if self.has_roman_numerals:
+                        level = 2  # 로마 숫자 다음은 모두 H2
+                    else:
+                        level = 1 if number_part.count('.') == 0 else 2
+                    return LineInfo(line, 'numbered', level, line, line_index)  # 원본 line 유지
+            
+            # 점 없는 숫자 패턴 (1 추진목표)
+            match = self.patterns['numbered']['simple'].match(line)
+            if match:
+                number_part, header_text = match.groups()
+                if self._is_valid_text(header_text):
+                    # 로마 숫자가 있으면 H2, 없으면 H1
+                    level = 2 if self.has_roman_numerals else 1
+                    return LineInfo(line, 'numbered_simple', level, line, line_index)  # 원본 line 유지
         
         # 심볼 패턴들은 헤더로 처리하지 않음 (일반 텍스트로 유지)
         # for symbol_type, pattern in self.patterns['symbols'].items():
@@ -243,20 +266,83 @@ class OptimizedMarkdownConverter:
             return False
         
         # 제목 키워드가 있는 경우만
-        title_keywords = ['목적', '개요', '요약', '결론', '배경']
-        return any(keyword in line for keyword in title_keywords)
+        return any(keyword in line for keyword in _TITLE_KEYWORDS)
 
-    def _mark_consecutive_headers(self, lines: List[LineInfo]) -> List[LineInfo]:
-        """연속되는 헤더 라인을 제거하거나 텍스트로 변환하는 전처리 함수"""
+    def _iter_classified(self, lines: Iterable[str]) -> Iterator[LineInfo]:
+        """
+        헤더 정리 + 목차 감지 + 라인 분류를 한 번의 순회로 처리
+        - 목차 섹션은 첫 번째로 3줄 이상 이어진 목차 라인 구간 (_detect_toc_section과 같은 기준)
+        - 목차 후보는 3줄이 될 때까지만 보관한다. 3줄이 되면 그 구간이 목차로 확정되므로
+          이후 목차 라인은 바로 내보내며, 미리 읽는 라인 수가 문서 크기와 무관하다.
+        - 각 라인의 목차 판별 결과는 분류 단계(로마 숫자 확인)에 그대로 넘겨 다시 계산하지 않는다.
+        """
+        self.has_roman_numerals = False
+        markdown_header = self.patterns['cleanup']['markdown_header']
+        toc_start = toc_end = -1
+        toc_done = False
+        pending = []  # 목차 후보 [(line_index, line)]
+        
+        for i, line in enumerate(lines):
+            # 기존 마크다운 헤더 정리
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                line = markdown_header.match(stripped).group(1).strip()
+            
+            if toc_done:
+                yield self._classify_line_type(line, i)
+                continue
+            
+            is_toc = self._is_toc_line(line)
+            if toc_start != -1:
+                # 목차 섹션 안: 목차가 아닌 라인이 나오면 섹션 끝
+                if is_toc:
+                    toc_end = i
+                    yield self._classify_line_type(line, i, True, is_toc)
+                    continue
+                toc_done = True
+                self._report_toc(toc_start, toc_end)
+                yield self._classify_line_type(line, i, False, is_toc)
+                continue
+            
+            if is_toc:
+                pending.append((i, line))
+                if len(pending) >= _MIN_TOC_LINES:
+                    # 목차 확정
+                    toc_start, toc_end = pending[0][0], i
+                    for index, pending_line in pending:
+                        yield self._classify_line_type(pending_line, index, True, True)
+                    pending = []
+                continue
+            
+            # 목차 후보가 3줄이 안 되는 채로 끊김: 일반 라인으로 분류
+            for index, pending_line in pending:
+                yield self._classify_line_type(pending_line, index, False, True)
+            pending = []
+            yield self._classify_line_type(line, i, False, is_toc)
+        
+        for index, pending_line in pending:
+            yield self._classify_line_type(pending_line, index, False, True)
+        if toc_start != -1 and not toc_done:
+            self._report_toc(toc_start, toc_end)
+
+    def _report_toc(self, toc_start, toc_end):
+        if self.verbose:
+            print(f"목차 섹션 감지됨: {toc_start+1}줄 ~ {toc_end+1}줄 (총 {toc_end-toc_start+1}줄)")
+
+    def _iter_marked(self, lines: Iterable[LineInfo]) -> Iterator[LineInfo]:
+        """연속 헤더 처리 (다음 라인이 헤더인지 보기 위해 한 줄만 미리 읽는다)"""
         if not self.enable_consecutive_header_removal:
-            return lines
+            yield from lines
+            return
         
-        result = []
         consecutive_count = 0
+        iterator = iter(lines)
+        line_info = next(iterator, None)
         
-        for i, line_info in enumerate(lines):
+        while line_info is not None:
+            next_info = next(iterator, None)
             is_header = line_info.level > 0
-            next_is_header = (i + 1 < len(lines) and lines[i + 1].level > 0)
+            next_is_header = next_info is not None and next_info.level > 0
             
             if is_header:
                 consecutive_count += 1
@@ -270,7 +356,7 @@ class OptimizedMarkdownConverter:
                 
                 if should_remove:
                     # 헤더를 텍스트로 변환
-                    clean_content = re.sub(r'^#+\s*', '', line_info.content).strip()
+                    clean_content = _LEADING_HASHES.sub('', line_info.content).strip()
                     line_info = LineInfo(
                         original=clean_content,
                         type='converted_text',
@@ -283,36 +369,25 @@ class OptimizedMarkdownConverter:
             else:
                 consecutive_count = 0
             
-            result.append(line_info)
-        
-        return result
+            yield line_info
+            line_info = next_info
+
+    def _mark_consecutive_headers(self, lines: List[LineInfo]) -> List[LineInfo]:
+        """연속되는 헤더 라인을 제거하거나 텍스트로 변환하는 전처리 함수"""
+        if not self.enable_consecutive_header_removal:
+            return lines
+        return list(self._iter_marked(lines))
+
+    def iter_convert_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        라인 단위 변환 제너레이터 (convert_document와 같은 결과를 한 줄씩 yield)
+        - 목차 후보(최대 2줄)와 다음 한 줄만 미리 읽으므로 입력 전체를 메모리에 올리지 않아도 된다.
+        """
+        yield from self._iter_markdown(self._iter_marked(self._iter_classified(lines)))
 
     def convert_document(self, text: str) -> str:
         """메인 변환 로직 (목차 처리 추가)"""
-        # 기존 헤더 정리
-        cleaned_text = self._clean_existing_headers(text)
-        lines = cleaned_text.split('\n')
-        
-        # 목차 섹션 감지
-        toc_start, toc_end = self._detect_toc_section(lines)
-        
-        if toc_start != -1:
-            print(f"목차 섹션 감지됨: {toc_start+1}줄 ~ {toc_end+1}줄 (총 {toc_end-toc_start+1}줄)")
-        
-        self.has_roman_numerals = False
-        
-        # 라인별 분류 (목차 섹션 정보 전달)
-        analyzed_lines = []
-        for i, line in enumerate(lines):
-            in_toc = toc_start <= i <= toc_end if toc_start != -1 else False
-            line_info = self._classify_line_type(line, i, in_toc)
-            analyzed_lines.append(line_info)
-        
-        # 연속 헤더 처리
-        processed_lines = self._mark_consecutive_headers(analyzed_lines)
-        
-        # 마크다운 변환
-        return self._lines_to_markdown(processed_lines)
+        return '\n'.join(self.iter_convert_lines(text.split('\n')))
 
     def _clean_existing_headers(self, text: str) -> str:
         """기존 마크다운 헤더 정리"""
@@ -328,36 +403,41 @@ class OptimizedMarkdownConverter:
         
         return '\n'.join(cleaned_lines)
 
-    def _lines_to_markdown(self, lines: List[LineInfo]) -> str:
-        """LineInfo 리스트를 마크다운으로 변환"""
-        converted_lines = []
+    def _iter_markdown(self, lines: Iterable[LineInfo]) -> Iterator[str]:
+        """LineInfo를 마크다운 라인으로 변환 (연속 빈 줄 정리 포함)"""
         removed_count = 0
         toc_lines_removed = 0
+        prev_empty = False
         
         for line_info in lines:
             if line_info.type == 'toc_content':
                 # 목차 내용은 그대로 유지하되 별도 카운트
-                converted_lines.append(line_info.original)
+                converted = line_info.original
                 toc_lines_removed += 1
             elif line_info.level > 0:
-                header = '#' * line_info.level
-                converted_lines.append(f"{header} {line_info.content}")
-            elif line_info.should_remove:
-                converted_lines.append(line_info.original)
-                removed_count += 1
+                converted = f"{'#' * line_info.level} {line_info.content}"
             else:
-                converted_lines.append(line_info.original)
+                converted = line_info.original
+                removed_count += line_info.should_remove
+            
+            # 연속 빈 줄 정리
+            is_empty = converted.strip() == ''
+            if not (is_empty and prev_empty):
+                yield converted
+            prev_empty = is_empty
         
-        # 연속 빈 줄 정리
-        final_lines = self._clean_empty_lines(converted_lines)
+        if not self.verbose:
+            return
         
         if toc_lines_removed > 0:
             print(f"목차 처리: {toc_lines_removed}개 라인을 일반 텍스트로 유지")
         
         if removed_count > 0:
             print(f"연속 헤더 제거: {removed_count}개 헤더를 본문으로 변환")
-        
-        return '\n'.join(final_lines)
+
+    def _lines_to_markdown(self, lines: List[LineInfo]) -> str:
+        """LineInfo 리스트를 마크다운으로 변환"""
+        return '\n'.join(self._iter_markdown(lines))
 
     def _clean_empty_lines(self, lines: List[str]) -> List[str]:
         """연속된 빈 줄 정리"""
@@ -399,10 +479,17 @@ class OptimizedMarkdownConverter:
     def set_consecutive_header_removal_enabled(self, enabled: bool):
         """연속 헤더 제거 기능 설정"""
         self.enable_consecutive_header_removal = enabled
-        print(f"🔧 연속 헤더 제거 기능: {'활성화' if enabled else '비활성화'}")
+        if self.verbose:
+            print(f"🔧 연속 헤더 제거 기능: {'활성화' if enabled else '비활성화'}")
 
-    def process_directory_recursive(self, root_directory: str):
-        """디렉토리 내부 모든 하위 디렉토리를 재귀적으로 탐색하여 각 파일을 개별적으로 _cleaned_2.md 생성"""
+    def process_directory_recursive(self, root_directory: str, workers: int = 1, incremental: bool = True,
+                                    verbose: bool = False):
+        """
+        디렉토리 내부 모든 하위 디렉토리를 재귀적으로 탐색하여 각 파일을 개별적으로 _cleaned_2.md 생성
+        - workers > 1: 프로세스 풀에서 파일 단위로 병렬 변환
+        - incremental=True: 원본과 _cleaned_2.md가 지난 실행 이후 바뀌지 않은 파일은 건너뜀 (False면 모두 변환)
+        - verbose=False: 파일별 출력 대신 진행 상황을 모아 주기적으로 출력
+        """
         root_dir = Path(root_directory)
         
         if not root_dir.exists():
@@ -410,62 +497,48 @@ class OptimizedMarkdownConverter:
             return
         
         # 모든 하위 디렉토리의 .md 파일 탐색
-        all_md_files = list(root_dir.rglob("*.md"))
+        all_md_files = sorted(root_dir.rglob("*.md"))
         if not all_md_files:
             print(f"❌ '{root_directory}' 디렉토리에서 .md 파일을 찾을 수 없습니다.")
             return
         
         # 이미 변환된 파일은 제외
-        md_files_to_process = []
-        for md_file in all_md_files:
-            if any(suffix in md_file.stem for suffix in ['_clean', '_cleaned']):
-                continue
-            md_files_to_process.append(md_file)
+        md_files_to_process = [md_file for md_file in all_md_files
+                               if not any(suffix in md_file.stem for suffix in ['_clean', '_cleaned'])]
         
         if not md_files_to_process:
             print("처리할 .md 파일이 없습니다 (이미 변환된 파일들은 제외됨)")
             return
         
         print(f"'{root_directory}' 내 모든 .md 파일을 탐색합니다 (총 {len(md_files_to_process)}개 파일 발견)")
-        print(f"\n각 파일을 개별적으로 변환합니다...")
-        
-        successful_files = 0
-        
-        # 각 파일을 개별적으로 처리
-        for i, md_file in enumerate(md_files_to_process, 1):
-            try:
-                # 파일의 상대 경로 계산
-                try:
-                    relative_path = md_file.relative_to(root_dir)
-                except ValueError:
-                    relative_path = md_file.name
-                
-                print(f"\n{i}/{len(md_files_to_process)}. {relative_path} 처리 중...")
-                
-                # 파일 읽기
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # 개별 파일 변환
-                converted_content = self.convert_document(content)
-                
-                # 출력 파일 경로
-                original_filename = md_file.stem
-                output_filename = f"{original_filename}_cleaned_2.md"
-                output_file_path = md_file.parent / output_filename
-                
-                # 변환된 내용 저장
-                with open(output_file_path, 'w', encoding='utf-8') as f:
-                    f.write(converted_content)
-                
-                print(f"   {output_filename} 생성 완료 (위치: {output_file_path.parent})")
-                successful_files += 1
-                
-            except Exception as e:
-                print(f"   파일 처리 중 오류 발생: {md_file.name} → {e}")
-                continue
         
-        print(f"\n총 {successful_files}개 파일의 _cleaned_2.md 생성 완료!")
-        print(f"모든 _cleaned_2.md 파일은 원본 파일과 같은 디렉토리에 저장되었습니다.")
-        print(f"각 파일에서 의미없는 헤더들이 제거되었습니다.")
+        # 출력 파일은 원본과 같은 디렉토리의 <이름>_cleaned_2.md
+        jobs = [(md_file, md_file.parent / f"{md_file.stem}_cleaned_2.md") for md_file in md_files_to_process]
+        manifest = CleaningManifest(root_dir, root_dir, {
+            "mode": "cleaned_2", "remove_consecutive": self.enable_consecutive_header_removal}, CLEANED_2_MANIFEST_NAME)
+        
+        previous_verbose = self.verbose
+        self.verbose = verbose
+        try:
+            summary = run_batch(jobs, _write_cleaned_2, (self,), manifest, workers, label="변환",
+                                force=not incremental)
+        finally:
+            self.verbose = previous_verbose
+        
+        print(f"\n총 {summary['processed']}개 파일의 _cleaned_2.md 생성 완료! (변경 없음 {summary['skipped']}개 건너뜀)")
         print(f"연속 헤더 제거 기능이 {'적용' if self.enable_consecutive_header_removal else '비활성화'}되었습니다.")
+        return summary
+
+
+def _write_cleaned_2(input_path: str, output_path: str, converter: OptimizedMarkdownConverter):
+    """process_directory_recursive 워커 (프로세스 풀에서 실행되도록 모듈 수준 함수)"""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    converted_content = converter.convert_document(content)
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(converted_content)
+    
+    if converter.verbose:
+        print(f"   {Path(output_path).name} 생성 완료 (위치: {Path(output_path).parent})")
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, Iterator
 
 def remove_null_bytes(content: str) -> Tuple[str, int]:
     """텍스트 내 NULL Byte 제거"""
@@ -15,4 +15,21 @@ def load_and_clean_file(path: str) -> Tuple[str, int]:
     with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
         content = f.read()
     
-    return remove_null_bytes(content)
\ No newline at end of file
+    return remove_null_bytes(content)
+
+def iter_clean_lines(path: str) -> Iterator[Tuple[str, int]]:
+    """
+    파일을 한 줄씩 읽으며 NULL Byte 제거, (줄바꿈을 뗀 라인, 제거한 NULL 개수) yield
+    - load_and_clean_file 결과를 split('\\n')한 것과 같은 라인 구성 (줄바꿈으로 끝나는 파일은 마지막에 빈 라인)
+    """
+    input_file = Path(path)
+    if not input_file.exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+    ends_with_newline = True
+    with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            ends_with_newline = line.endswith('\n')
+            yield remove_null_bytes(line[:-1] if ends_with_newline else line)
+    if ends_with_newline:
+        yield '', 0
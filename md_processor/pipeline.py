@@ -1,63 +1,117 @@
-from md_processor.null_cleaner import load_and_clean_file
+import os
+from md_processor.null_cleaner import load_and_clean_file, iter_clean_lines
 from md_processor.header_converter import OptimizedMarkdownConverter
+from md_processor.batch import CleaningManifest, run_batch
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-def process_md_file(input_path: str, output_path: Optional[str] = None, remove_consecutive: bool = True) -> bool:
-    """단일 파일 처리 파이프라인: NULL 제거 + 헤더 구조 변환"""
+def _convert_md_stream(input_path: str, output_path: Path, converter: OptimizedMarkdownConverter) -> Tuple[int, int, int]:
+    """
+    스트리밍 변환: 라인을 하나씩 읽어 분류하고 바로 임시 파일에 쓴 뒤 output_path로 교체
+    - 입력과 출력이 같은 파일(인플레이스)이어도 안전하며, 메모리 사용량이 파일 크기와 무관하다.
+    - 반환값: (NULL 제거 개수, 정제 후 입력 길이, 변환 후 길이)
+    """
+    counts = {"null": 0, "input": -1}
+
+    def cleaned_lines():
+        for line, null_count in iter_clean_lines(input_path):
+            counts["null"] += null_count
+            counts["input"] += len(line) + 1
+            yield line
+
+    output_length = -1
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
     try:
-        print(f"🚀 시작: {input_path}")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for line in converter.iter_convert_lines(cleaned_lines()):
+                if output_length >= 0:
+                    f.write('\n')
+                f.write(line)
+                output_length += len(line) + 1
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return counts["null"], counts["input"], output_length
+
+def _clean_md_file(input_path: str, output_path: Optional[str] = None, remove_consecutive: bool = True,
+                   stream: bool = False, verbose: bool = True) -> Path:
+    """process_md_file 본체 (오류를 그대로 올린다, 디렉토리 일괄 처리의 워커), 반환값: 출력 경로"""
+    input_file = Path(input_path)
+    output_path = Path(output_path) if output_path else input_file.parent / f"{input_file.stem}_final.md"
+    converter = OptimizedMarkdownConverter()
+    converter.verbose = verbose
+    converter.set_consecutive_header_removal_enabled(remove_consecutive)
 
+    if stream:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        null_count, input_length, output_length = _convert_md_stream(input_path, output_path, converter)
+        if verbose:
+            print(f"🔹 NULL 제거 완료: {null_count}개, 길이: {input_length}")
+            print(f"🔹 변환 후 길이: {output_length}")
+            print(f"💾 저장 위치: {output_path}")
+    else:
         cleaned_text, null_count = load_and_clean_file(input_path)
-        print(f"🔹 NULL 제거 완료: {null_count}개, 길이: {len(cleaned_text)}")
+        if verbose:
+            print(f"🔹 NULL 제거 완료: {null_count}개, 길이: {len(cleaned_text)}")
 
-        converter = OptimizedMarkdownConverter()
-        converter.set_consecutive_header_removal_enabled(remove_consecutive)
         converted_text = converter.convert_document(cleaned_text)
-        print(f"🔹 변환 후 길이: {len(converted_text)}")
-
-        input_file = Path(input_path)
-        output_path = Path(output_path) if output_path else input_file.parent / f"{input_file.stem}_final.md"
-        print(f"💾 저장 위치: {output_path}")
+        if verbose:
+            print(f"🔹 변환 후 길이: {len(converted_text)}")
+            print(f"💾 저장 위치: {output_path}")
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(converted_text)
 
+    if verbose:
         print(f"✅ 완료: {input_file.name} → {output_path.name} (NULL 제거: {null_count}개)")
+    return output_path
+
+def process_md_file(input_path: str, output_path: Optional[str] = None, remove_consecutive: bool = True,
+                    stream: bool = False, verbose: bool = True) -> bool:
+    """
+    단일 파일 처리 파이프라인: NULL 제거 + 헤더 구조 변환
+    - stream=True: 파일 전체를 메모리에 올리지 않고 라인 단위로 읽고 쓴다 (결과는 같음)
+    - verbose=False: 단계별 출력 없이 오류만 출력
+    """
+    try:
+        if verbose:
+            print(f"🚀 시작: {input_path}")
+        _clean_md_file(input_path, output_path, remove_consecutive, stream, verbose)
         return True
 
     except Exception as e:
         print(f"❌ 오류: {input_path} → {e}")
         return False
 
-def process_directory(input_dir: str, output_dir: str = None, remove_consecutive: bool = True):
-    """디렉토리 내 모든 .md 파일 일괄 처리 파이프라인"""
+def process_directory(input_dir: str, output_dir: str = None, remove_consecutive: bool = True, stream: bool = False,
+                      workers: int = 1, incremental: bool = True, verbose: bool = False) -> Optional[dict]:
+    """
+    디렉토리 내 모든 .md 파일 일괄 처리 파이프라인
+    - workers > 1: 프로세스 풀에서 파일 단위로 병렬 정제
+    - incremental=True: <출력 루트>/.md_clean_manifest.json에 기록된 파일 중 바뀌지 않은 파일은 건너뜀
+      (인플레이스 처리에서 이미 정제된 파일을 다시 정제하지 않는다, False면 모두 정제하고 매니페스트만 갱신)
+    - verbose=False: 파일별 출력 대신 진행 상황을 모아 주기적으로 출력
+    - 반환값: run_batch 요약 {"total", "processed", "skipped", "failed", "failures", "sec"}
+    """
     input_dir_path = Path(input_dir)
-    md_files = list(input_dir_path.rglob("*.md"))
+    # 중복 처리 방지: 이미 정제된 파일 이름은 제외
+    md_files = sorted(md_file for md_file in input_dir_path.rglob("*.md")
+                      if not any(suffix in md_file.stem for suffix in ['_clean', '_cleaned']))
 
     if not md_files:
         print(f"❌ {input_dir} 내에 .md 파일이 없습니다.")
-        return
+        return None
 
     print(f"📁 총 {len(md_files)}개의 Markdown 파일을 처리합니다.")
 
-    for md_file in md_files:
-        if any(suffix in md_file.stem for suffix in ['_clean', '_cleaned']):
-            continue  # 중복 처리 방지
-
-        # 출력 경로 지정
-        if output_dir:
-            relative = md_file.relative_to(input_dir_path)
-            output_path = Path(output_dir) / relative
-        else:
-            output_path = md_file  # 덮어쓰기
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    # 출력 경로 지정 (output_dir이 없으면 덮어쓰기)
+    jobs = [(md_file, Path(output_dir) / md_file.relative_to(input_dir_path) if output_dir else md_file)
+            for md_file in md_files]
+    manifest = CleaningManifest(output_dir or input_dir, input_dir_path,
+                                {"mode": "pipeline", "remove_consecutive": remove_consecutive})
 
-        process_md_file(
-            input_path=str(md_file),
-            output_path=str(output_path),
-            remove_consecutive=remove_consecutive
-        )
\ No newline at end of file
+    return run_batch(jobs, _clean_md_file, (remove_consecutive, stream, verbose), manifest, workers,
+                     force=not incremental)
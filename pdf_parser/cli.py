@@ -1,18 +1,94 @@
 import argparse
-from pdf_parser.converter import PDFConverter
+from pdf_parser.utils.merging import DEFAULT_CASCADE_MIN_SCORE
+from pdf_parser.utils.dedup import DEFAULT_DEDUP_THRESHOLD
+from pdf_parser.utils.checkpoint import DEFAULT_MAX_ATTEMPTS
+from pdf_parser.utils.chunking import CHUNKERS, LENGTH_UNITS, DEFAULT_TOKEN_ENCODING
 
 def main():
     parser = argparse.ArgumentParser(description="PDF 변환 도구")
     parser.add_argument('-d', '--dir', required=True, help="PDF 파일이 있는 디렉토리 경로")
     parser.add_argument('-o', '--output', default="outputs", help="결과 파일 저장 경로")
-    parser.add_argument('--format', default="json", choices=["json", "txt"], help="출력 형식")
+    parser.add_argument('--format', default="json", choices=["json", "jsonl", "txt"], help="출력 형식")
+    parser.add_argument('--compress', default="none", choices=["none", "gzip", "zstd"],
+                        help="청크 파일 압축 방식 (zstd는 zstandard 패키지 필요, 기본값: none)")
+    parser.add_argument('--workers', type=int, default=1, help="파일 단위 병렬 처리 프로세스 수 (기본값: 1, 순차 처리)")
+    parser.add_argument('--page-workers', type=int, default=1, help="대용량 문서의 페이지 구간 병렬 처리 프로세스 수 (기본값: 1)")
+    parser.add_argument('--page-parallel-min-pages', type=int, default=100,
+                        help="페이지 병렬 처리를 적용할 최소 페이지 수 (기본값: 100)")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="청크 크기 (기본값: 1000)")
+    parser.add_argument('--chunk-overlap', type=int, default=150, help="청크 오버랩 (기본값: 150)")
+    parser.add_argument('--chunker', default="native", choices=CHUNKERS,
+                        help="청크 분할 방식: native=블록/제목/표 경계 인식, langchain=RecursiveCharacterTextSplitter "
+                             "(기본값: native)")
+    parser.add_argument('--length-unit', default="chars", choices=LENGTH_UNITS,
+                        help="청크 크기/오버랩 단위: chars=글자 수, tokens=토큰 수 (tiktoken 필요, 기본값: chars)")
+    parser.add_argument('--token-encoding', default=DEFAULT_TOKEN_ENCODING,
+                        help=f"--length-unit tokens에서 사용할 tiktoken 인코딩 (기본값: {DEFAULT_TOKEN_ENCODING})")
+    parser.add_argument('--unstructured-strategy', default="fast", choices=["fast", "hi_res", "ocr_only", "auto"],
+                        help="Unstructured partition 전략 (기본값: fast)")
+    parser.add_argument('--unstructured', default="fallback", choices=["fallback", "full", "off"],
+                        help="Unstructured 사용 방식: fallback=두 파서가 모두 실패한 페이지만, "
+                             "full=문서 전체 추가 분석, off=사용 안 함 (기본값: fallback)")
+    parser.add_argument('--dedup-threshold', type=float, default=DEFAULT_DEDUP_THRESHOLD,
+                        help=f"Unstructured 블록 병합 시 근사 중복 유사도 임계값, 0이면 완전 일치만 제거 "
+                             f"(기본값: {DEFAULT_DEDUP_THRESHOLD})")
+    parser.add_argument('--cascade', action='store_true',
+                        help="fitz 결과가 충분하면 pdfplumber를 건너뛰는 cascade 모드")
+    parser.add_argument('--cascade-min-score', type=int, default=DEFAULT_CASCADE_MIN_SCORE,
+                        help=f"cascade 모드에서 fitz 결과를 채택할 최소 점수 (기본값: {DEFAULT_CASCADE_MIN_SCORE})")
+    parser.add_argument('--no-triage', action='store_false', dest='triage',
+                        help="페이지 분류(빈/스캔/텍스트/표 후보) 없이 모든 페이지에서 표 추출")
+    parser.add_argument('--force', action='store_true',
+                        help="변환 매니페스트/체크포인트/격리 목록을 무시하고 모든 파일을 다시 변환")
+    parser.add_argument('--resume', action='store_true',
+                        help="중단된 배치 변환을 체크포인트 저널에서 이어서 진행")
+    parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help=f"같은 파일이 이 횟수만큼 실패하면 격리하고 다시 시도하지 않음 (기본값: {DEFAULT_MAX_ATTEMPTS})")
+    parser.add_argument('--doc-timeout', type=float, default=None,
+                        help="문서 한 개의 변환 제한 시간(초), 넘기면 워커 프로세스를 종료하고 시간 초과로 집계")
+    parser.add_argument('--page-timeout', type=float, default=None,
+                        help="페이지 한 장의 분석 제한 시간(초), 넘기면 해당 페이지를 건너뜀")
+    parser.add_argument('--recycle-after', type=int, default=None, metavar='N',
+                        help="워커 프로세스가 N개 문서를 처리하면 새 프로세스로 교체")
+    parser.add_argument('--memory-budget-mb', type=int, default=None,
+                        help="메모리 제한 모드: 페이지 window 단위 분석 + 청크 스트리밍, 프로세스별 RSS 목표치(MB)")
+    parser.add_argument('--metrics', default=None,
+                        help="파일/페이지별 계측 결과(JSON Lines) 저장 경로 (기본값: <output>/metrics.jsonl)")
+    parser.add_argument('--profile-slowest', type=int, default=0, metavar='N',
+                        help="처리 시간이 가장 긴 N개 파일을 cProfile로 다시 실행해 <output>/profiles에 저장")
 
     args = parser.parse_args()
 
+    # 변환 모듈은 인자 확인 후에 불러와 --help/인자 오류가 빠르게 끝나도록 한다
+    from pdf_parser.converter import PDFConverter
     converter = PDFConverter(
         input_dir=args.dir,
         output_dir=args.output,
-        output_format=args.format
+        output_format=args.format,
+        compression=None if args.compress == "none" else args.compress,
+        workers=args.workers,
+        page_workers=args.page_workers,
+        page_parallel_min_pages=args.page_parallel_min_pages,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+        unstructured_strategy=args.unstructured_strategy,
+        unstructured_mode=args.unstructured,
+        dedup_threshold=args.dedup_threshold,
+        force=args.force,
+        cascade=args.cascade,
+        cascade_min_score=args.cascade_min_score,
+        triage=args.triage,
+        metrics_path=args.metrics,
+        profile_slowest=args.profile_slowest,
+        memory_budget_mb=args.memory_budget_mb,
+        resume=args.resume,
+        max_attempts=args.max_attempts,
+        doc_timeout=args.doc_timeout,
+        page_timeout=args.page_timeout,
+        recycle_after=args.recycle_after,
+        chunker=args.chunker,
+        length_unit=args.length_unit,
+        token_encoding=args.token_encoding
     )
 
     converter.run_conversion()
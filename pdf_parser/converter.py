@@ -2,121 +2,626 @@ from pathlib import Path
 import re
 import json
 import logging
+from contextlib import ExitStack
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from pdf_parser.parsers.fitz_parser import parse_with_fitz
-from pdf_parser.parsers.plumber_parser import parse_with_pdfplumber
 from pdf_parser.parsers.unstructured_parser import parse_with_unstructured
-from pdf_parser.utils.merging import merge_parsers
-from pdf_parser.utils.text_cleaning import clean_text, get_title_level, generate_doc_id
-from pdf_parser.utils.page_mapping import make_page_text_map, guess_page_range
+from pdf_parser.page_parser import (
+    ParseOptions, parse_pages, parse_page_range, split_page_ranges, summarize_parsers, summarize_categories,
+    find_main_title
+)
+from pdf_parser.supervisor import SupervisedPool, OK, TIMEOUT, CRASHED
+from pdf_parser.utils.triage import BLANK, SCANNED
+from pdf_parser.utils.merging import DEFAULT_CASCADE_MIN_SCORE
+from pdf_parser.utils.text_cleaning import generate_doc_id
+from pdf_parser.utils.logging_config import setup_logging
+from pdf_parser.utils.manifest import ConversionManifest, write_json_atomic
+from pdf_parser.utils.chunk_io import ChunkWriter, chunk_output_path
+from pdf_parser.utils.chunking import (
+    BlockChunker, StreamingChunker, token_length_function, DEFAULT_TOKEN_ENCODING
+)
+from pdf_parser.utils.checkpoint import (
+    CheckpointJournal, Quarantine, append_journal, DEFAULT_MAX_ATTEMPTS, QUARANTINE_NAME
+)
+from pdf_parser.utils.dedup import NearDuplicateFilter, DEFAULT_DEDUP_THRESHOLD
+from pdf_parser.utils.instrumentation import (
+    METRICS_NAME, FileMetrics, PageMetrics, MetricsLog, measure, RssSampler, current_rss_mb, summarize_metrics,
+    profile_call
+)
+
+# 청크 결과 형식/계산 방식이 바뀌면 올려서 매니페스트가 기존 출력을 다시 만들도록 한다
+# 2: 블록의 실제 페이지 + 문자 오프셋 기반 page_start/page_end
+# 3: 블록 기반 청커(기본값) + 청크 문자 오프셋(char_start/char_end)과 원본 블록 번호(block_ids)
+OUTPUT_VERSION = 3
+
+# 메모리 제한 모드: 한 번에 분석할 페이지 수 (예산 초과 시 절반씩 줄임)
+BOUNDED_WINDOW_PAGES = 32
+# 메모리 제한 모드: chunk_size의 이 배수만큼 텍스트가 쌓이면 청크로 나눠 기록
+BOUNDED_WINDOW_CHUNKS = 50
+
+
+def _convert_pdf_worker(pdf_path_str, converter_options, journal_path=None, digest=None):
+    """
+    프로세스 풀 워커: PDF 한 개를 변환하고 카운터/로그를 부모 프로세스로 반환
+    - journal_path가 있으면 변환 시작을 워커에서 직접 체크포인트 저널에 기록
+      (워커가 죽으면 start만 남아 다음 --resume 때 시도 횟수로 집계된다)
+    """
+    if journal_path:
+        append_journal(journal_path, {"event": "start", "file": Path(pdf_path_str).name, "sha256": digest})
+    converter = PDFConverter(input_dir="", **converter_options)
+    converter.convert_single_pdf(Path(pdf_path_str))
+    return converter.success_count, converter.failure_count, converter.success_log, converter.metrics
+
 
 class PDFConverter:
-    def __init__(self, input_dir, output_dir="outputs", output_format="json"):
+    def __init__(self, input_dir, output_dir="outputs", output_format="json", workers=1,
+                 page_workers=1, page_parallel_min_pages=100,
+                 chunk_size=1000, chunk_overlap=150, unstructured_strategy="fast", force=False,
+                 unstructured_mode="fallback", compression=None, dedup_threshold=DEFAULT_DEDUP_THRESHOLD,
+                 cascade=False, cascade_min_score=DEFAULT_CASCADE_MIN_SCORE, triage=True,
+                 metrics_path=None, profile_slowest=0, memory_budget_mb=None,
+                 resume=False, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 doc_timeout=None, page_timeout=None, recycle_after=None,
+                 chunker="native", length_unit="chars", token_encoding=DEFAULT_TOKEN_ENCODING):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.output_format = output_format.lower()
+        # 청크 파일 압축 방식: None / "gzip" / "zstd"
+        self.compression = compression
+        self.workers = max(1, int(workers or 1))
+        # page_parallel_min_pages 이상인 문서만 페이지 구간으로 나눠 병렬 분석
+        self.page_workers = max(1, int(page_workers or 1))
+        self.page_parallel_min_pages = page_parallel_min_pages
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        # 청크 분할 방식: native(블록 기반 BlockChunker) / langchain(RecursiveCharacterTextSplitter)
+        self.chunker = chunker
+        # 청크 크기 기준: chars(글자 수) / tokens(token_encoding 기준 토큰 수, tiktoken 필요)
+        self.length_unit = length_unit
+        self.token_encoding = token_encoding
+        self.unstructured_strategy = unstructured_strategy
+        # fallback: 두 파서가 모두 실패한 페이지만 Unstructured로 분석
+        # full: 문서 전체를 Unstructured로 한 번 더 분석해 중복 제거 후 병합 / off: 사용 안 함
+        self.unstructured_mode = unstructured_mode
+        # Unstructured 블록 병합 시 근사 중복 판정 임계값 (0이면 정확히 같은 content만 제거)
+        self.dedup_threshold = dedup_threshold
+        self.parse_options = ParseOptions(cascade=cascade, cascade_min_score=cascade_min_score, triage=triage,
+                                          page_timeout=page_timeout)
+        # 문서 한 개의 변환 제한 시간(초), 지정하면 감독 워커 프로세스에서 변환하고 초과 시 워커를 강제 종료
+        self.doc_timeout = doc_timeout
+        # 워커 프로세스 하나가 이 개수만큼 문서를 처리하면 새 프로세스로 교체 (네이티브 메모리 누수 제한)
+        self.recycle_after = recycle_after
+        # force=True이면 매니페스트와 무관하게 모든 파일을 다시 변환
+        self.force = force
         self.success_count = 0
         self.failure_count = 0
+        self.skipped_count = 0
         self.success_log = []
+        # 파일/페이지별 계측 결과 (FileMetrics), metrics_path가 없으면 output_dir/metrics.jsonl에 기록
+        self.metrics = []
+        self.metrics_path = Path(metrics_path) if metrics_path else self.output_dir / METRICS_NAME
+        self._metrics_log = None
+        # 가장 오래 걸린 파일 N개를 cProfile로 다시 실행해 output_dir/profiles에 저장
+        self.profile_slowest = profile_slowest
+        # 지정하면 메모리 제한 모드: 페이지 window 단위 분석 + 청크 스트리밍, 워커 프로세스별 RSS 목표치(MB)
+        self.memory_budget_mb = memory_budget_mb
+        # resume=True이면 체크포인트 저널을 이어서 사용해 중단된 배치를 이어서 변환
+        self.resume = resume
+        # 같은 내용으로 max_attempts번 실패한 파일은 quarantine.json에 격리하고 다시 시도하지 않음 (force로 해제)
+        self.max_attempts = max_attempts
+        self.resumed_count = 0
+        self.timeout_count = 0
+        self.crash_count = 0
+        self.quarantined = []
+        self._journal = None
+        self._quarantine = None
+        self._digests = {}
+
+    def _worker_options(self):
+        """워커 프로세스에서 같은 설정의 PDFConverter를 만들기 위한 인자"""
+        return {
+            "output_dir": str(self.output_dir),
+            "output_format": self.output_format,
+            "compression": self.compression,
+            "page_workers": self.page_workers,
+            "page_parallel_min_pages": self.page_parallel_min_pages,
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "chunker": self.chunker,
+            "length_unit": self.length_unit,
+            "token_encoding": self.token_encoding,
+            "unstructured_strategy": self.unstructured_strategy,
+            "unstructured_mode": self.unstructured_mode,
+            "dedup_threshold": self.dedup_threshold,
+            "cascade": self.parse_options.cascade,
+            "cascade_min_score": self.parse_options.cascade_min_score,
+            "triage": self.parse_options.triage,
+            "memory_budget_mb": self.memory_budget_mb,
+            "page_timeout": self.parse_options.page_timeout,
+        }
+
+    def manifest_config(self):
+        """출력 결과에 영향을 주는 설정 (매니페스트 비교 키)"""
+        return {
+            "output_version": OUTPUT_VERSION,
+            "output_format": self.output_format,
+            "compression": self.compression,
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "chunker": self.chunker,
+            "length_unit": self.length_unit,
+            "token_encoding": self.token_encoding if self.length_unit == "tokens" else None,
+            "unstructured_strategy": self.unstructured_strategy,
+            "unstructured_mode": self.unstructured_mode,
+            "dedup_threshold": self.dedup_threshold,
+            "cascade": self.parse_options.cascade,
+            "cascade_min_score": self.parse_options.cascade_min_score,
+            "triage": self.parse_options.triage,
+            "bounded_memory": self.memory_budget_mb is not None,
+        }
 
     def convert_single_pdf(self, pdf_path):
+        """
+        PDF 한 개를 변환하고 파일/페이지별 계측 결과를 self.metrics에 추가
+        """
+        metrics = FileMetrics(filename=pdf_path.name)
+        failures = self.failure_count
+        rss = RssSampler()
+        try:
+            with rss, measure(metrics.timings, "total"):
+                self._convert_pdf(pdf_path, metrics)
+            if self.failure_count > failures:
+                metrics.status = "failed"
+        except Exception:
+            metrics.status = "error"
+            raise
+        finally:
+            metrics.peak_rss_mb = rss.peak
+            metrics.rss_delta_mb = rss.delta
+            self._record_metrics(metrics)
+
+    def _record_metrics(self, metrics):
+        self.metrics.append(metrics)
+        if self._metrics_log is not None:
+            self._metrics_log.write(metrics)
+
+    def _open_documents(self, pdf_path, metrics):
+        """
+        fitz / pdfplumber 문서를 열어 반환, 실패하면 실패로 집계하고 None
+        """
         import fitz, pdfplumber
         try:
-            doc_fitz = fitz.open(pdf_path)
-            doc_plumber = pdfplumber.open(pdf_path)
+            with measure(metrics.timings, "open"):
+                doc_fitz = fitz.open(pdf_path)
+                doc_plumber = pdfplumber.open(pdf_path)
         except Exception as e:
             logging.warning(f"[{pdf_path.name}] PDF 열기 실패: {e}")
             self.failure_count += 1
-            return
+            return None
 
         if len(doc_fitz) != len(doc_plumber.pages):
             logging.warning(f"[{pdf_path.name}] 페이지 수 불일치")
+            doc_fitz.close()
+            doc_plumber.close()
             self.failure_count += 1
+            return None
+        return doc_fitz, doc_plumber
+
+    def _convert_pdf(self, pdf_path, metrics):
+        if self.memory_budget_mb is not None:
+            self._convert_pdf_bounded(pdf_path, metrics)
             return
 
-        all_blocks = []
-        main_title_text = None
+        docs = self._open_documents(pdf_path, metrics)
+        if docs is None:
+            return
+        doc_fitz, doc_plumber = docs
 
-        for i in tqdm(range(len(doc_fitz)), desc=pdf_path.name, leave=False):
-            try:
-                f_result = parse_with_fitz(doc_fitz[i])
-                p_result = parse_with_pdfplumber(doc_plumber.pages[i])
-                text, table = merge_parsers(f_result, p_result)
-
-                if text:
-                    clean = clean_text(text)
-                    level = get_title_level(clean)
-                    block_type = "title" if level > 0 else "text"
-                    block = {"type": block_type, "content": clean}
-                    if block_type == "title":
-                        block["level"] = level
-                        if level == 1 and not main_title_text:
-                            main_title_text = clean
-                    all_blocks.append(block)
-
-                if table:
-                    all_blocks.append({"type": "table", "content": table.strip()})
+        page_count = metrics.pages = len(doc_fitz)
+        with measure(metrics.timings, "parse"):
+            if self.page_workers > 1 and page_count >= self.page_parallel_min_pages:
+                doc_fitz.close()
+                doc_plumber.close()
+                page_results = self._parse_pages_parallel(pdf_path, page_count)
+            else:
+                page_results = parse_pages(pdf_path.name, doc_fitz, doc_plumber, range(page_count),
+                                           self.parse_options, progress=True)
+                doc_fitz.close()
+                doc_plumber.close()
 
-            except Exception as e:
-                logging.warning(f"[{pdf_path.name}] Page {i+1} 처리 오류: {e}")
-                continue
+        dedup = NearDuplicateFilter(threshold=self.dedup_threshold)
+        dedup.add_all(b["content"] for r in page_results for b in r.blocks)
 
-        doc_fitz.close()
-        doc_plumber.close()
+        if self.unstructured_mode == "fallback":
+            with measure(metrics.timings, "unstructured"):
+                self._apply_unstructured_fallback(pdf_path, page_results, dedup)
 
-        u_blocks = parse_with_unstructured(pdf_path)
-        existing_contents = set(b["content"] for b in all_blocks)
-        for ub in u_blocks:
-            if ub["content"] not in existing_contents:
-                all_blocks.append(ub)
-                existing_contents.add(ub["content"])
+        all_blocks = [b for r in page_results for b in r.blocks]
+        main_title_text = find_main_title(all_blocks)
+
+        if self.unstructured_mode == "full":
+            with measure(metrics.timings, "unstructured"):
+                u_blocks = parse_with_unstructured(pdf_path, strategy=self.unstructured_strategy)
+                for ub in u_blocks:
+                    if not dedup.check_and_add(ub["content"]):
+                        all_blocks.append(ub)
 
+        metrics.page_metrics = [PageMetrics(page=r.page, category=r.category, parser=r.parser, timings=r.timings)
+                                for r in page_results]
+        metrics.blocks = len(all_blocks)
         if not all_blocks:
             self.failure_count += 1
             return
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
         doc_id = generate_doc_id(pdf_path.stem, main_title_text)
+        outputs = []
 
-        if self.output_format == "json":
-            full_text = "\n\n".join(b["content"] for b in all_blocks)
-            splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=150)
-            chunks = splitter.create_documents([full_text])
-
-
-            page_map = make_page_text_map(all_blocks)
-
-            chunked_result = []
-            for i, chunk in enumerate(chunks):
-                p_start, p_end = guess_page_range(chunk.page_content, page_map)
-                chunked_result.append({
-                    "doc_id": doc_id,
-                    "chunk_id": f"{doc_id}_{i}",
-                    "file_name": pdf_path.name,
-                    "content": chunk.page_content,
-                    "metadata": {
-                        "page_start": p_start,
-                        "page_end": p_end,
-                        "chunk_index": i
-                    }
-                })
-
-            output_path = self.output_dir / f"{pdf_path.stem}_chunked.json"
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(chunked_result, f, ensure_ascii=False, indent=2)
+        if self.output_format in ("json", "jsonl"):
+            with measure(metrics.timings, "chunking"):
+                chunker = self._make_chunker()
+                chunks = [c for b in all_blocks for c in chunker.add(b)]
+                chunks.extend(chunker.finish())
+
+            output_path = chunk_output_path(self.output_dir, pdf_path.stem, self.output_format, self.compression)
+            with measure(metrics.timings, "writing"), \
+                    ChunkWriter(output_path, self.output_format, self.compression) as writer:
+                for i, chunk in enumerate(chunks):
+                    writer.write(self._chunk_record(doc_id, pdf_path, i, chunk))
+            print(f"[저장 완료] {output_path}")
+            outputs.append(output_path.name)
+            metrics.chunks = writer.count
+            metrics.bytes_written = writer.bytes_written
+
+        self._log_success(pdf_path, len(all_blocks), outputs, page_results, dedup)
+
+    def _convert_pdf_bounded(self, pdf_path, metrics):
+        """
+        메모리 제한 모드 변환 (memory_budget_mb 지정 시)
+        - 페이지를 window 단위로 분석하고, pdfplumber 페이지 캐시는 페이지마다 해제한다.
+        - 블록은 청커(BlockChunker/StreamingChunker)로 바로 청크로 만들어 기록하므로 전체 블록/전체 텍스트/청크 리스트를 들고 있지 않는다.
+        - doc_id는 첫 window의 1레벨 제목으로 정한다. 첫 window에 1레벨 제목이 없으면 청크를 쌓아 두지 않도록
+          파일명만으로 정하므로, 제목이 그 뒤 페이지에 처음 나오는 문서는 일반 모드와 doc_id가 다를 수 있다.
+        - window마다 RSS를 확인해 예산을 넘으면 MuPDF 캐시를 비우고 다음 window 크기를 줄인다.
+        - Unstructured fallback의 중복 검사는 그때까지 분석한 블록 기준으로 한다.
+        """
+        docs = self._open_documents(pdf_path, metrics)
+        if docs is None:
+            return
+        doc_fitz, doc_plumber = docs
+        page_count = metrics.pages = len(doc_fitz)
+        options = replace(self.parse_options, release_pages=True)
+
+        chunker = None
+        if self.output_format in ("json", "jsonl"):
+            chunker = self._make_chunker(window_chars=self.chunk_size * BOUNDED_WINDOW_CHUNKS)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = chunk_output_path(self.output_dir, pdf_path.stem, self.output_format, self.compression)
+
+        dedup = NearDuplicateFilter(threshold=self.dedup_threshold)
+        page_results, pending_chunks = [], []
+        block_count = 0
+        doc_id = writer = None
+        window = BOUNDED_WINDOW_PAGES
+        budget_warned = False
+
+        with ExitStack() as stack:
+            stack.callback(doc_fitz.close)
+            stack.callback(doc_plumber.close)
+            progress = stack.enter_context(tqdm(total=page_count, desc=pdf_path.name, leave=False))
+            start = 0
+            while start < page_count:
+                end = min(start + window, page_count)
+                with measure(metrics.timings, "parse"):
+                    window_results = parse_pages(pdf_path.name, doc_fitz, doc_plumber, range(start, end), options)
+                dedup.add_all(b["content"] for r in window_results for b in r.blocks)
+                if self.unstructured_mode == "fallback":
+                    with measure(metrics.timings, "unstructured"):
+                        self._apply_unstructured_fallback(pdf_path, window_results, dedup)
+
+                blocks = [b for r in window_results for b in r.blocks]
+                block_count += len(blocks)
+                if doc_id is None:
+                    doc_id = generate_doc_id(pdf_path.stem, find_main_title(blocks))
+                if chunker is not None:
+                    with measure(metrics.timings, "chunking"):
+                        pending_chunks.extend(c for b in blocks for c in chunker.add(b))
+                    if pending_chunks:
+                        with measure(metrics.timings, "writing"):
+                            writer = self._write_chunks(stack, writer, output_path, doc_id, pdf_path, pending_chunks)
+                        pending_chunks = []
+
+                # 요약 통계(파서/분류/시간)만 남기고 블록은 버린다
+                for r in window_results:
+                    r.blocks = []
+                page_results.extend(window_results)
+                progress.update(end - start)
+                start = end
+                window, over_budget = self._check_memory_budget(window)
+                if over_budget and not budget_warned:
+                    logging.warning(f"[{pdf_path.name}] 메모리 예산 초과: RSS {over_budget:.0f}MB > {self.memory_budget_mb}MB")
+                    budget_warned = True
+
+            if self.unstructured_mode == "full":
+                with measure(metrics.timings, "unstructured"):
+                    u_blocks = [ub for ub in parse_with_unstructured(pdf_path, strategy=self.unstructured_strategy)
+                                if not dedup.check_and_add(ub["content"])]
+                block_count += len(u_blocks)
+                if chunker is not None:
+                    with measure(metrics.timings, "chunking"):
+                        pending_chunks.extend(c for ub in u_blocks for c in chunker.add(ub))
+
+            metrics.page_metrics = [PageMetrics(page=r.page, category=r.category, parser=r.parser, timings=r.timings)
+                                    for r in page_results]
+            metrics.blocks = block_count
+            if not block_count:
+                self.failure_count += 1
+                return
+
+            outputs = []
+            if chunker is not None:
+                doc_id = doc_id or generate_doc_id(pdf_path.stem, None)
+                with measure(metrics.timings, "chunking"):
+                    pending_chunks.extend(chunker.finish())
+                with measure(metrics.timings, "writing"):
+                    writer = self._write_chunks(stack, writer, output_path, doc_id, pdf_path, pending_chunks)
+                    stack.close()
                 print(f"[저장 완료] {output_path}")
+                outputs.append(output_path.name)
+                metrics.chunks = writer.count
+                metrics.bytes_written = writer.bytes_written
+
+        self._log_success(pdf_path, block_count, outputs, page_results, dedup)
+
+    def _make_chunker(self, window_chars=float("inf")):
+        """
+        설정에 맞는 청커 생성 (add(block) / finish()로 Chunk 리스트를 돌려주는 객체)
+        - langchain: window_chars만큼 쌓일 때마다 나누는 StreamingChunker (기본값은 finish()에서 한 번에 분할)
+        """
+        length_function = token_length_function(self.token_encoding) if self.length_unit == "tokens" else len
+        if self.chunker == "langchain":
+            from langchain.text_splitter import RecursiveCharacterTextSplitter
+            splitter = RecursiveCharacterTextSplitter(chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap,
+                                                      length_function=length_function, add_start_index=True)
+            return StreamingChunker(splitter, self.chunk_size, window_chars=window_chars,
+                                    length_function=length_function)
+        return BlockChunker(self.chunk_size, self.chunk_overlap, length_function=length_function)
+
+    def _write_chunks(self, stack, writer, output_path, doc_id, pdf_path, chunks):
+        """
+        Chunk들을 기록, writer가 아직 없으면 열어서 stack에 등록
+        - 반환값: writer
+        """
+        if writer is None:
+            writer = stack.enter_context(ChunkWriter(output_path, self.output_format, self.compression))
+        for chunk in chunks:
+            writer.write(self._chunk_record(doc_id, pdf_path, writer.count, chunk))
+        return writer
+
+    def _check_memory_budget(self, window):
+        """
+        RSS가 memory_budget_mb를 넘으면 캐시를 비우고 다음 window를 절반으로 줄임
+        - 반환값: (다음 window 페이지 수, 캐시를 비운 뒤에도 예산을 넘으면 그때의 RSS(MB) 아니면 None)
+        """
+        rss = current_rss_mb()
+        if rss is None or rss <= self.memory_budget_mb:
+            return window, None
+        import gc, fitz
+        gc.collect()
+        fitz.TOOLS.store_shrink(100)  # MuPDF 리소스 캐시(글꼴/이미지) 비우기
+        rss = current_rss_mb()
+        return max(1, window // 2), (rss if rss > self.memory_budget_mb else None)
 
+    def _chunk_record(self, doc_id, pdf_path, index, chunk):
+        return {
+            "doc_id": doc_id,
+            "chunk_id": f"{doc_id}_{index}",
+            "file_name": pdf_path.name,
+            "content": chunk.content,
+            "metadata": {
+                "page_start": chunk.page_start,
+                "page_end": chunk.page_end,
+                "chunk_index": index,
+                "char_start": chunk.char_start,
+                "char_end": chunk.char_end,
+                "block_ids": chunk.block_ids
+            }
+        }
+
+    def _log_success(self, pdf_path, block_count, outputs, page_results, dedup):
         self.success_count += 1
-        self.success_log.append({"filename": pdf_path.name, "block_count": len(all_blocks)})
+        self.success_log.append({
+            "filename": pdf_path.name,
+            "block_count": block_count,
+            "outputs": outputs,
+            "page_parsers": [r.parser for r in page_results],
+            "parser_stats": summarize_parsers(page_results),
+            "dedup_removed_blocks": dedup.removed_blocks,
+            "dedup_removed_bytes": dedup.removed_bytes,
+            "page_categories": summarize_categories(page_results),
+            "scanned_pages": [r.page for r in page_results if r.category == SCANNED],
+            "timed_out_pages": [r.page for r in page_results if r.timed_out],
+        })
+
+    def _apply_unstructured_fallback(self, pdf_path, page_results, dedup):
+        """
+        fitz와 pdfplumber 결과가 모두 유효하지 않은 페이지만 Unstructured로 다시 분석하여
+        해당 페이지 위치에 블록을 채워 넣는다. (dedup: 기존 블록이 등록된 중복 필터)
+        """
+        failed_pages = [r.page for r in page_results if r.parser is None and r.category != BLANK]
+        if not failed_pages:
+            return
+        u_blocks = parse_with_unstructured(pdf_path, strategy=self.unstructured_strategy, pages=failed_pages)
+        results_by_page = {r.page: r for r in page_results}
+        for ub in u_blocks:
+            result = results_by_page.get(ub.get("page"))
+            if result is None or dedup.check_and_add(ub["content"]):
+                continue
+            result.blocks.append(ub)
+            result.parser = "unstructured"
+
+    def _parse_pages_parallel(self, pdf_path, page_count):
+        """
+        큰 문서를 페이지 구간으로 나눠 프로세스 풀에서 분석한 뒤 페이지 순서대로 이어 붙임
+        - 구간을 워커 수보다 잘게 나눠 페이지별 처리 시간 편차를 흡수
+        """
+        ranges = split_page_ranges(page_count, self.page_workers * 4)
+        page_results = [None] * page_count
+        with ProcessPoolExecutor(max_workers=min(self.page_workers, len(ranges)), initializer=setup_logging) as executor:
+            futures = [executor.submit(parse_page_range, str(pdf_path), start, end, self.parse_options)
+                       for start, end in ranges]
+            for future in tqdm(as_completed(futures), total=len(futures), desc=pdf_path.name, unit="range", leave=False):
+                start, range_results = future.result()
+                page_results[start:start + len(range_results)] = range_results
+        return page_results
 
     def convert_documents(self):
-        pdf_files = list(self.input_dir.glob("*.pdf"))
+        # 정렬해서 순차/병렬 모드 모두 처리 순서와 요약 결과가 결정적이도록 한다
+        pdf_files = sorted(self.input_dir.glob("*.pdf"))
+
+        manifest = ConversionManifest(self.output_dir, self.manifest_config())
+        removed = manifest.remove_stale(p.name for p in pdf_files)
+        if removed:
+            print(f"🗑 삭제된 입력 파일 {len(removed)}개의 출력 정리")
+
+        journal = CheckpointJournal(self.output_dir, self.manifest_config(), resume=self.resume and not self.force)
+        quarantine = Quarantine(self.output_dir)
+        current = {p.name for p in pdf_files}
+        for name in list(quarantine.entries):
+            if name not in current or self.force:
+                quarantine.release(name)
+
+        pending, digests = [], {}
+        for pdf_path in pdf_files:
+            name = pdf_path.name
+            digest = manifest.content_hash(pdf_path)
+            if not self.force and manifest.is_up_to_date(pdf_path, digest):
+                self.skipped_count += 1
+                continue
+            if quarantine.is_quarantined(name, digest):
+                self.quarantined.append(name)
+                continue
+            # 중단된 배치에서 이미 성공한 파일은 매니페스트에만 반영
+            outputs = journal.completed_outputs(name, digest)
+            if outputs is not None and all((self.output_dir / o).exists() for o in outputs):
+                manifest.record(pdf_path, digest, outputs)
+                self.resumed_count += 1
+                continue
+            attempts = journal.attempts(name, digest)
+            if attempts >= self.max_attempts:
+                quarantine.add(name, digest, attempts, journal.last_error(name, digest))
+                self.quarantined.append(name)
+                continue
+            digests[name] = digest
+            pending.append(pdf_path)
+        quarantine.save()
+        if self.resumed_count:
+            print(f"↩ 체크포인트에서 이어서 진행: 완료된 파일 {self.resumed_count}개 건너뜀")
+
+        self._journal, self._quarantine, self._digests = journal, quarantine, digests
+        try:
+            with MetricsLog(self.metrics_path, append=self.resume) as self._metrics_log:
+                self._convert_files(pending)
+        finally:
+            self._metrics_log = None
+            self._journal = self._quarantine = None
+            self._update_manifest(manifest, pending, digests)
+
+    def _update_manifest(self, manifest, pdf_files, digests):
+        """변환에 성공한 파일은 기록하고, 실패한 파일은 다음 실행에서 다시 시도하도록 제거"""
+        outputs_by_name = {log["filename"]: log.get("outputs", []) for log in self.success_log}
+        for pdf_path in pdf_files:
+            if pdf_path.name in outputs_by_name:
+                manifest.record(pdf_path, digests[pdf_path.name], outputs_by_name[pdf_path.name])
+            else:
+                manifest.forget(pdf_path.name)
+        manifest.save()
+
+    def _convert_files(self, pdf_files):
+        # 제한 시간/워커 재활용은 별도 프로세스에서만 가능하므로 workers=1이어도 감독 워커 풀을 사용
+        if (self.workers > 1 and len(pdf_files) > 1) or (pdf_files and (self.doc_timeout or self.recycle_after)):
+            self._convert_documents_parallel(pdf_files)
+            return
+
         for pdf_path in tqdm(pdf_files, desc="전체 PDF 순차 처리", unit="file"):
+            self._journal.start(pdf_path.name, self._digests[pdf_path.name])
+            successes, failures, logs, error = self.success_count, self.failure_count, len(self.success_log), None
             try:
                 self.convert_single_pdf(pdf_path)
             except Exception as e:
                 logging.warning(f"[{pdf_path.name}] 순차 처리 중 예외 발생: {e}")
+                error = f"예외: {e}"
+                # 병렬 처리와 같이 예외가 난 파일은 중간에 집계된 값과 관계없이 실패 1건으로 집계
+                self.success_count, self.failure_count = successes, failures + 1
+                del self.success_log[logs:]
+            self._checkpoint(pdf_path.name, self.success_log if self.success_count > successes else None, error)
+
+    def _checkpoint(self, name, success_log, error=None):
+        """
+        파일 한 개의 결과를 체크포인트 저널에 기록
+        - success_log: 성공했으면 해당 파일의 success_log가 들어 있는 리스트, 실패했으면 None
+        - 실패 횟수가 max_attempts에 도달하면 격리 목록에 추가
+        """
+        digest = self._digests[name]
+        if success_log is not None:
+            outputs = next((log.get("outputs", []) for log in reversed(success_log) if log["filename"] == name), [])
+            self._journal.done(name, digest, outputs)
+            return
+        error = error or "변환 실패"
+        self._journal.failed(name, digest, error)
+        attempts = self._journal.attempts(name, digest)
+        if attempts >= self.max_attempts:
+            self._quarantine.add(name, digest, attempts, error)
+            self.quarantined.append(name)
+
+    def _convert_documents_parallel(self, pdf_files):
+        """
+        감독 워커 풀(SupervisedPool)로 파일 단위 변환
+        - doc_timeout을 넘기거나 워커 프로세스가 죽으면 해당 파일만 실패(시간 초과/비정상 종료)로 처리하고 워커를 교체
+        - 워커별 성공/실패 카운터와 success_log를 입력 순서대로 부모에 병합
+        """
+        results = {}
+        workers = min(self.workers, len(pdf_files))
+        pool = SupervisedPool(workers, task_timeout=self.doc_timeout, max_tasks_per_worker=self.recycle_after,
+                              initializer=setup_logging)
+        tasks = [
+            (idx, _convert_pdf_worker,
+             (str(pdf_path), self._worker_options(), str(self._journal.path), self._digests[pdf_path.name]))
+            for idx, pdf_path in enumerate(pdf_files)
+        ]
+        for idx, status, value in tqdm(pool.run(tasks), total=len(tasks),
+                                       desc=f"전체 PDF 병렬 처리 (workers={workers})", unit="file"):
+            name = pdf_files[idx].name
+            # start는 워커가 저널에 직접 기록했으므로 부모 상태에만 반영
+            self._journal.record_start(name, self._digests[name])
+            if status == OK:
+                results[idx] = value
+                success, _, success_log, _ = value
+                self._checkpoint(name, success_log if success else None)
+                continue
+
+            if status == TIMEOUT:
+                self.timeout_count += 1
+                reason, metrics_status = f"시간 초과 ({value})", "timeout"
+            elif status == CRASHED:
+                self.crash_count += 1
+                reason, metrics_status = value, "crashed"
+            else:
+                reason, metrics_status = f"예외: {value}", "error"
+            logging.warning(f"[{name}] 병렬 처리 실패: {reason}")
+            results[idx] = (0, 1, [], [FileMetrics(filename=name, status=metrics_status)])
+            self._checkpoint(name, None, reason)
+        if pool.replaced:
+            print(f"♻ 교체한 워커 프로세스: {pool.replaced}개")
+
+        for idx in range(len(pdf_files)):
+            success, failure, success_log, metrics = results[idx]
+            self.success_count += success
+            self.failure_count += failure
+            self.success_log.extend(success_log)
+            for file_metrics in metrics:
+                self._record_metrics(file_metrics)
 
     def print_summary(self):
         total = self.success_count + self.failure_count
@@ -128,15 +633,112 @@ class PDFConverter:
         print(f"총 파일 수: {total}개")
         print(f"\u2705 성공: {self.success_count}개")
         print(f"\u274c 실패: {self.failure_count}개")
+        if self.timeout_count or self.crash_count:
+            print(f"  - 시간 초과: {self.timeout_count}개 / 워커 비정상 종료: {self.crash_count}개")
         print(f"성공률: {success_rate:.1f}%")
+        if self.skipped_count:
+            print(f"⏭ 변경 없음(건너뜀): {self.skipped_count}개")
+        if self.resumed_count:
+            print(f"↩ 체크포인트로 완료 처리: {self.resumed_count}개")
+        if self.quarantined:
+            print(f"🚫 격리됨(반복 실패, 재시도 안 함): {len(self.quarantined)}개 -> {self.output_dir / QUARANTINE_NAME}")
         if self.success_log:
             avg_len = sum(log['block_count'] for log in self.success_log) / len(self.success_log)
             print(f"평균 블록 수: {avg_len:.0f}")
+            stats = {"fitz": 0, "plumber": 0, "unstructured": 0, "none": 0, "plumber_calls": 0}
+            for log in self.success_log:
+                for key, value in log.get("parser_stats", {}).items():
+                    stats[key] += value
+            total_pages = stats["fitz"] + stats["plumber"] + stats["unstructured"] + stats["none"]
+            removed_blocks = sum(log.get("dedup_removed_blocks", 0) for log in self.success_log)
+            removed_bytes = sum(log.get("dedup_removed_bytes", 0) for log in self.success_log)
+            categories = {}
+            for log in self.success_log:
+                for key, value in log.get("page_categories", {}).items():
+                    categories[key] = categories.get(key, 0) + value
+            if categories:
+                print("페이지 분류: " + " / ".join(f"{k} {v}" for k, v in sorted(categories.items())))
+            scanned = self.scanned_queue()
+            if scanned:
+                print(f"스캔 페이지: {sum(len(q['pages']) for q in scanned)}페이지 ({len(scanned)}개 파일, OCR 대기열)")
+            timed_out_pages = sum(len(log.get("timed_out_pages", [])) for log in self.success_log)
+            if timed_out_pages:
+                print(f"페이지 시간 초과: {timed_out_pages}페이지")
+            print(f"중복 블록 제거: {removed_blocks}개 ({removed_bytes / 1024:.1f} KB)")
+            print(f"페이지별 채택 파서: fitz {stats['fitz']} / plumber {stats['plumber']}"
+                  f" / unstructured {stats['unstructured']} / 없음 {stats['none']}"
+                  f" (pdfplumber 호출 {stats['plumber_calls']}/{total_pages}페이지)")
+        self._print_metrics_summary()
         print("=" * 50)
 
+    def _print_metrics_summary(self):
+        """계측 결과 분포 (p50 / p95 / max)"""
+        summary = summarize_metrics(self.metrics)
+        if not summary["file_wall"]:
+            return
+
+        def fmt(dist, scale=1.0, unit="s", digits=2):
+            return " / ".join(f"{k} {v * scale:.{digits}f}{unit}" for k, v in dist.items())
+
+        slowest = max((m for m in self.metrics if m.status == "success"), key=lambda m: m.wall("total"))
+        print(f"⏱ 파일별 처리 시간: {fmt(summary['file_wall'])} (최장: {slowest.filename})")
+        for key, label in (("page_fitz", "fitz"), ("page_plumber", "pdfplumber"), ("page_table", "표 추출")):
+            if summary[key]:
+                print(f"⏱ 페이지별 {label}: {fmt(summary[key], 1000, 'ms', 1)}")
+        if summary["rss_delta_mb"]:
+            print(f"💾 파일별 메모리(RSS) 증가분: {fmt(summary['rss_delta_mb'], unit='MB', digits=0)}"
+                  f" (최대 RSS {summary['peak_rss_mb']:.0f}MB)")
+        print(f"청크 수: {summary['chunks']}개 / 기록 {summary['bytes_written'] / 1024:.1f} KB"
+              f" (상세: {self.metrics_path})")
+
+    def profile_slowest_files(self, n):
+        """
+        처리 시간이 가장 긴 파일 n개를 cProfile로 다시 변환해 output_dir/profiles/{파일명}.prof(.txt) 저장
+        - 실제 출력에 영향이 없도록 임시 디렉토리에 순차 모드로 변환한다.
+        """
+        import tempfile
+        slowest = sorted((m for m in self.metrics if m.status == "success"),
+                         key=lambda m: m.wall("total"), reverse=True)[:n]
+        profile_dir = self.output_dir / "profiles"
+        for m in slowest:
+            pdf_path = self.input_dir / m.filename
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                options = {**self._worker_options(), "output_dir": tmp_dir, "page_workers": 1}
+                converter = PDFConverter(input_dir=self.input_dir, **options)
+                profile_call(profile_dir / f"{pdf_path.stem}.prof", converter.convert_single_pdf, pdf_path)
+            print(f"🔍 프로파일 저장: {profile_dir / pdf_path.stem}.prof ({m.wall('total'):.2f}s)")
+
+    def scanned_queue(self):
+        """텍스트 레이어가 없어 OCR이 필요한 스캔 페이지 목록"""
+        return [{"filename": log["filename"], "pages": log["scanned_pages"]}
+                for log in self.success_log if log.get("scanned_pages")]
+
+    def save_scanned_queue(self):
+        """
+        스캔 페이지 대기열을 output_dir/scanned_pages.json으로 저장
+        - 이번 실행에서 건너뛴(변경 없는) 파일의 기존 항목은 유지
+        """
+        path = self.output_dir / "scanned_pages.json"
+        converted = {log["filename"] for log in self.success_log}
+        current = {p.name for p in self.input_dir.glob("*.pdf")}
+        queue = []
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    queue = [q for q in json.load(f) if q["filename"] not in converted and q["filename"] in current]
+            except Exception as e:
+                logging.warning(f"[scanned_pages.json] 기존 대기열 로드 실패: {e}")
+        queue = sorted(queue + self.scanned_queue(), key=lambda q: q["filename"])
+        if queue:
+            write_json_atomic(path, queue)
+        elif path.exists():
+            path.unlink()
+
     def run_conversion(self):
-        from pdf_parser.utils.logging_config import setup_logging
         setup_logging()
-        print(f"PDF 변환 시작... 출력 형식: {self.output_format}")
+        print(f"PDF 변환 시작... 출력 형식: {self.output_format}, workers: {self.workers}")
         self.convert_documents()
-        self.print_summary()
\ No newline at end of file
+        self.save_scanned_queue()
+        self.print_summary()
+        if self.profile_slowest:
+            self.profile_slowest_files(self.profile_slowest)
\ No newline at end of file
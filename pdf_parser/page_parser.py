@@ -0,0 +1,195 @@
+from pathlib import Path
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+from tqdm import tqdm
+from pdf_parser.parsers.fitz_parser import parse_with_fitz
+from pdf_parser.parsers.plumber_parser import parse_with_pdfplumber
+from pdf_parser.utils.merging import select_parser, cascade_parsers, DEFAULT_CASCADE_MIN_SCORE
+from pdf_parser.utils.text_cleaning import clean_text, get_title_level
+from pdf_parser.utils.triage import triage_page, BLANK, SCANNED, TABLE_CANDIDATE
+from pdf_parser.utils.instrumentation import measure
+from pdf_parser.supervisor import page_time_limit, PageTimeout
+
+
+@dataclass
+class ParseOptions:
+    """페이지 분석 옵션 (워커 프로세스로 그대로 전달된다)"""
+    # fitz 결과가 충분하면 pdfplumber를 건너뛰는 cascade 모드
+    cascade: bool = False
+    cascade_min_score: int = DEFAULT_CASCADE_MIN_SCORE
+    # 저비용 신호로 페이지를 분류해 빈/스캔 페이지는 건너뛰고 표 후보 페이지에서만 표 추출
+    triage: bool = True
+    # 페이지 분석 후 pdfplumber 페이지 캐시(layout/objects)를 바로 해제 (메모리 제한 모드)
+    release_pages: bool = False
+    # 페이지 한 장의 분석 제한 시간(초), 넘기면 해당 페이지는 실패로 처리하고 다음 페이지로 넘어감
+    page_timeout: Optional[float] = None
+
+
+@dataclass
+class PageResult:
+    """페이지 한 장의 분석 결과"""
+    page: int                      # 1부터 시작하는 페이지 번호
+    blocks: List[dict] = field(default_factory=list)
+    parser: Optional[str] = None   # 채택된 파서 ("fitz" / "plumber" / "unstructured"), 모두 실패하면 None
+    plumber_called: bool = False
+    category: Optional[str] = None  # triage 분류 (blank / scanned / text / table_candidate)
+    # 단계별 wall/CPU 시간 {"triage" | "fitz" | "fitz_table" | "plumber" | "plumber_table": {"wall", "cpu"}}
+    timings: dict = field(default_factory=dict)
+    timed_out: bool = False         # page_timeout 초과로 분석을 중단한 페이지
+
+
+def parse_page(page_number, fitz_page, get_plumber_page, options=None):
+    """
+    페이지 한 장을 fitz + pdfplumber로 분석하여 PageResult로 반환
+    - get_plumber_page: pdfplumber 페이지를 돌려주는 함수 (cascade 모드에서는 필요할 때만 호출)
+    """
+    options = options or ParseOptions()
+    result = PageResult(page=page_number)
+
+    detect_tables = True
+    if options.triage:
+        with measure(result.timings, "triage"):
+            result.category, _ = triage_page(fitz_page)
+        if result.category in (BLANK, SCANNED):
+            # 빈 페이지는 버리고, 스캔 페이지는 텍스트 레이어가 없으므로 별도 대기열로 넘긴다
+            return result
+        detect_tables = result.category == TABLE_CANDIDATE
+
+    f_result = parse_with_fitz(fitz_page, detect_tables, result.timings)
+
+    if options.cascade:
+        parser, text, table, plumber_called = cascade_parsers(
+            f_result, lambda: parse_with_pdfplumber(get_plumber_page(), detect_tables, result.timings),
+            options.cascade_min_score
+        )
+    else:
+        p_result = parse_with_pdfplumber(get_plumber_page(), detect_tables, result.timings)
+        parser, text, table = select_parser(f_result, p_result)
+        plumber_called = True
+
+    result.parser = parser
+    result.plumber_called = plumber_called
+
+    if text:
+        clean = clean_text(text)
+        level = get_title_level(clean)
+        block_type = "title" if level > 0 else "text"
+        block = {"type": block_type, "content": clean, "page": page_number}
+        if block_type == "title":
+            block["level"] = level
+        result.blocks.append(block)
+
+    if table:
+        result.blocks.append({"type": "table", "content": table.strip(), "page": page_number})
+
+    return result
+
+
+def parse_pages(file_name, doc_fitz, doc_plumber, page_indices, options=None, progress=False):
+    """
+    지정한 페이지들을 순서대로 분석
+    - 반환값: PageResult 리스트 (page_indices 순서)
+    """
+    results = []
+    release_pages = options is not None and options.release_pages
+    page_timeout = options.page_timeout if options is not None else None
+    iterator = tqdm(page_indices, desc=file_name, leave=False) if progress else page_indices
+    for i in iterator:
+        # 페이지 분석이 끝난 직후(타이머 해제 전)에 SIGALRM이 오면 with 블록을 나가면서 PageTimeout이 난다.
+        # 이미 얻은 결과를 유지하고 페이지마다 결과를 정확히 하나만 추가해야 병렬 경로의 페이지 구간이 밀리지 않는다.
+        result = None
+        try:
+            with page_time_limit(page_timeout):
+                result = parse_page(i + 1, doc_fitz[i], lambda: doc_plumber.pages[i], options)
+        except PageTimeout as e:
+            if result is None:
+                logging.warning(f"[{file_name}] Page {i+1} 시간 초과: {e}")
+                result = PageResult(page=i + 1, timed_out=True)
+        except Exception as e:
+            if result is None:
+                logging.warning(f"[{file_name}] Page {i+1} 처리 오류: {e}")
+                result = PageResult(page=i + 1)
+        results.append(result)
+        if release_pages:
+            release_plumber_page(doc_plumber, i)
+    return results
+
+
+def release_plumber_page(doc_plumber, index):
+    """
+    pdfplumber가 페이지마다 캐시하는 layout/문자 객체를 해제
+    - 한 번 분석한 페이지는 다시 읽지 않으므로 캐시를 들고 있을 필요가 없다.
+    """
+    try:
+        page = doc_plumber.pages[index]
+        if hasattr(page, "close"):
+            page.close()
+        else:
+            page.flush_cache()
+    except Exception as e:
+        logging.warning(f"[pdfplumber] Page {index+1} 캐시 해제 실패: {e}")
+
+
+def parse_page_range(pdf_path_str, start, end, options=None):
+    """
+    프로세스 풀 워커: [start, end) 페이지 구간을 자체 fitz/pdfplumber 핸들로 분석
+    - 반환값: (start, PageResult 리스트)
+    """
+    import fitz, pdfplumber
+    pdf_path = Path(pdf_path_str)
+    doc_fitz = fitz.open(pdf_path)
+    doc_plumber = pdfplumber.open(pdf_path)
+    try:
+        return start, parse_pages(pdf_path.name, doc_fitz, doc_plumber, range(start, end), options)
+    finally:
+        doc_fitz.close()
+        doc_plumber.close()
+
+
+def split_page_ranges(page_count, parts):
+    """
+    페이지 수를 연속된 [start, end) 구간 parts개로 균등 분할
+    """
+    parts = max(1, min(parts, page_count))
+    size, rest = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for k in range(parts):
+        end = start + size + (1 if k < rest else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def summarize_parsers(page_results):
+    """
+    페이지별로 채택된 파서 통계
+    - 반환값: {"fitz": n, "plumber": n, "unstructured": n, "none": n, "plumber_calls": n}
+    """
+    stats = {"fitz": 0, "plumber": 0, "unstructured": 0, "none": 0, "plumber_calls": 0}
+    for r in page_results:
+        stats[r.parser or "none"] += 1
+        stats["plumber_calls"] += int(r.plumber_called)
+    return stats
+
+
+def summarize_categories(page_results):
+    """
+    triage 분류별 페이지 수 (triage를 끈 경우 빈 dict)
+    """
+    stats = {}
+    for r in page_results:
+        if r.category:
+            stats[r.category] = stats.get(r.category, 0) + 1
+    return stats
+
+
+def find_main_title(blocks):
+    """
+    문서의 첫 번째 1레벨 제목 (doc_id 생성에 사용)
+    """
+    for b in blocks:
+        if b.get("type") == "title" and b.get("level") == 1:
+            return b["content"]
+    return None
@@ -1,4 +1,5 @@
 import logging
+from pdf_parser.utils.instrumentation import measure
 
 
 
@@ -36,14 +37,20 @@ def extract_tables_as_markdown(page) -> str:
         logging.warning(f"[fitz table 추출 실패] {e}")
     return table_md
 
-def parse_with_fitz(page):
+def parse_with_fitz(page, detect_tables=True, timings=None):
     """
     PyMuPDF(fitz) 기반 페이지 PARSER
     - 블록 기준으로 병합된 텍스트와 표(markdown 변환)를 추출
+    - detect_tables=False이면 표 추출(find_tables)을 생략
+    - timings: dict를 넘기면 "fitz" / "fitz_table" wall/CPU 시간을 기록
     """
     try:
-        text = extract_text_blocks(page)
-        table_md = extract_tables_as_markdown(page)
+        with measure(timings, "fitz"):
+            text = extract_text_blocks(page)
+            table_md = ""
+            if detect_tables:
+                with measure(timings, "fitz_table"):
+                    table_md = extract_tables_as_markdown(page)
         return text, table_md
     except Exception as e:
         logging.warning(f"[fitz 파싱 실패] {e}")
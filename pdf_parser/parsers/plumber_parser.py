@@ -1,4 +1,5 @@
 import logging
+from pdf_parser.utils.instrumentation import measure
 
 def extract_text_plumber(page) -> str:
     return (page.extract_text() or "").strip()
@@ -17,14 +18,20 @@ def extract_table_markdown_plumber(page) -> str:
         logging.warning(f"[plumber table parsing 실패] {e}")
     return table_md
 
-def parse_with_pdfplumber(page):
+def parse_with_pdfplumber(page, detect_tables=True, timings=None):
     """
     pdfplumber 기반 페이지 PARSER
     - 텍스트와 첫 번째 표(markdown 변환)를 추출한다.
+    - detect_tables=False이면 표 추출(extract_table)을 생략
+    - timings: dict를 넘기면 "plumber" / "plumber_table" wall/CPU 시간을 기록
     """
     try:
-        text = extract_text_plumber(page)
-        table_md = extract_table_markdown_plumber(page)
+        with measure(timings, "plumber"):
+            text = extract_text_plumber(page)
+            table_md = ""
+            if detect_tables:
+                with measure(timings, "plumber_table"):
+                    table_md = extract_table_markdown_plumber(page)
         return text, table_md
     except Exception as e:
         logging.warning(f"[plumber 전체 파싱 실패] {e}")
@@ -1,16 +1,55 @@
+import os
 import logging
-from unstructured.partition.pdf import partition_pdf
+import tempfile
 
-def parse_with_unstructured(pdf_path):
+
+def _import_partition_pdf():
+    """unstructured는 import 비용이 커서 실제로 Unstructured 분석을 할 때만 불러온다"""
+    try:
+        from unstructured.partition.pdf import partition_pdf
+    except ImportError as e:
+        raise ImportError("Unstructured 분석을 사용하려면 unstructured 패키지가 필요합니다: "
+                          "pip install \"unstructured[pdf]\"") from e
+    return partition_pdf
+
+
+def _extract_pages(pdf_path, pages):
+    """
+    지정한 페이지(1부터 시작)만 담은 임시 PDF 생성
+    - 반환값: 임시 PDF 경로 (호출한 쪽에서 삭제)
+    """
+    import fitz
+    fd, tmp_path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    with fitz.open(pdf_path) as src, fitz.open() as dst:
+        for p in pages:
+            dst.insert_pdf(src, from_page=p - 1, to_page=p - 1)
+        dst.save(tmp_path)
+    return tmp_path
+
+
+def parse_with_unstructured(pdf_path, strategy="fast", pages=None):
     """
     unstructured 라이브러리 기반 PDF PARSER
     - 페이지 단위로 텍스트와 메타데이터를 추출
+    - strategy: partition_pdf 전략 ("fast", "hi_res", "ocr_only", "auto")
+    - pages: 분석할 페이지 번호 리스트 (1부터 시작), None이면 문서 전체
     """
+    tmp_path = None
     try:
+        pages = sorted(set(pages)) if pages is not None else None
+        if pages == []:
+            return []
+        filename = str(pdf_path)
+        if pages is not None:
+            tmp_path = _extract_pages(pdf_path, pages)
+            filename = tmp_path
+
+        partition_pdf = _import_partition_pdf()
         elements = partition_pdf(
-            filename=str(pdf_path),
+            filename=filename,
             languages=["ko"],
-            strategy="fast",
+            strategy=strategy,
             extract_images_in_pdf=False,
             infer_table_structure=True,
             pdf_infer_table_structure=True
@@ -24,8 +63,18 @@ def parse_with_unstructured(pdf_path):
                 "type": el.category.lower(),
                 "content": text
             }
+            page_number = getattr(el.metadata, "page_number", None)
+            if page_number is not None:
+                # 부분 PDF의 페이지 번호를 원본 페이지 번호로 복원
+                block["page"] = pages[page_number - 1] if pages is not None else page_number
             blocks.append(block)
         return blocks
     except Exception as e:
         logging.warning(f"[{pdf_path.name}] Unstructured 실패: {e}")
         return []
+    finally:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,203 @@
+import os
+import time
+import signal
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from contextlib import contextmanager
+from multiprocessing.connection import wait
+
+# 작업 결과 상태
+OK = "ok"
+ERROR = "error"          # 작업 함수가 예외를 던짐
+TIMEOUT = "timeout"      # 제한 시간 초과로 워커를 종료함
+CRASHED = "crashed"      # 워커 프로세스가 결과 없이 종료됨 (segfault, OOM kill 등)
+
+
+class PageTimeout(BaseException):
+    """
+    page_time_limit 제한 시간 초과
+    - 파서들이 except Exception으로 오류를 삼키므로 BaseException을 상속해 페이지 분석 밖까지 전달되도록 한다.
+    """
+
+
+@contextmanager
+def page_time_limit(seconds):
+    """
+    with 블록이 seconds를 넘기면 PageTimeout 발생 (SIGALRM + setitimer)
+    - 메인 스레드에서만 동작하며, 지원하지 않는 환경(Windows, 다른 스레드)에서는 제한 없이 실행한다.
+    - 시그널은 파이썬 코드로 돌아올 때 처리되므로 네이티브 코드 안에서 멈춘 경우는
+      문서 단위 제한 시간(SupervisedPool)으로 처리해야 한다.
+    """
+    if not seconds or not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def _raise_timeout(signum, frame):
+        raise PageTimeout(f"{seconds}s 초과")
+
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _worker_main(conn, initializer):
+    """
+    감독 워커 프로세스 본체: (task_id, func, args)를 받아 실행하고 (task_id, 상태, 결과)를 돌려준다.
+    - None을 받거나 부모와 연결이 끊기면 종료
+    """
+    if hasattr(os, "setpgrp"):
+        # 워커가 만든 자식 프로세스(페이지 구간 병렬 처리)까지 한 번에 종료할 수 있도록 별도 프로세스 그룹 사용
+        os.setpgrp()
+    if initializer is not None:
+        initializer()
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        task_id, func, args = message
+        try:
+            reply = (task_id, OK, func(*args))
+        except Exception as e:
+            reply = (task_id, ERROR, f"{type(e).__name__}: {e}")
+        conn.send(reply)
+
+
+class _Worker:
+    def __init__(self, context, initializer):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, initializer))
+        self.process.start()
+        child_conn.close()
+        self.task_id = None
+        self.started_at = None
+        self.completed = 0
+
+    def assign(self, task_id, func, args):
+        self.task_id, self.started_at = task_id, time.monotonic()
+        self.conn.send((task_id, func, args))
+
+    def kill(self):
+        try:
+            if hasattr(os, "killpg") and os.getpgid(self.process.pid) == self.process.pid:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except OSError:
+            pass
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        """대기 중인 워커를 정상 종료 (응답이 없으면 강제 종료)"""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class SupervisedPool:
+    """
+    작업마다 제한 시간을 두고 워커 프로세스를 감독하는 프로세스 풀
+    - task_timeout(초)을 넘긴 작업은 워커 프로세스(와 그 자식들)를 강제 종료하고 새 워커로 교체한다.
+    - 워커가 결과 없이 죽으면 해당 작업만 CRASHED로 보고하고 교체한다. (ProcessPoolExecutor처럼 풀 전체가 깨지지 않음)
+    - max_tasks_per_worker개 작업을 처리한 워커는 종료하고 새로 띄워 네이티브 라이브러리의 메모리 누수를 제한한다.
+
+    사용 예:
+        pool = SupervisedPool(workers=4, task_timeout=600, max_tasks_per_worker=50)
+        for task_id, status, value in pool.run([(i, func, (arg,)) for i, arg in enumerate(args)]):
+            if status == OK:
+                ...
+    """
+    def __init__(self, workers=1, task_timeout=None, max_tasks_per_worker=None, initializer=None):
+        self.workers = max(1, int(workers or 1))
+        self.task_timeout = task_timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.initializer = initializer
+        self._context = multiprocessing.get_context()
+        self.replaced = 0  # 시간 초과/비정상 종료/재활용으로 교체한 워커 수
+
+    def run(self, tasks):
+        """
+        tasks: (task_id, func, args) 목록
+        - 완료되는 순서대로 (task_id, 상태, 결과 또는 오류 메시지)를 yield
+        """
+        queue = deque(tasks)
+        workers = []
+        try:
+            while queue or any(w.task_id is not None for w in workers):
+                idle = sum(w.task_id is None for w in workers)
+                while queue and idle < len(queue) and len(workers) < self.workers:
+                    workers.append(_Worker(self._context, self.initializer))
+                    idle += 1
+                for w in workers:
+                    if w.task_id is None and queue:
+                        w.assign(*queue.popleft())
+
+                busy = [w for w in workers if w.task_id is not None]
+                ready = set(wait([w.conn for w in busy] + [w.process.sentinel for w in busy], self._wait_timeout(busy)))
+
+                for w in busy:
+                    outcome = self._check(w, ready)
+                    if outcome is None:
+                        continue
+                    task_id = w.task_id
+                    w.task_id, w.started_at = None, None
+                    status, value = outcome
+                    if status == OK or status == ERROR:
+                        w.completed += 1
+                        if self.max_tasks_per_worker and w.completed >= self.max_tasks_per_worker:
+                            w.stop()
+                            workers.remove(w)
+                            self.replaced += 1
+                    else:
+                        workers.remove(w)
+                        self.replaced += 1
+                    yield task_id, status, value
+        finally:
+            for w in workers:
+                if w.task_id is not None:
+                    w.kill()
+                else:
+                    w.stop()
+
+    def _wait_timeout(self, busy):
+        if not self.task_timeout or not busy:
+            return None
+        now = time.monotonic()
+        return max(0.0, min(w.started_at + self.task_timeout - now for w in busy))
+
+    def _check(self, w, ready):
+        """
+        바쁜 워커의 상태 확인
+        - 반환값: 끝났으면 (상태, 결과), 아직 실행 중이면 None
+        """
+        if w.conn in ready or w.process.sentinel in ready:
+            try:
+                if w.conn.poll():
+                    _, status, value = w.conn.recv()
+                    return status, value
+            except (EOFError, OSError):
+                pass
+            if not w.process.is_alive():
+                exitcode = w.process.exitcode
+                w.kill()
+                logging.warning(f"[supervisor] 워커 비정상 종료 (exit code {exitcode})")
+                return CRASHED, f"워커 비정상 종료 (exit code {exitcode})"
+        if self.task_timeout and time.monotonic() - w.started_at >= self.task_timeout:
+            w.kill()
+            return TIMEOUT, f"{self.task_timeout}s"
+        return None
@@ -1,4 +1,6 @@
-from .merging import merge_parsers
-from .text_cleaning import clean_text, get_title_level, generate_doc_id
-from .page_mapping import make_page_text_map, guess_page_range
-from .logging_config import setup_logging
\ No newline at end of file
+from .merging import merge_parsers, select_parser, cascade_parsers
+from .text_cleaning import clean_text, get_title_level, generate_doc_id, normalize_text, normalize_texts, clean_blocks
+from .page_mapping import make_page_text_map, guess_page_range, build_page_offsets, page_range_for_span
+from .logging_config import setup_logging
+from .manifest import ConversionManifest
+from .chunk_io import ChunkWriter, iter_chunks, chunk_output_path
\ No newline at end of file
@@ -0,0 +1,165 @@
+import os
+import json
+import time
+import logging
+from pathlib import Path
+from pdf_parser.utils.manifest import write_json_atomic
+
+JOURNAL_NAME = ".conversion_journal.jsonl"
+QUARANTINE_NAME = "quarantine.json"
+# 같은 내용의 파일이 이 횟수만큼 실패(또는 변환 중 프로세스가 죽음)하면 격리
+DEFAULT_MAX_ATTEMPTS = 2
+
+
+def append_journal(path, record):
+    """
+    저널에 레코드 한 줄을 추가하고 fsync
+    - O_APPEND로 한 번에 쓰므로 여러 워커 프로세스가 같은 저널에 써도 줄이 섞이지 않는다.
+    """
+    record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), **record}
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class CheckpointJournal:
+    """
+    배치 변환 진행 상황을 기록하는 append-only 체크포인트 저널 (output_dir/.conversion_journal.jsonl)
+    - 레코드: run(실행 시작, 설정) / start(변환 시작) / done(성공, 출력 파일) / failed(실패 사유)
+    - 매 레코드를 fsync하므로 프로세스가 강제 종료돼도 그 직전까지의 진행 상황이 남는다.
+    - resume=True이면 기존 저널을 이어서 쓰고, 아니면 새로 시작한다.
+      (설정이 바뀌었으면 기존 저널을 버리고 새로 시작)
+    - start 후 done 없이 끝난 기록은 변환 중 프로세스가 죽은 것으로 보고 시도 횟수에 포함한다.
+    """
+    def __init__(self, output_dir, config, resume=False):
+        self.path = Path(output_dir) / JOURNAL_NAME
+        self.config = config
+        self._done = {}       # 파일명 -> (sha256, outputs)
+        self._attempts = {}   # (파일명, sha256) -> 시도 횟수 (마지막 성공 이후)
+        self._errors = {}     # (파일명, sha256) -> 마지막 실패 사유
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self._load():
+            append_journal(self.path, {"event": "run", "resume": True, "config": config})
+            return
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+        append_journal(self.path, {"event": "run", "resume": False, "config": config})
+
+    def _load(self):
+        """
+        기존 저널을 읽어 상태 복원, 설정이 다르거나 저널이 없으면 False
+        - 강제 종료로 마지막 줄이 잘려 있을 수 있으므로 파싱할 수 없는 줄은 건너뛴다.
+        """
+        if not self.path.exists():
+            return False
+        records = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logging.warning(f"[checkpoint] 손상된 저널 레코드 무시: {line[:80]!r}")
+        runs = [r for r in records if r.get("event") == "run"]
+        if not runs or runs[0].get("config") != self.config:
+            if runs:
+                print("⚠️ 변환 설정이 바뀌어 기존 체크포인트를 사용하지 않습니다.")
+            return False
+        for r in records:
+            self._apply(r)
+        return True
+
+    def _apply(self, record):
+        event, name, digest = record.get("event"), record.get("file"), record.get("sha256")
+        key = (name, digest)
+        if event == "start":
+            self._attempts[key] = self._attempts.get(key, 0) + 1
+        elif event == "done":
+            self._done[name] = (digest, record.get("outputs", []))
+            self._attempts.pop(key, None)
+            self._errors.pop(key, None)
+        elif event == "failed":
+            self._errors[key] = record.get("error")
+
+    def _append(self, record):
+        append_journal(self.path, record)
+        self._apply(record)
+
+    def start(self, name, digest):
+        self._append({"event": "start", "file": name, "sha256": digest})
+
+    def done(self, name, digest, outputs):
+        self._append({"event": "done", "file": name, "sha256": digest, "outputs": list(outputs)})
+
+    def failed(self, name, digest, error):
+        self._append({"event": "failed", "file": name, "sha256": digest, "error": error})
+
+    def record_start(self, name, digest):
+        """워커 프로세스에서 start를 직접 기록한 경우 부모의 상태에만 반영"""
+        self._apply({"event": "start", "file": name, "sha256": digest})
+
+    def completed_outputs(self, name, digest):
+        """같은 내용으로 이미 성공한 파일이면 출력 파일 목록, 아니면 None"""
+        done = self._done.get(name)
+        if done and done[0] == digest:
+            return done[1]
+        return None
+
+    def attempts(self, name, digest):
+        return self._attempts.get((name, digest), 0)
+
+    def last_error(self, name, digest):
+        return self._errors.get((name, digest)) or "변환 중 프로세스 비정상 종료"
+
+
+class Quarantine:
+    """
+    반복해서 실패한 파일 격리 목록 (output_dir/quarantine.json)
+    - 파일명 -> {sha256, 시도 횟수, 마지막 실패 사유, 격리 시각}
+    - 내용이 바뀐 파일(sha256이 다름)은 격리 대상이 아니므로 다시 시도한다.
+    """
+    def __init__(self, output_dir):
+        self.path = Path(output_dir) / QUARANTINE_NAME
+        self.entries = self._load()
+        self._dirty = False
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning(f"[quarantine] 격리 목록 로드 실패: {e}")
+            return {}
+
+    def is_quarantined(self, name, digest):
+        entry = self.entries.get(name)
+        return bool(entry) and entry.get("sha256") == digest
+
+    def add(self, name, digest, attempts, error):
+        self.entries[name] = {
+            "sha256": digest,
+            "attempts": attempts,
+            "error": error,
+            "quarantined_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self._dirty = True
+        self.save()
+
+    def release(self, name):
+        if self.entries.pop(name, None) is not None:
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        if self.entries:
+            write_json_atomic(self.path, self.entries)
+        elif self.path.exists():
+            self.path.unlink()
+        self._dirty = False
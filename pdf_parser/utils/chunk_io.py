@@ -0,0 +1,148 @@
+import io
+import os
+import gzip
+import json
+from pathlib import Path
+
+# 압축 방식 -> 파일 확장자
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def chunk_output_path(output_dir, stem, output_format="json", compression=None):
+    """
+    청크 결과 파일 경로
+    - json: {stem}_chunked.json, jsonl: {stem}_chunked.jsonl (+ .gz / .zst)
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+    return Path(output_dir) / f"{stem}_chunked.{output_format}{COMPRESSION_SUFFIXES[compression]}"
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다: pip install zstandard") from e
+    return zstandard
+
+
+def _compression_of(path):
+    suffix = Path(path).suffix
+    if suffix == ".gz":
+        return "gzip"
+    if suffix == ".zst":
+        return "zstd"
+    return None
+
+
+class ChunkWriter:
+    """
+    청크를 생성되는 즉시 파일에 쓰는 스트리밍 writer
+    - output_format: "jsonl" (한 줄에 청크 하나) 또는 "json" (json.dump(..., indent=2)와 동일한 배열)
+    - compression: None / "gzip" / "zstd"
+    - 임시 파일({path}.tmp)에 쓰고 정상 종료 시에만 rename하므로 중간 결과 파일이 남지 않는다.
+
+    사용 예:
+        with ChunkWriter(path, "jsonl", "gzip") as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+    """
+    def __init__(self, path, output_format="jsonl", compression=None, compression_level=None):
+        if output_format not in ("json", "jsonl"):
+            raise ValueError(f"지원하지 않는 출력 형식: {output_format}")
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self.output_format = output_format
+        self.compression = compression
+        self.compression_level = compression_level
+        self.count = 0
+        self.bytes_written = 0
+        self._raw = None
+        self._stream = None
+        self._text = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._raw = open(self.tmp_path, "wb")
+        if self.compression == "gzip":
+            level = self.compression_level if self.compression_level is not None else 6
+            # mtime=0, filename="" -> 같은 내용이면 같은 바이트가 나오도록 고정
+            self._stream = gzip.GzipFile(filename="", mode="wb", fileobj=self._raw, compresslevel=level, mtime=0)
+        elif self.compression == "zstd":
+            zstandard = _import_zstandard()
+            level = self.compression_level if self.compression_level is not None else 3
+            self._stream = zstandard.ZstdCompressor(level=level).stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        self._text = io.TextIOWrapper(self._stream, encoding="utf-8", newline="\n", write_through=True)
+        return self
+
+    def write(self, chunk):
+        if self.output_format == "jsonl":
+            line = json.dumps(chunk, ensure_ascii=False) + "\n"
+        else:
+            item = json.dumps(chunk, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            line = ("[\n  " if self.count == 0 else ",\n  ") + item
+        self._text.write(line)
+        self.count += 1
+
+    def write_all(self, chunks):
+        for chunk in chunks:
+            self.write(chunk)
+
+    def _finish_json(self):
+        if self.output_format == "json":
+            self._text.write("\n]" if self.count else "[]")
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._finish_json()
+            self._text.flush()
+            self._text.detach()
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+        finally:
+            self._raw.close()
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+            self.bytes_written = self.path.stat().st_size
+        else:
+            try:
+                os.remove(self.tmp_path)
+            except OSError:
+                pass
+        return False
+
+
+def _open_text(path):
+    compression = _compression_of(path)
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == "zstd":
+        zstandard = _import_zstandard()
+        raw = open(path, "rb")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_chunks(path):
+    """
+    청크 결과 파일을 청크 단위로 순회
+    - .jsonl(.gz/.zst): 한 줄씩 읽으므로 문서 전체를 메모리에 올리지 않는다.
+    - .json(.gz/.zst): 기존 배열 형식 호환용 (파일 전체를 읽음)
+    """
+    path = Path(path)
+    base_suffix = Path(path.stem).suffix if _compression_of(path) else path.suffix
+    with _open_text(path) as f:
+        if base_suffix == ".json":
+            yield from json.load(f)
+            return
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
@@ -0,0 +1,442 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pdf_parser.utils.page_mapping import page_range_for_span
+from pdf_parser.utils.text_cleaning import get_title_level
+
+CHUNKERS = ("native", "langchain")
+LENGTH_UNITS = ("chars", "tokens")
+DEFAULT_TOKEN_ENCODING = "cl100k_base"
+
+# 블록이 chunk_size를 넘을 때 차례로 시도하는 분할 기준 (구분자는 앞 조각 끝에 남긴다)
+_SPLIT_SEPARATORS = ("\n", ". ", "? ", "! ", " ")
+
+
+@dataclass
+class Chunk:
+    """
+    청크 하나
+    - char_start/char_end: separator.join(블록 content) 전체 텍스트 기준 [시작, 끝) 오프셋
+      (전체 텍스트[char_start:char_end] == content)
+    - block_ids: 청크가 걸친 원본 블록 번호 (블록 리스트 순서 기준)
+    """
+    content: str
+    char_start: int
+    char_end: int
+    block_ids: list = field(default_factory=list)
+    page_start: int = None
+    page_end: int = None
+
+
+def _import_tiktoken():
+    try:
+        import tiktoken
+    except ImportError as e:
+        raise ImportError("토큰 단위 청킹을 사용하려면 tiktoken 패키지가 필요합니다: pip install tiktoken") from e
+    return tiktoken
+
+
+def token_length_function(encoding_name=DEFAULT_TOKEN_ENCODING):
+    """tiktoken 인코딩 기준 토큰 수를 세는 length_function"""
+    encoding = _import_tiktoken().get_encoding(encoding_name)
+
+    def token_length(text):
+        return len(encoding.encode(text, disallowed_special=()))
+    return token_length
+
+
+@dataclass
+class _Unit:
+    """BlockChunker가 청크로 묶는 최소 단위 (블록 전체 또는 긴 블록의 일부 구간)"""
+    block_id: int
+    start: int      # 전체 텍스트 기준 시작 오프셋
+    text: str
+    length: int     # length_function 기준 길이
+    kind: str       # "text" / "title" / "table"
+    page: int = None
+
+
+class BlockChunker:
+    """
+    블록 리스트를 직접 청크로 묶는 구조 인식 분할기 (기본 청커)
+    - 블록 경계에서만 청크를 나누고, chunk_size를 넘는 텍스트 블록만 줄바꿈/문장/공백 기준으로 잘라 묶는다.
+    - break_level 이하 제목(get_title_level 기준, 1: Ⅰ./제 N 장, 2: 1.1)은 항상 새 청크를 시작하고,
+      제목은 뒤따르는 본문과 같은 청크에 들어가도록 청크 끝에 남기지 않는다.
+    - 표 블록은 나누지 않는다. (chunk_size보다 크면 표 하나가 그대로 한 청크가 됨)
+    - chunk_overlap: 크기 때문에 청크를 나눌 때 앞 청크 끝의 텍스트 단위를 이 길이 이내에서 다음 청크 앞에 반복
+      (제목 경계와 표는 넘지 않음)
+    - length_function으로 길이 기준을 바꿀 수 있다. (token_length_function: 토큰 수, 구간별 합으로 근사)
+    - 청크마다 전체 텍스트 기준 문자 오프셋, 원본 블록 번호, 페이지 범위를 함께 만든다.
+
+    사용 예:
+        chunker = BlockChunker(chunk_size=1000, chunk_overlap=150)
+        chunks = chunker.split(blocks)
+        # 또는 블록을 하나씩 넣으면서 확정된 청크를 바로 받기 (메모리 제한 모드)
+        for block in blocks:
+            for chunk in chunker.add(block):
+                ...
+        for chunk in chunker.finish():
+            ...
+    """
+    def __init__(self, chunk_size=1000, chunk_overlap=150, length_function=len, separator="\n\n", break_level=2):
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.length_function = length_function
+        self.separator = separator
+        self.break_level = break_level
+        self._separator_length = length_function(separator)
+        self._block_count = 0
+        self._length = 0          # 지금까지 받은 전체 텍스트 길이 (문자)
+        self._last_page = None
+        self._units = []          # 현재 청크에 모은 단위
+        self._units_length = 0
+        self._carried = 0         # _units 앞쪽의 오버랩 단위 개수
+        self._has_body = False    # 오버랩/제목 외의 내용이 있는지
+
+    def split(self, blocks):
+        """블록 리스트 전체를 청크 리스트로"""
+        chunks = []
+        for block in blocks:
+            chunks.extend(self.add(block))
+        chunks.extend(self.finish())
+        return chunks
+
+    def add(self, block):
+        """
+        블록 하나를 추가하고 확정된 청크 리스트를 반환
+        - 반환값: [Chunk, ...]
+        """
+        content = block["content"]
+        block_id = self._block_count
+        self._block_count += 1
+        start = self._length
+        if self._length:
+            start += len(self.separator)
+        self._length = start + len(content)
+        page = block.get("page") or self._last_page
+        self._last_page = page
+
+        kind = block.get("type")
+        if kind not in ("title", "table"):
+            kind = "text"
+        chunks = []
+        if kind == "title" and (block.get("level") or get_title_level(content) or 3) <= self.break_level:
+            if self._has_body:
+                chunks.extend(self._flush(carry=False))
+            else:
+                self._drop_carried(len(self._units))
+
+        if kind == "table":
+            spans = [(0, len(content), None)]
+        elif kind == "title":
+            spans = self._split_block(content)
+        else:
+            # 청크 끝에 남은 제목은 이 블록의 첫 구간과 같은 청크로 나가므로 그만큼 첫 구간을 줄인다
+            first_limit = self.chunk_size
+            titles = self._held_titles()
+            if titles:
+                first_limit -= self._measure(titles) + self._separator_length
+                if first_limit <= 0:
+                    # 제목만으로 청크가 차면 제목을 따로 내보낸다
+                    chunks.extend(self._flush_titles())
+                    first_limit = self.chunk_size
+            spans = self._split_block(content, first_limit)
+        for s, e, length in spans:
+            text = content if (s, e) == (0, len(content)) else content[s:e]
+            if length is None:
+                length = self.length_function(text)
+            chunks.extend(self._push(_Unit(block_id, start + s, text, length, kind, page)))
+        return chunks
+
+    def finish(self):
+        """남은 단위를 마지막 청크로 만들어 반환"""
+        if not self._has_body:
+            # 오버랩만 남았으면 앞 청크에 이미 들어간 내용이므로 버린다 (제목만 있는 문서 끝은 그대로 기록)
+            self._drop_carried(len(self._units))
+        chunks = [self._make_chunk(self._units)] if self._units else []
+        self._units, self._units_length, self._carried, self._has_body = [], 0, 0, False
+        return [c for c in chunks if c is not None]
+
+    def _split_block(self, text, first_limit=None):
+        """
+        텍스트 블록을 chunk_size 이하 구간 [(start, end, length), ...]으로 분할
+        - 블록이 chunk_size 이하이면 블록 전체가 한 구간
+        - first_limit: 첫 구간의 최대 길이 (앞에 남은 제목과 함께 청크에 들어갈 때)
+        """
+        if first_limit is None or first_limit > self.chunk_size:
+            first_limit = self.chunk_size
+        length = self.length_function(text)
+        if length <= first_limit:
+            return [(0, len(text), length)]
+        spans = []
+        start = self._take_head(text, first_limit, spans) if first_limit < self.chunk_size else 0
+        if start >= len(text):
+            return spans
+        if start == 0 or self.length_function(text[start:]) > self.chunk_size:
+            self._split_span(text, start, len(text), 0, spans, self.chunk_size)
+        else:
+            spans.append((start, len(text), None))
+        return spans
+
+    def _take_head(self, text, limit, spans):
+        """
+        블록 앞부분을 limit 이하 구간 하나로 spans에 추가하고 그 끝 위치를 반환
+        - 구분자 기준 조각을 limit을 넘지 않을 때까지 이어 붙인다.
+        """
+        pieces = []
+        self._split_span(text, 0, len(text), 0, pieces, limit)
+        end, total = 0, 0
+        for s, e, piece_length in pieces:
+            if piece_length is None:
+                piece_length = self.length_function(text[s:e])
+            if end and total + piece_length > limit:
+                break
+            end, total = e, total + piece_length
+        length = self.length_function(text[:end])
+        # 토큰 단위는 조각 길이의 합이 근사값이므로 실제 길이로 확인
+        while length > limit and end > pieces[0][1]:
+            end = max(e for _, e, _ in pieces if e < end)
+            length = self.length_function(text[:end])
+        spans.append((0, end, length))
+        return end
+
+    def _split_span(self, text, start, end, level, spans, limit):
+        """_SPLIT_SEPARATORS[level:] 기준으로 [start, end)를 limit 이하 조각으로 나눠 spans에 추가"""
+        if level >= len(_SPLIT_SEPARATORS):
+            self._hard_split(text, start, end, spans, limit)
+            return
+        separator = _SPLIT_SEPARATORS[level]
+        if text.find(separator, start, end) < 0:
+            self._split_span(text, start, end, level + 1, spans, limit)
+            return
+        pos = start
+        while pos < end:
+            cut = text.find(separator, pos, end)
+            cut = end if cut < 0 else min(cut + len(separator), end)
+            piece_length = self.length_function(text[pos:cut])
+            if piece_length <= limit:
+                spans.append((pos, cut, piece_length))
+            else:
+                self._split_span(text, pos, cut, level + 1, spans, limit)
+            pos = cut
+
+    def _hard_split(self, text, start, end, spans, limit):
+        """구분자가 없는 긴 구간을 limit 이하가 되도록 글자 단위로 자름"""
+        pos = start
+        while pos < end:
+            cut = min(end, pos + limit)
+            while cut - pos > 1 and self.length_function(text[pos:cut]) > limit:
+                cut = pos + (cut - pos) // 2
+            spans.append((pos, cut, None))
+            pos = cut
+
+    def _joined_length(self, unit):
+        """현재 청크에 unit을 붙였을 때 늘어나는 길이 (다른 블록이면 separator 포함)"""
+        if self._units and self._units[-1].block_id != unit.block_id:
+            return unit.length + self._separator_length
+        return unit.length
+
+    def _push(self, unit):
+        chunks = []
+        if self._units and self._units_length + self._joined_length(unit) > self.chunk_size:
+            if self._has_body:
+                chunks.extend(self._flush(carry=True))
+            # 오버랩을 붙이면 넘치는 경우 앞에서부터 버린다
+            while self._carried and self._units_length + self._joined_length(unit) > self.chunk_size:
+                self._drop_carried(1)
+            # 남은 제목과 새 제목이 함께 들어가지 않으면 남은 제목만 먼저 내보낸다
+            if unit.kind == "title" and self._units and self._units_length + self._joined_length(unit) > self.chunk_size:
+                chunks.extend(self._flush_titles())
+        self._units_length += self._joined_length(unit)
+        self._units.append(unit)
+        if unit.kind != "title":
+            self._has_body = True
+        return chunks
+
+    def _held_titles(self):
+        """청크 끝에 연속으로 남은 제목 단위 (다음 내용과 함께 다음 청크로 넘어감)"""
+        held = len(self._units)
+        while held > 0 and self._units[held - 1].kind == "title":
+            held -= 1
+        return self._units[held:]
+
+    def _flush_titles(self):
+        """본문을 먼저 확정한 뒤 남은 제목만으로 청크를 만든다 (제목이 chunk_size를 거의 다 차지할 때)"""
+        chunks = self._flush(carry=False) if self._has_body else []
+        self._drop_carried(self._carried)
+        chunk = self._make_chunk(self._units)
+        self._units, self._units_length, self._carried, self._has_body = [], 0, 0, False
+        return chunks + ([chunk] if chunk is not None else [])
+
+    def _drop_carried(self, count):
+        count = min(count, self._carried)
+        if count:
+            self._units = self._units[count:]
+            self._carried -= count
+            self._units_length = self._measure(self._units)
+
+    def _flush(self, carry):
+        """
+        현재 청크를 확정
+        - 끝에 남은 제목은 다음 청크로 넘기고, carry=True이면 끝부분 텍스트 단위를 오버랩으로 넘긴다.
+        """
+        units = self._units
+        held = len(units)
+        while held > 0 and units[held - 1].kind == "title":
+            held -= 1
+        emitted, rest = units[:held], units[held:]
+        carried = 0
+        if carry and not rest and self.chunk_overlap > 0:
+            total = 0
+            for unit in reversed(emitted):
+                # 한 단위를 통째로 넘기므로 청크 전체를 반복하지는 않는다
+                if unit.kind != "text" or carried + 1 >= len(emitted):
+                    break
+                total += unit.length + (self._separator_length if carried else 0)
+                if total > self.chunk_overlap:
+                    break
+                carried += 1
+            rest = emitted[len(emitted) - carried:]
+        chunk = self._make_chunk(emitted)
+        self._units = list(rest)
+        self._units_length = self._measure(self._units)
+        self._carried = carried
+        self._has_body = False
+        return [chunk] if chunk is not None else []
+
+    def _measure(self, units):
+        total = 0
+        for i, unit in enumerate(units):
+            total += unit.length
+            if i and units[i - 1].block_id != unit.block_id:
+                total += self._separator_length
+        return total
+
+    def _make_chunk(self, units):
+        if not units:
+            return None
+        parts, block_ids, pages = [], [], []
+        for unit in units:
+            if block_ids and block_ids[-1] != unit.block_id:
+                parts.append(self.separator)
+            if not block_ids or block_ids[-1] != unit.block_id:
+                block_ids.append(unit.block_id)
+            parts.append(unit.text)
+            if unit.page is not None:
+                pages.append(unit.page)
+        content = "".join(parts)
+        stripped = content.strip()
+        if not stripped:
+            return None
+        start = units[0].start + (len(content) - len(content.lstrip()))
+        return Chunk(stripped, start, start + len(stripped), block_ids,
+                     min(pages) if pages else None, max(pages) if pages else None)
+
+
+class StreamingChunker:
+    """
+    블록을 순서대로 받아 청크를 점진적으로 만드는 분할기 (메모리 제한 모드용)
+    - separator.join(블록 content) 전체 텍스트를 만들지 않고, window_chars 이상 쌓이면
+      확정된 앞부분만 splitter로 나눠 바로 내보낸다.
+    - RecursiveCharacterTextSplitter는 chunk_size 이상인 조각(separator + 블록)을 만나면
+      앞의 조각들을 청크로 확정하고 새로 병합을 시작하므로, 그 조각 앞에서 자르면
+      전체 텍스트를 한 번에 나눈 결과와 같은 청크가 나온다.
+    - 긴 블록이 없어 그런 경계를 찾지 못한 채 버퍼가 window_chars의 4배를 넘으면
+      마지막 청크 시작 위치에서 잘라 메모리를 제한한다. (이 경우 경계 부근 청크가 약간 달라질 수 있음)
+    - 청크 위치는 전체 텍스트 기준 오프셋으로 계산해 build_page_offsets와 같은 방식으로 페이지를 대응시킨다.
+
+    사용 예:
+        chunker = StreamingChunker(splitter, chunk_size=1000, window_chars=50000)
+        for block in blocks:
+            for chunk in chunker.add(block):
+                ...
+        for chunk in chunker.finish():
+            ...
+    - window_chars=float("inf")이면 finish()에서 전체 텍스트를 한 번에 나눈다. (--chunker langchain 기본 모드)
+    """
+    def __init__(self, splitter, chunk_size, window_chars, separator="\n\n", length_function=len):
+        # splitter: add_start_index=True로 만든 RecursiveCharacterTextSplitter (separator가 첫 분할 기준)
+        self.splitter = splitter
+        self.chunk_size = chunk_size
+        self.window_chars = window_chars
+        self.separator = separator
+        self.length_function = length_function
+        # 전체 텍스트 기준 블록 시작 오프셋과 페이지 번호 (build_page_offsets 반환값과 같은 형식)
+        self.starts, self.pages = [], []
+        self._last_page = None
+        self._length = 0      # 지금까지 받은 전체 텍스트 길이
+        self._base = 0        # 버퍼 첫 글자의 전체 텍스트 오프셋
+        self._buffer = []     # 아직 청크로 만들지 않은 조각 (두 번째 블록부터는 separator + content)
+        self._buffer_len = 0
+
+    def add(self, block):
+        """
+        블록 하나를 추가하고, 버퍼가 window_chars 이상이면 확정된 청크 리스트를 반환
+        - 반환값: [Chunk, ...]
+        """
+        piece = block["content"]
+        start = self._length
+        if self._length:
+            piece = self.separator + piece
+            start += len(self.separator)
+        page = block.get("page") or self._last_page
+        self.starts.append(start)
+        self.pages.append(page)
+        self._last_page = page
+
+        self._buffer.append(piece)
+        self._buffer_len += len(piece)
+        self._length += len(piece)
+        if self._buffer_len < self.window_chars:
+            return []
+        cut = self._last_reset_point()
+        if cut:
+            return self._emit(cut)
+        if self._buffer_len >= self.window_chars * 4:
+            return self._emit_approximate()
+        return []
+
+    def finish(self):
+        """남은 버퍼를 모두 청크로 만들어 반환"""
+        return self._emit(len(self._buffer))
+
+    def _last_reset_point(self):
+        """splitter가 병합을 새로 시작하는 마지막 조각 위치 (chunk_size 이상인 조각), 없으면 0"""
+        for idx in range(len(self._buffer) - 1, 0, -1):
+            if self.length_function(self._buffer[idx]) >= self.chunk_size:
+                return idx
+        return 0
+
+    def _emit(self, count):
+        """버퍼 앞 count개 조각을 청크로 만들어 반환하고 버퍼에서 제거"""
+        text = "".join(self._buffer[:count])
+        chunks = self._chunks(text, self.splitter.create_documents([text]) if text else [])
+        self._buffer = self._buffer[count:]
+        self._buffer_len -= len(text)
+        self._base += len(text)
+        return chunks
+
+    def _emit_approximate(self):
+        """마지막 청크만 버퍼에 남기고 나머지를 청크로 만들어 반환"""
+        text = "".join(self._buffer)
+        docs = self.splitter.create_documents([text])
+        if len(docs) < 2:
+            return []
+        keep_from = docs[-1].metadata["start_index"]
+        chunks = self._chunks(text, docs[:-1])
+        rest = text[keep_from:]
+        self._buffer = [rest]
+        self._buffer_len = len(rest)
+        self._base += keep_from
+        return chunks
+
+    def _chunks(self, text, docs):
+        page_offsets = (self.starts, self.pages)
+        chunks = []
+        for doc in docs:
+            start = self._base + doc.metadata["start_index"]
+            end = start + len(doc.page_content)
+            first = max(bisect_right(self.starts, start) - 1, 0)
+            last = max(bisect_right(self.starts, max(start, end - 1)) - 1, first)
+            chunks.append(Chunk(doc.page_content, start, end, list(range(first, last + 1)),
+                                *page_range_for_span(page_offsets, start, end)))
+        return chunks
@@ -0,0 +1,139 @@
+import re
+import zlib
+from collections import defaultdict
+
+# 기본 유사도 임계값 (shingle Jaccard 기준)
+DEFAULT_DEDUP_THRESHOLD = 0.9
+
+_WHITESPACE = re.compile(r"\s+")
+_PRIME = (1 << 31) - 1
+
+
+def normalize_for_dedup(text):
+    """공백/대소문자 차이를 무시하도록 정규화"""
+    return _WHITESPACE.sub("", text).lower()
+
+
+def shingles(text, k=5):
+    """
+    문자 k-gram shingle 해시 집합 (crc32, 프로세스 간에도 동일한 값)
+    """
+    normalized = normalize_for_dedup(text)
+    if len(normalized) <= k:
+        return {zlib.crc32(normalized.encode("utf-8"))} if normalized else set()
+    return {zlib.crc32(normalized[i:i + k].encode("utf-8")) for i in range(len(normalized) - k + 1)}
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateFilter:
+    """
+    문자 shingle + MinHash/LSH 기반 근사 중복 블록 필터
+    - 정확히 같은 content는 집합으로 바로 걸러내고,
+      나머지는 LSH 버킷에서 후보를 찾은 뒤 shingle Jaccard가 threshold 이상이면 중복으로 본다.
+    - threshold <= 0 이면 정확히 같은 content만 중복으로 처리
+
+    사용 예:
+        dedup = NearDuplicateFilter(threshold=0.9)
+        dedup.add_all(b["content"] for b in blocks)
+        if not dedup.check_and_add(text):
+            blocks.append(new_block)
+    """
+    def __init__(self, threshold=DEFAULT_DEDUP_THRESHOLD, num_perm=64, bands=16, shingle_size=5, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.num_perm = num_perm
+        self.seed = seed
+        # MinHash 해시 계수는 첫 근사 중복 검사 때 만든다 (정확히 같은 content만 걸러내는 경우 numpy 불필요)
+        self._a = self._b = None
+        self._contents = set()
+        # add_all로 등록된 텍스트는 첫 중복 검사 시점에 색인 (검사가 없으면 MinHash 계산 생략)
+        self._pending = []
+        self._shingle_sets = []
+        self._buckets = [defaultdict(list) for _ in range(bands)]
+        self.removed_blocks = 0
+        self.removed_bytes = 0
+
+    def _init_hash_params(self):
+        import numpy as np
+        rng = np.random.RandomState(self.seed)
+        self._a = rng.randint(1, _PRIME, size=(self.num_perm, 1)).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=(self.num_perm, 1)).astype(np.uint64)
+
+    def _signature(self, shingle_set):
+        import numpy as np
+        if self._a is None:
+            self._init_hash_params()
+        hashes = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1)
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(self.bands)]
+
+    def _find_near_duplicate(self, shingle_set):
+        signature = self._signature(shingle_set)
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        for idx in candidates:
+            if jaccard(shingle_set, self._shingle_sets[idx]) >= self.threshold:
+                return True, signature
+        return False, signature
+
+    def add(self, text, _signature=None, _shingle_set=None):
+        self._contents.add(text)
+        if self.threshold <= 0:
+            return
+        shingle_set = _shingle_set if _shingle_set is not None else shingles(text, self.shingle_size)
+        if not shingle_set:
+            return
+        signature = _signature if _signature is not None else self._signature(shingle_set)
+        idx = len(self._shingle_sets)
+        self._shingle_sets.append(shingle_set)
+        for band, key in self._band_keys(signature):
+            self._buckets[band][key].append(idx)
+
+    def add_all(self, texts):
+        self._pending.extend(texts)
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, []
+        for text in pending:
+            if text not in self._contents:
+                self.add(text)
+
+    def check_and_add(self, text):
+        """
+        중복이면 True (통계만 갱신), 아니면 필터에 추가하고 False
+        """
+        if self._pending:
+            self._flush_pending()
+        if text in self._contents:
+            self._count_removed(text)
+            return True
+        if self.threshold <= 0:
+            self._contents.add(text)
+            return False
+        shingle_set = shingles(text, self.shingle_size)
+        if shingle_set:
+            is_dup, signature = self._find_near_duplicate(shingle_set)
+            if is_dup:
+                self._count_removed(text)
+                return True
+            self.add(text, signature, shingle_set)
+        else:
+            self._contents.add(text)
+        return False
+
+    def _count_removed(self, text):
+        self.removed_blocks += 1
+        self.removed_bytes += len(text.encode("utf-8"))
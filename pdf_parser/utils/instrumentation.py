@@ -0,0 +1,249 @@
+import io
+import os
+import sys
+import math
+import json
+import time
+import pstats
+import cProfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+METRICS_NAME = "metrics.jsonl"
+# 파일별 RSS 샘플링 주기 (초)
+RSS_SAMPLE_INTERVAL = 0.05
+
+
+@contextmanager
+def measure(timings, name):
+    """
+    with 블록의 wall/CPU 시간을 timings[name]에 누적
+    - timings가 None이면 측정하지 않는다.
+    - 같은 name으로 여러 번 측정하면 합산 (예: 페이지별 표 추출 시간 합계)
+    """
+    if timings is None:
+        yield
+        return
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        entry = timings.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+        entry["wall"] += time.perf_counter() - wall
+        entry["cpu"] += time.process_time() - cpu
+
+
+def peak_rss_mb():
+    """
+    현재 프로세스의 최대 RSS (MB), 측정할 수 없는 플랫폼에서는 None
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def current_rss_mb(fallback_to_peak=True):
+    """
+    현재 프로세스의 RSS (MB)
+    - psutil이 있으면 사용하고, 없으면 /proc/self/statm(Linux), 둘 다 안 되면 최대 RSS로 대신한다.
+      (fallback_to_peak=False면 None)
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_mb() if fallback_to_peak else None
+
+
+class RssSampler:
+    """
+    with 블록 동안 현재 RSS를 interval마다 샘플링해 블록 시작 RSS와 구간 최대 RSS(MB)를 구한다.
+    - ru_maxrss(peak_rss_mb)는 프로세스 수명 전체의 최대값이라, 순차 실행이나 재사용되는 워커에서는
+      가장 큰 파일 이후의 모든 파일이 같은 값을 갖게 되므로 파일별 값으로 쓸 수 없다.
+    - 샘플링 사이의 짧은 순간 최대값은 놓칠 수 있다. 현재 RSS를 읽을 수 없으면 start/peak는 None
+    """
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.start = None
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        rss = current_rss_mb(fallback_to_peak=False)
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self.start = self.peak = current_rss_mb(fallback_to_peak=False)
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+        return False
+
+    @property
+    def delta(self):
+        """블록 동안 늘어난 최대 RSS (MB)"""
+        if self.start is None or self.peak is None:
+            return None
+        return self.peak - self.start
+
+
+def percentile(values, q):
+    """
+    nearest-rank 방식 백분위수 (values가 비어 있으면 None)
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def distribution(values):
+    """p50 / p95 / max 요약"""
+    if not values:
+        return None
+    return {"p50": percentile(values, 50), "p95": percentile(values, 95), "max": max(values)}
+
+
+@dataclass
+class PageMetrics:
+    """페이지 한 장의 파서별 처리 시간"""
+    page: int
+    category: Optional[str] = None
+    parser: Optional[str] = None
+    # {"triage" | "fitz" | "fitz_table" | "plumber" | "plumber_table": {"wall": 초, "cpu": 초}}
+    timings: Dict[str, dict] = field(default_factory=dict)
+
+
+@dataclass
+class FileMetrics:
+    """PDF 한 개의 단계별 처리 시간과 자원 사용량"""
+    filename: str
+    status: str = "success"        # success / failed / error
+    pages: int = 0
+    blocks: int = 0
+    chunks: int = 0
+    bytes_written: int = 0
+    peak_rss_mb: Optional[float] = None    # 이 파일을 처리하는 동안의 최대 RSS (RssSampler)
+    rss_delta_mb: Optional[float] = None   # 처리 시작 대비 최대 RSS 증가분
+    # {"total" | "open" | "parse" | "unstructured" | "chunking" | "writing": {"wall": 초, "cpu": 초}}
+    timings: Dict[str, dict] = field(default_factory=dict)
+    page_metrics: List[PageMetrics] = field(default_factory=list)
+
+    def wall(self, name):
+        return self.timings.get(name, {}).get("wall", 0.0)
+
+    def page_wall(self, name):
+        """페이지별 name 단계 wall 시간 목록 (해당 단계를 거치지 않은 페이지는 제외)"""
+        return [p.timings[name]["wall"] for p in self.page_metrics if name in p.timings]
+
+    def page_table_wall(self):
+        """페이지별 표 추출 wall 시간 (fitz + pdfplumber 합계, 표 추출을 하지 않은 페이지는 제외)"""
+        names = ("fitz_table", "plumber_table")
+        return [sum(p.timings[n]["wall"] for n in names if n in p.timings)
+                for p in self.page_metrics if any(n in p.timings for n in names)]
+
+    def to_records(self):
+        """
+        JSONL로 내보낼 레코드: 파일 레코드 1개 + 페이지 레코드
+        """
+        file_record = {"type": "file", **{k: v for k, v in asdict(self).items() if k != "page_metrics"}}
+        file_record["table_wall"] = sum(self.page_table_wall())
+        yield _rounded(file_record)
+        for p in self.page_metrics:
+            yield _rounded({"type": "page", "filename": self.filename, **asdict(p)})
+
+
+def _rounded(value):
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, dict):
+        return {k: _rounded(v) for k, v in value.items()}
+    return value
+
+
+class MetricsLog:
+    """
+    계측 결과를 JSON Lines로 기록 (실행할 때마다 새로 작성, append=True이면 이어서 기록)
+    - 파일이 끝날 때마다 바로 flush하므로 실행 중에도 tail로 확인할 수 있다.
+    """
+    def __init__(self, path, append=False):
+        self.path = Path(path)
+        self.append = append
+        self._file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if self.append else "w", encoding="utf-8")
+        return self
+
+    def write(self, metrics):
+        for record in metrics.to_records():
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        return False
+
+
+def summarize_metrics(file_metrics):
+    """
+    print_summary용 분포 요약 (파일별 처리 시간 / 페이지별 파서 시간 / 표 추출 시간 / 파일별 RSS 증가분)
+    - 해제된 메모리가 OS에 바로 반환되지 않아 파일별 최대 RSS는 앞선 큰 파일의 값을 이어받으므로
+      분포는 증가분으로 내고, 최대 RSS는 실행 전체의 최대값 하나만 낸다.
+    """
+    files = [m for m in file_metrics if m.status == "success"]
+    return {
+        "file_wall": distribution([m.wall("total") for m in files]),
+        "page_fitz": distribution([t for m in files for t in m.page_wall("fitz")]),
+        "page_plumber": distribution([t for m in files for t in m.page_wall("plumber")]),
+        "page_table": distribution([t for m in files for t in m.page_table_wall()]),
+        "peak_rss_mb": max((m.peak_rss_mb for m in files if m.peak_rss_mb is not None), default=None),
+        "rss_delta_mb": distribution([m.rss_delta_mb for m in files if m.rss_delta_mb is not None]),
+        "chunks": sum(m.chunks for m in files),
+        "bytes_written": sum(m.bytes_written for m in files),
+    }
+
+
+def profile_call(output_path, func, *args, top=25, **kwargs):
+    """
+    func를 cProfile로 실행하고 output_path(.prof)와 누적 시간 상위 top개 함수 요약(.txt) 저장
+    - 반환값: func의 반환값
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(output_path)
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(top)
+        output_path.with_suffix(".txt").write_text(report.getvalue(), encoding="utf-8")
@@ -0,0 +1,106 @@
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+
+MANIFEST_NAME = ".conversion_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path, block_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(block_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_json_atomic(path, data):
+    """
+    임시 파일에 쓴 뒤 rename하여 중간에 중단돼도 파일이 깨지지 않도록 저장
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ConversionManifest:
+    """
+    출력 디렉토리에 저장되는 증분 변환 매니페스트
+    - 파일명 -> {파일 내용 해시, 파서 설정, 출력 파일 목록}
+    - 내용 해시와 파서 설정(chunk_size, overlap, unstructured 전략 등)이 모두 같고
+      출력 파일이 남아 있으면 재변환하지 않는다.
+    - 해시 계산 비용을 줄이기 위해 size/mtime이 같으면 저장된 해시를 재사용한다.
+    """
+    def __init__(self, output_dir, config):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_NAME
+        self.config = config
+        self.files = self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return data.get("files", {})
+        except Exception as e:
+            logging.warning(f"[manifest] 매니페스트 로드 실패, 새로 생성합니다: {e}")
+            return {}
+
+    def content_hash(self, pdf_path):
+        stat = pdf_path.stat()
+        entry = self.files.get(pdf_path.name)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["sha256"]
+        return file_sha256(pdf_path)
+
+    def is_up_to_date(self, pdf_path, digest):
+        entry = self.files.get(pdf_path.name)
+        if not entry or entry.get("sha256") != digest or entry.get("config") != self.config:
+            return False
+        return all((self.output_dir / name).exists() for name in entry.get("outputs", []))
+
+    def record(self, pdf_path, digest, outputs):
+        stat = pdf_path.stat()
+        self.files[pdf_path.name] = {
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "config": self.config,
+            "outputs": [Path(o).name for o in outputs],
+        }
+
+    def forget(self, name):
+        self.files.pop(name, None)
+
+    def remove_stale(self, current_names):
+        """
+        입력 디렉토리에서 사라진 파일의 매니페스트 항목과 출력 파일 삭제
+        - 반환값: 삭제된 입력 파일명 리스트
+        """
+        removed = []
+        for name in sorted(set(self.files) - set(current_names)):
+            for output_name in self.files[name].get("outputs", []):
+                output_path = self.output_dir / output_name
+                try:
+                    output_path.unlink()
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logging.warning(f"[manifest] 출력 파일 삭제 실패 {output_path}: {e}")
+            del self.files[name]
+            removed.append(name)
+        return removed
+
+    def save(self):
+        write_json_atomic(self.path, {"version": MANIFEST_VERSION, "files": self.files})
@@ -1,3 +1,6 @@
+# cascade 모드에서 fitz 결과만으로 충분하다고 보는 최소 점수
+DEFAULT_CASCADE_MIN_SCORE = 200
+
 def score(text, table_md):
     return len(text.strip()) + table_md.count("|") * 10
 
@@ -7,9 +10,27 @@ def is_valid(text, table_md):
         return False
     return bool(text and len(text.strip()) > 20) or (table_md and table_md.count("|") > 3)
 
-def merge_parsers(fitz_result, plumber_result):
+def select_parser(fitz_result, plumber_result):
+    """
+    두 파서 결과 중 점수가 높은 쪽을 선택
+    - 반환값: (파서 이름, text, table_md), 유효하지 않으면 (None, None, None)
+    """
     candidates = [("fitz", *fitz_result), ("plumber", *plumber_result)]
     best = max(candidates, key=lambda x: score(x[1], x[2]))
     if is_valid(best[1], best[2]):
-        return best[1], best[2]
-    return None, None
\ No newline at end of file
+        return best
+    return None, None, None
+
+def merge_parsers(fitz_result, plumber_result):
+    _, text, table_md = select_parser(fitz_result, plumber_result)
+    return text, table_md
+
+def cascade_parsers(fitz_result, plumber_parse, min_score=DEFAULT_CASCADE_MIN_SCORE):
+    """
+    fitz 결과가 유효하고 min_score 이상이면 pdfplumber를 호출하지 않는 cascade 병합
+    - plumber_parse: 필요할 때만 호출되는 pdfplumber 파싱 함수
+    - 반환값: (파서 이름, text, table_md, pdfplumber 호출 여부)
+    """
+    if is_valid(*fitz_result) and score(*fitz_result) >= min_score:
+        return ("fitz", *fitz_result, False)
+    return (*select_parser(fitz_result, plumber_parse()), True)
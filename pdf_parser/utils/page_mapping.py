@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 def make_page_text_map(blocks, page_size=1000):
     page_text_map = {}
     buffer = ""
@@ -19,4 +21,36 @@ def guess_page_range(chunk_text, page_text_map):
             start = p
         if chunk_text[-30:] in t:
             end = p
-    return start, end
\ No newline at end of file
+    return start, end
+
+def build_page_offsets(blocks, separator="\n\n"):
+    """
+    separator.join(블록 content)로 만든 전체 텍스트 기준 블록별 시작 오프셋과 원본 페이지 번호
+    - 페이지 정보가 없는 블록은 직전 블록의 페이지를 따른다.
+    - 반환값: (starts, pages) - 청크 오프셋을 bisect로 페이지에 대응시키는 데 사용
+    """
+    starts, pages = [], []
+    offset = 0
+    last_page = None
+    for b in blocks:
+        page = b.get("page") or last_page
+        starts.append(offset)
+        pages.append(page)
+        last_page = page
+        offset += len(b["content"]) + len(separator)
+    return starts, pages
+
+def page_range_for_span(page_offsets, start, end):
+    """
+    전체 텍스트의 [start, end) 구간이 걸친 원본 페이지 범위 (page_start, page_end)
+    - 블록 시작 오프셋 배열에 대한 bisect로 구간의 첫/마지막 블록을 찾는다.
+    """
+    starts, pages = page_offsets
+    if not starts:
+        return None, None
+    first = max(bisect_right(starts, start) - 1, 0)
+    last = max(bisect_right(starts, max(start, end - 1)) - 1, first)
+    span_pages = [p for p in pages[first:last + 1] if p is not None]
+    if not span_pages:
+        return None, None
+    return min(span_pages), max(span_pages)
@@ -0,0 +1,67 @@
+import logging
+
+# 페이지 분류
+BLANK = "blank"                      # 텍스트/이미지/선이 거의 없는 빈 페이지 (분석 생략)
+SCANNED = "scanned"                  # 텍스트 레이어 없이 이미지로 덮인 스캔 페이지 (OCR 대기열로 분리)
+TEXT_ONLY = "text"                   # 텍스트만 있는 페이지 (표 추출 생략)
+TABLE_CANDIDATE = "table_candidate"  # 괘선/사각형이 있어 표가 있을 수 있는 페이지
+
+# 분류 기준값
+MIN_TEXT_CHARS = 20          # 이보다 짧으면 텍스트 레이어가 없는 것으로 본다
+SCANNED_IMAGE_COVERAGE = 0.5  # 페이지 면적 대비 이미지 비율이 이 이상이면 스캔 페이지
+BLANK_IMAGE_COVERAGE = 0.05
+MIN_TABLE_RULINGS = 2        # 표 후보로 볼 최소 괘선(변) 수 (테두리 표는 사각형 하나만으로도 4)
+
+# drawing 항목별 괘선(변) 수: 선분/곡선 1개, 사각형/사변형 4개
+_ITEM_EDGES = {"l": 1, "c": 1, "re": 4, "qu": 4}
+
+
+def _image_coverage(page):
+    page_area = abs(page.rect) or 1.0
+    covered = 0.0
+    for info in page.get_image_info():
+        bbox = info.get("bbox")
+        if bbox:
+            x0, y0, x1, y1 = bbox
+            covered += max(0.0, x1 - x0) * max(0.0, y1 - y0)
+    return min(covered / page_area, 1.0)
+
+
+def _ruling_count(page):
+    """
+    표 추출 "lines" 전략이 괘선으로 쓰는 변의 개수 (fitz C 레벨 drawing 목록 사용)
+    - 사각형(re)과 사변형(qu)은 변 4개, 선분(l)과 곡선(c)은 1개로 센다.
+      (사변형 4개로 그린 표나 사각형 셀 두 개짜리 표도 놓치지 않도록)
+    """
+    count = 0
+    for path in page.get_cdrawings():
+        for item in path.get("items", ()):
+            count += _ITEM_EDGES.get(item[0], 1)
+    return count
+
+
+def triage_page(page):
+    """
+    fitz 페이지를 저비용 신호(텍스트 길이, 선/사각형 수, 이미지 면적)로 분류
+    - 반환값: (분류, 신호 dict)
+    - fitz의 find_tables와 pdfplumber의 extract_table은 기본적으로 괘선(lines) 전략을 쓰므로
+      괘선이 MIN_TABLE_RULINGS개 미만(셀을 만들 수 없음)인 페이지에서는 표 추출을 생략해도 결과가 달라지지 않는다.
+      (benchmarks/bench_triage.py가 여러 방식으로 그린 표에서 pdfplumber 결과와 대조한다)
+    """
+    try:
+        text_chars = len(page.get_text("text").strip())
+        rulings = _ruling_count(page)
+        image_coverage = _image_coverage(page)
+    except Exception as e:
+        logging.warning(f"[page triage 실패] {e}")
+        return TABLE_CANDIDATE, {}
+
+    signals = {"text_chars": text_chars, "rulings": rulings, "image_coverage": round(image_coverage, 3)}
+    if text_chars < MIN_TEXT_CHARS:
+        if image_coverage >= SCANNED_IMAGE_COVERAGE:
+            return SCANNED, signals
+        if text_chars == 0 and image_coverage < BLANK_IMAGE_COVERAGE and rulings < MIN_TABLE_RULINGS:
+            return BLANK, signals
+    if rulings >= MIN_TABLE_RULINGS:
+        return TABLE_CANDIDATE, signals
+    return TEXT_ONLY, signals
@@ -1,35 +1,276 @@
 import argparse
 import os
-import shutil
+import time
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from layout_parser import process_pdfs_with_mineru
-from md_processor.pipeline import process_directory
-
-def backup_original_files(output_dir):
-    """MinerU 원본 .md 파일들을 백업"""
-    backup_dir = os.path.join(output_dir, "_original_mineru")
-    os.makedirs(backup_dir, exist_ok=True)
-    
-    backed_up_count = 0
-    # MinerU 출력 구조: /data/filename/auto/filename.md
-    for item in os.listdir(output_dir):
-        item_path = os.path.join(output_dir, item)
-        if os.path.isdir(item_path) and not item.startswith('_'):
-            auto_dir = os.path.join(item_path, 'auto')
-            if os.path.exists(auto_dir):
-                for file in os.listdir(auto_dir):
-                    if file.endswith('.md'):
-                        src_path = os.path.join(auto_dir, file)
-                        dst_path = os.path.join(backup_dir, file)
-                        try:
-                            shutil.copy2(src_path, dst_path)
-                            backed_up_count += 1
-                        except Exception as e:
-                            print(f"⚠️ 백업 실패 {file}: {e}")
-    
-    if backed_up_count > 0:
-        print(f"📋 원본 Markdown 파일 {backed_up_count}개 백업 완료")
-    
-    return backup_dir
+from layout_parser.mineru_scheduler import DEFAULT_BATCH_SIZE, DEFAULT_RETRIES, DEFAULT_TIMEOUT_PER_PDF, find_markdown
+from md_processor.pipeline import process_directory, process_md_file
+from md_processor.backup_store import BackupStore
+
+# MinerU가 끝낸 문서를 정제 단계로 넘기는 큐 크기 (가득 차면 새 mineru 실행을 미룸, schedule_mineru 참고)
+DEFAULT_QUEUE_SIZE = 8
+# 정제 프로세스 풀 시작 방식: 소비자 스레드가 도는 중에 풀을 다시 만들므로 fork 대신 spawn
+# (다른 스레드가 잡고 있던 잠금을 물려받은 자식 프로세스가 멈추는 것을 막는다)
+POOL_CONTEXT = multiprocessing.get_context("spawn")
+# 큐가 가득 찼을 때 소비자 스레드가 살아 있는지 확인하는 주기 (초)
+QUEUE_POLL_SECONDS = 1.0
+
+def backup_markdown(md_path, store):
+    """MinerU 원본 .md 파일 하나를 백업 저장소에 저장, 성공 여부 반환"""
+    try:
+        store.put(md_path)
+        return True
+    except Exception as e:
+        print(f"⚠️ 백업 실패 {os.path.basename(md_path)}: {e}")
+        return False
+
+def print_backup_summary(store):
+    stats = store.stats
+    if stats["stored"] or stats["unchanged"]:
+        print(f"📋 원본 Markdown 백업: 새로 저장 {stats['stored']}개 (reflink {stats['reflink']} / 복사 {stats['copy']}), "
+              f"이미 저장됨 {stats['unchanged']}개")
+
+def backup_original_files(output_dir, md_paths=None):
+    """
+    MinerU 원본 .md 파일들을 백업 저장소(_original_mineru)에 저장
+    - md_paths를 주면 그 파일만, 없으면 출력 디렉토리의 <이름>/auto/*.md 전체
+    - 내용이 이미 저장된 파일은 다시 쓰지 않는다. (md_processor.backup_store 참고)
+    """
+    store = BackupStore(output_dir)
+    if md_paths is None:
+        md_paths = []
+        # MinerU 출력 구조: /data/filename/auto/filename.md
+        for item in os.listdir(output_dir):
+            item_path = os.path.join(output_dir, item)
+            if os.path.isdir(item_path) and not item.startswith('_'):
+                auto_dir = os.path.join(item_path, 'auto')
+                if os.path.exists(auto_dir):
+                    md_paths += [os.path.join(auto_dir, file) for file in os.listdir(auto_dir) if file.endswith('.md')]
+
+    for md_path in md_paths:
+        backup_markdown(md_path, store)
+    store.save()
+    print_backup_summary(store)
+    return store.root
+
+class MarkdownCleaningStage:
+    """
+    MinerU가 문서 하나를 끝낼 때마다 그 Markdown을 백업하고 정제하는 소비자 단계
+    - submit()은 크기가 정해진 큐에 넣으며, 큐가 가득 차면 정제가 따라올 때까지 막힌다 (생산자 쪽 배압)
+    - workers > 1이면 정제(CPU 작업)를 프로세스 풀에서 병렬로 실행
+    - 문서 하나의 정제가 실패하거나 정제 프로세스가 죽어도(OOM, segfault) 그 문서만 실패로 기록하고 계속한다.
+    """
+
+    def __init__(self, output_dir, queue_size=DEFAULT_QUEUE_SIZE, workers=1):
+        self.store = BackupStore(output_dir)
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=POOL_CONTEXT) if workers > 1 else None
+        self.pool_restarts = 0
+        self.started = time.perf_counter()
+        self.first_done = None
+        self.backed_up = 0
+        self.cleaned = []
+        self.failed = []
+        self.lock = threading.Lock()
+        self.threads = [threading.Thread(target=self._consume, daemon=True) for _ in range(max(1, workers))]
+        for thread in self.threads:
+            thread.start()
+
+    def _put(self, item):
+        """
+        큐에 넣되, 가득 찬 동안 소비자 스레드가 모두 종료됐으면 기다리지 않고 False
+        """
+        while True:
+            try:
+                self.queue.put(item, timeout=QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                if not any(thread.is_alive() for thread in self.threads):
+                    return False
+
+    def submit(self, pdf_file, md_path):
+        """schedule_mineru의 on_complete 콜백"""
+        if not self._put(md_path):
+            print(f"❌ 정제 단계가 중단되어 정제하지 못함: {os.path.basename(md_path)}")
+            with self.lock:
+                self.failed.append(md_path)
+
+    def _restart_executor(self, broken):
+        """깨진 프로세스 풀을 새로 만듦 (여러 소비자 스레드가 동시에 발견해도 한 번만)"""
+        with self.lock:
+            if self.executor is not broken:
+                return  # 다른 소비자 스레드가 이미 교체함
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool_restarts += 1
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=POOL_CONTEXT)
+
+    def _clean(self, md_path):
+        """
+        인플레이스 정제 (백업은 정제 전 원본으로 남는다), 성공 여부 반환
+        - 풀이 깨지면 같은 풀에서 실행 중이던 다른 문서도 함께 실패하므로, 풀을 새로 만들고
+          이 문서는 혼자 쓰는 프로세스에서 한 번 더 시도한다. (원인 문서만 실패로 남고 공용 풀은 다시 깨지지 않음)
+        """
+        executor = self.executor
+        if executor is None:
+            return process_md_file(input_path=md_path, output_path=md_path)
+        try:
+            return executor.submit(process_md_file, md_path, md_path).result()
+        except BrokenProcessPool:
+            self._restart_executor(executor)
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=POOL_CONTEXT) as isolated:
+                return isolated.submit(process_md_file, md_path, md_path).result()
+        except BrokenProcessPool:
+            print(f"❌ 정제 프로세스 비정상 종료: {os.path.basename(md_path)}")
+            return False
+
+    def _consume(self):
+        while True:
+            md_path = self.queue.get()
+            if md_path is None:
+                return
+            backed_up = ok = False
+            try:
+                backed_up = backup_markdown(md_path, self.store)
+                ok = self._clean(md_path)
+            except Exception as e:
+                print(f"❌ 정제 오류: {md_path} → {e}")
+            finally:
+                # 스레드가 예외로 끝나더라도 처리 중이던 문서는 실패로 남긴다
+                with self.lock:
+                    self.backed_up += backed_up
+                    (self.cleaned if ok else self.failed).append(md_path)
+                    if ok and self.first_done is None:
+                        self.first_done = time.perf_counter() - self.started
+
+    def close(self):
+        """남은 문서를 모두 정제할 때까지 대기"""
+        for _ in self.threads:
+            if not self._put(None):
+                break
+        for thread in self.threads:
+            thread.join()
+        # 소비자가 모두 종료된 뒤 큐에 남은 문서는 정제하지 못한 것으로 기록
+        while True:
+            try:
+                md_path = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if md_path is not None:
+                self.failed.append(md_path)
+        if self.executor is not None:
+            self.executor.shutdown()
+        self.store.save()
+
+
+def run_pipelined(args):
+    """MinerU 변환(생산자)과 백업·정제(소비자)를 문서 단위로 겹쳐 실행"""
+    print("📄 PDF → Markdown 변환 (MinerU) + 문서별 백업·정제를 함께 진행")
+    print("-" * 50)
+    stage = MarkdownCleaningStage(args.output, queue_size=args.queue_size, workers=args.clean_workers)
+    try:
+        pdf_results = process_pdfs_with_mineru(
+            input_dir=args.input,
+            output_dir=args.output,
+            vram_size=args.vram_size,
+            lang=args.lang,
+            batch_size=args.batch_size,
+            max_jobs=args.max_jobs,
+            job_vram=args.job_vram,
+            timeout_per_pdf=args.timeout_per_pdf,
+            retries=args.retries,
+            on_complete=stage.submit,
+            # 첫 묶음은 PDF 하나만: 첫 문서가 묶음 전체를 기다리지 않고 바로 정제로 넘어감
+            first_batch_size=1
+        )
+    finally:
+        stage.close()
+
+    if pdf_results["total"] == 0:
+        print("❌ 처리할 PDF 파일이 없습니다.")
+        return
+    if len(pdf_results["success"]) == 0:
+        print("❌ 성공적으로 변환된 PDF 파일이 없습니다.")
+        return
+
+    print_backup_summary(stage.store)
+    print("✅ 파이프라인 완료!")
+    print(f"📂 출력: {args.output}")
+    if stage.first_done is not None:
+        print(f"⏱ 첫 문서 완료까지 {stage.first_done:.1f}초, 전체 {time.perf_counter() - stage.started:.1f}초")
+
+    # 간단한 결과 요약
+    print(f"\n📊 결과: {len(pdf_results['success'])}/{pdf_results['total']} 성공")
+    if pdf_results['failed']:
+        print("❌ 실패:")
+        for failed_file in pdf_results['failed']:
+            print(f"  - {os.path.basename(failed_file)}")
+    if stage.failed:
+        print("❌ 정제 실패:")
+        for md_path in stage.failed:
+            print(f"  - {os.path.basename(md_path)}")
+
+
+def run_barrier(args):
+    """
+    기존 방식: 모든 MinerU 변환이 끝난 뒤 백업, 그 다음 출력 디렉토리 전체를 정제 (--no-pipeline)
+    """
+    print("📄 1단계: PDF를 Markdown으로 변환 (MinerU)")
+    print("-" * 50)
+
+    # 1단계: PDF -> Markdown (MinerU)
+    pdf_results = process_pdfs_with_mineru(
+        input_dir=args.input,
+        output_dir=args.output,
+        vram_size=args.vram_size,
+        lang=args.lang,
+        batch_size=args.batch_size,
+        max_jobs=args.max_jobs,
+        job_vram=args.job_vram,
+        timeout_per_pdf=args.timeout_per_pdf,
+        retries=args.retries
+    )
+
+    if pdf_results["total"] == 0:
+        print("❌ 처리할 PDF 파일이 없습니다.")
+        return
+
+    if len(pdf_results["success"]) == 0:
+        print("❌ 성공적으로 변환된 PDF 파일이 없습니다.")
+        return
+
+    print(f"✅ PDF 변환 완료: {len(pdf_results['success'])}/{pdf_results['total']}")
+
+    # 원본 파일 백업
+    print("\n📋 원본 파일 백업 중...")
+    # 이번 실행에서 만들어진 Markdown만 백업 (이전 실행에서 이미 정제된 파일을 원본으로 저장하지 않도록)
+    backup_original_files(args.output, [md_path for pdf_file in pdf_results["success"]
+                                        if (md_path := find_markdown(args.output, pdf_file))])
+
+    print("\n🧹 2단계: Markdown 파일 정제")
+    print("-" * 50)
+
+    # 2단계: Markdown 정제 - 인플레이스 처리
+    process_directory(
+        input_dir=args.output,
+        output_dir=args.output,
+        workers=args.clean_workers
+    )
+
+    print("✅ 파이프라인 완료!")
+    print(f"📂 출력: {args.output}")
+
+    # 간단한 결과 요약
+    print(f"\n📊 결과: {len(pdf_results['success'])}/{pdf_results['total']} 성공")
+    if pdf_results['failed']:
+        print("❌ 실패:")
+        for failed_file in pdf_results['failed']:
+            print(f"  - {os.path.basename(failed_file)}")
 
 def main():
     parser = argparse.ArgumentParser(description="PDF to Markdown 파이프라인")
@@ -37,6 +278,22 @@ def main():
     parser.add_argument('-o', '--output', required=True, help='출력 디렉토리')
     parser.add_argument('--vram-size', default="16", help='MinerU 가상 RAM 크기 (기본값: 16GB)')
     parser.add_argument('--lang', default="korean", help='언어 설정 (기본값: korean)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'mineru 실행 한 번에 넣는 PDF 수 (기본값: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--max-jobs', type=int, default=None,
+                        help='mineru 동시 실행 수 (기본값: vram-size / job-vram, CPU 수로 제한)')
+    parser.add_argument('--job-vram', type=float, default=None,
+                        help='mineru 프로세스당 가상 VRAM(GB) (기본값: min(vram-size, 8))')
+    parser.add_argument('--timeout-per-pdf', type=int, default=DEFAULT_TIMEOUT_PER_PDF,
+                        help=f'PDF 한 개당 제한 시간(초), 0이면 제한 없음 (기본값: {DEFAULT_TIMEOUT_PER_PDF})')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help=f'실패한 PDF 재시도 횟수 (기본값: {DEFAULT_RETRIES})')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f'정제 대기 문서 수 상한, 가득 차면 새 mineru 실행을 미룸 (실행 중인 것은 계속) (기본값: {DEFAULT_QUEUE_SIZE})')
+    parser.add_argument('--clean-workers', type=int, default=1,
+                        help='Markdown 정제 병렬 프로세스 수 (기본값: 1)')
+    parser.add_argument('--no-pipeline', action='store_true',
+                        help='모든 MinerU 변환이 끝난 뒤 한꺼번에 백업·정제 (기존 방식)')
 
     args = parser.parse_args()
 
@@ -49,50 +306,10 @@ def main():
     os.makedirs(args.output, exist_ok=True)
 
     try:
-        print("📄 1단계: PDF를 Markdown으로 변환 (MinerU)")
-        print("-" * 50)
-        
-        # 1단계: PDF -> Markdown (MinerU)
-        pdf_results = process_pdfs_with_mineru(
-            input_dir=args.input,
-            output_dir=args.output,
-            vram_size=args.vram_size,
-            lang=args.lang
-        )
-        
-        if pdf_results["total"] == 0:
-            print("❌ 처리할 PDF 파일이 없습니다.")
-            return
-            
-        if len(pdf_results["success"]) == 0:
-            print("❌ 성공적으로 변환된 PDF 파일이 없습니다.")
-            return
-
-        print(f"✅ PDF 변환 완료: {len(pdf_results['success'])}/{pdf_results['total']}")
-
-        # 원본 파일 백업
-        print("\n📋 원본 파일 백업 중...")
-        backup_original_files(args.output)
-
-        print("\n🧹 2단계: Markdown 파일 정제")
-        print("-" * 50)
-        
-        # 2단계: Markdown 정제 - 인플레이스 처리
-        process_directory(
-            input_dir=args.output,
-            output_dir=args.output
-        )
-        
-        print("✅ 파이프라인 완료!")
-        print(f"📂 출력: {args.output}")
-        
-        # 간단한 결과 요약
-        print(f"\n📊 결과: {len(pdf_results['success'])}/{pdf_results['total']} 성공")
-        if pdf_results['failed']:
-            print("❌ 실패:")
-            for failed_file in pdf_results['failed']:
-                print(f"  - {os.path.basename(failed_file)}")
-
+        if args.no_pipeline:
+            run_barrier(args)
+        else:
+            run_pipelined(args)
     except Exception as e:
         print(f"❌ 오류: {e}")
         raise
@@ -8,57 +8,59 @@ import olefile
 from datetime import datetime
 import subprocess
 import sys
-from langchain_teddynote.document_loaders import HWPLoader
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pdf_parser.utils.text_cleaning import normalize_text
+from hwp_parser import extract_hwp_text
+
+
+def _convert_file_worker(file_path_str, input_dir, output_dir, logs_dir):
+    """
+    프로세스 풀 워커: 파일 한 개를 변환하고 (성공 로그, 실패 로그) 중 하나를 반환
+    """
+    converter = ImprovedDocumentConverter(input_dir, output_dir, logs_dir)
+    return converter.convert_file(Path(file_path_str))
+
 
 class ImprovedDocumentConverter:
-    def __init__(self, input_dir, output_dir, logs_dir):
+    def __init__(self, input_dir, output_dir, logs_dir, workers=1):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.logs_dir = Path(logs_dir)
+        # 파일 단위 병렬 처리 프로세스 수 (1이면 순차 처리)
+        self.workers = max(1, int(workers or 1))
         self.success_count = 0
         self.failure_count = 0
         self.success_log = []
         self.failure_log = []
         
     def clean_text(self, text, filename):
-        """텍스트 정리 및 전처리"""
-        if not text:
-            return ""
-        
-        # 기본 정리
-        text = text.strip()
-        
-        # 불필요한 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 특수 문자 정리 (한글, 영문, 숫자, 기본 문장부호만 유지)
-        text = re.sub(r'[^\w\s가-힣.,!?;;:()\[\]{}"\'-]', '', text)
-        
-        # 연속된 마침표 제거
-        text = re.sub(r'\.{2,}', '.', text)
-        
-        # 빈 줄 제거
-        text = re.sub(r'\n\s*\n', '\n', text)
-        
-        return text.strip()
+        """텍스트 정리 및 전처리 (공백 정리, 특수 문자 제거, 연속 마침표 정리)"""
+        return normalize_text(text, remove_page_numbers=False)
     
     def extract_pdf_text(self, pdf_path):
         """PDF에서 텍스트 추출"""
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            return text
+            with fitz.open(pdf_path) as doc:
+                return "".join(page.get_text() for page in doc)
         except Exception as e:
             print(f"PDF 추출 오류 ({pdf_path}): {e}")
             return ""
     
 
     def extract_hwp_text_improved(self, hwp_path):
-        """HWPLoader를 사용한 안정적인 HWP 텍스트 추출"""
+        """
+        HWP 텍스트 추출
+        - hwp_parser(olefile로 BodyText 섹션을 스트리밍)로 먼저 추출하고,
+          읽지 못하는 문서(HWPError 등)만 HWPLoader로 다시 시도한다.
+        """
+        try:
+            return extract_hwp_text(hwp_path).strip()
+        except Exception as e:
+            print(f"⚠️ hwp_parser 추출 실패, HWPLoader로 재시도 ({hwp_path}): {e}")
         try:
+            # langchain_teddynote는 import 비용이 커서 HWPLoader가 필요할 때만 불러온다
+            from langchain_teddynote.document_loaders import HWPLoader
             docs = HWPLoader(hwp_path).load()
             if docs:
                 return docs[0].page_content.strip()
@@ -76,55 +78,96 @@ class ImprovedDocumentConverter:
         hwp_files = list(self.input_dir.glob("*.hwp"))
         return pdf_files + hwp_files
     
-    def convert_documents(self):
-        """문서 변환 실행"""
-        files = self.find_document_files()
-        print(f"📄 변환할 파일 개수: {len(files)}개")
+    def convert_file(self, file_path):
+        """
+        파일 한 개를 변환해 output_dir에 저장
+        - 반환값: (성공 로그, None) / (None, 실패 로그) / 지원하지 않는 형식이면 (None, None)
+        """
+        print(f"🔄 처리 중: {file_path.name}")
         
-        for file_path in files:
-            print(f"🔄 처리 중: {file_path.name}")
+        try:
+            # 텍스트 추출
+            if file_path.suffix.lower() == '.pdf':
+                text = self.extract_pdf_text(str(file_path))
+            elif file_path.suffix.lower() == '.hwp':
+                # HWP 파일은 개선된 방법 사용
+                text = self.extract_hwp_text_improved(str(file_path))
+            else:
+                return None, None
             
-            try:
-                # 텍스트 추출
-                if file_path.suffix.lower() == '.pdf':
-                    text = self.extract_pdf_text(str(file_path))
-                elif file_path.suffix.lower() == '.hwp':
-                    # HWP 파일은 개선된 방법 사용
-                    text = self.extract_hwp_text_improved(str(file_path))
-                else:
-                    continue
-                
-                # 텍스트 정리
-                cleaned_text = self.clean_text(text, file_path.name)
+            # 텍스트 정리
+            cleaned_text = self.clean_text(text, file_path.name)
+            
+            if cleaned_text and len(cleaned_text) > 100:  # 최소 100자 이상
+                # 결과 저장
+                output_file = self.output_dir / f"{file_path.stem}.txt"
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(cleaned_text)
                 
-                if cleaned_text and len(cleaned_text) > 100:  # 최소 100자 이상
-                    # 결과 저장
-                    output_file = self.output_dir / f"{file_path.stem}.txt"
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(cleaned_text)
-                    
-                    # 성공 로그
-                    self.success_log.append({
-                        'filename': file_path.name,
-                        'output_file': output_file.name,
-                        'text_length': len(cleaned_text),
-                        'original_length': len(text),
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    self.success_count += 1
-                    print(f"✅ 성공: {file_path.name} ({len(cleaned_text)}자)")
-                else:
-                    raise Exception(f"추출된 텍스트가 너무 짧음 ({len(cleaned_text)}자)")
-                    
-            except Exception as e:
-                # 실패 로그
-                self.failure_log.append({
+                print(f"✅ 성공: {file_path.name} ({len(cleaned_text)}자)")
+                # 성공 로그
+                return {
                     'filename': file_path.name,
-                    'error': str(e),
+                    'output_file': output_file.name,
+                    'text_length': len(cleaned_text),
+                    'original_length': len(text),
                     'timestamp': datetime.now().isoformat()
-                })
+                }, None
+            else:
+                raise Exception(f"추출된 텍스트가 너무 짧음 ({len(cleaned_text)}자)")
+                
+        except Exception as e:
+            print(f"❌ 실패: {file_path.name} - {e}")
+            # 실패 로그
+            return None, self._failure_entry(file_path, e)
+    
+    def _failure_entry(self, file_path, error):
+        return {
+            'filename': file_path.name,
+            'error': str(error),
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def convert_documents(self):
+        """
+        문서 변환 실행
+        - workers > 1이면 파일 단위로 프로세스 풀에서 병렬 처리 (HWPLoader가 느린 HWP 파일 위주)
+        - 결과는 입력 파일 순서대로 모으므로 save_results의 CSV/JSON 내용은 순차 처리와 같다.
+        """
+        files = self.find_document_files()
+        print(f"📄 변환할 파일 개수: {len(files)}개")
+        
+        if self.workers > 1 and len(files) > 1:
+            results = self._convert_files_parallel(files)
+        else:
+            results = (self.convert_file(file_path) for file_path in files)
+        
+        for success, failure in results:
+            if success is not None:
+                self.success_log.append(success)
+                self.success_count += 1
+            elif failure is not None:
+                self.failure_log.append(failure)
                 self.failure_count += 1
-                print(f"❌ 실패: {file_path.name} - {e}")
+    
+    def _convert_files_parallel(self, files):
+        """
+        프로세스 풀로 변환하고 (성공 로그, 실패 로그)를 입력 순서대로 반환
+        - 워커 프로세스가 비정상 종료되는 등 결과를 받지 못한 파일은 실패로 기록
+        """
+        print(f"⚡ 병렬 처리: workers {self.workers}")
+        results = []
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(files))) as executor:
+            futures = [executor.submit(_convert_file_worker, str(file_path), str(self.input_dir),
+                                       str(self.output_dir), str(self.logs_dir))
+                       for file_path in files]
+            for file_path, future in zip(files, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"❌ 실패: {file_path.name} - {e}")
+                    results.append((None, self._failure_entry(file_path, e)))
+        return results
     
     def save_results(self):
         """결과 저장"""
@@ -179,15 +222,22 @@ class ImprovedDocumentConverter:
         self.print_summary()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF/HWP 텍스트 변환")
+    parser.add_argument('-i', '--input', default="/home/shared_rag", help="PDF/HWP 파일이 있는 디렉토리 경로")
+    parser.add_argument('-o', '--output', default="/home/result_rag", help="텍스트 파일 저장 경로")
+    parser.add_argument('-l', '--logs', default="/home/log_rag", help="변환 로그 저장 경로")
+    parser.add_argument('--workers', type=int, default=1, help="파일 단위 병렬 처리 프로세스 수 (기본값: 1, 순차 처리)")
+    args = parser.parse_args()
+    
     # 경로 설정
-    input_path = "/home/shared_rag"
-    output_path = "/home/result_rag"
-    logs_path = "/home/log_rag"
+    input_path = args.input
+    output_path = args.output
+    logs_path = args.logs
     
     # 디렉토리 생성
     os.makedirs(output_path, exist_ok=True)
     os.makedirs(logs_path, exist_ok=True)
     
     # 변환기 초기화 및 실행
-    converter = ImprovedDocumentConverter(input_path, output_path, logs_path)
+    converter = ImprovedDocumentConverter(input_path, output_path, logs_path, workers=args.workers)
     converter.run_conversion() 
\ No newline at end of file